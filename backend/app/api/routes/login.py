@@ -7,10 +7,11 @@ from fastapi.security import OAuth2PasswordRequestForm
 from app import crud
 from app.api.deps import CurrentUser, SessionDep
 from app.core import security
+from app.core.bulkhead import AUTH, bulkhead_route
 from app.core.config import settings
 from app.models import Token, UserPublic
 
-router = APIRouter(tags=["login"])
+router = APIRouter(tags=["login"], route_class=bulkhead_route(AUTH))
 
 
 @router.post("/login/access-token")
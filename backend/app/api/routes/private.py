@@ -4,13 +4,16 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 
 from app.api.deps import SessionDep
+from app.core.bulkhead import AUTH, CRUD, bulkhead, bulkhead_route
 from app.core.security import get_password_hash
 from app.models import (
     User,
     UserPublic,
 )
 
-router = APIRouter(tags=["private"], prefix="/private")
+router = APIRouter(
+    tags=["private"], prefix="/private", route_class=bulkhead_route(CRUD)
+)
 
 
 class PrivateUserCreate(BaseModel):
@@ -21,6 +24,7 @@ class PrivateUserCreate(BaseModel):
 
 
 @router.post("/users/", response_model=UserPublic)
+@bulkhead(AUTH)
 def create_user(user_in: PrivateUserCreate, session: SessionDep) -> Any:
     """
     Create a new user.
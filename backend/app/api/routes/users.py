@@ -10,6 +10,7 @@ from app.api.deps import (
     SessionDep,
     get_current_active_superuser,
 )
+from app.core.bulkhead import AUTH, CRUD, bulkhead, bulkhead_route
 from app.core.security import get_password_hash, verify_password
 from app.models import (
     Item,
@@ -24,7 +25,7 @@ from app.models import (
     UserUpdateMe,
 )
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], route_class=bulkhead_route(CRUD))
 
 
 @router.get(
@@ -49,6 +50,7 @@ def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
 @router.post(
     "/", dependencies=[Depends(get_current_active_superuser)], response_model=UserPublic
 )
+@bulkhead(AUTH)
 def create_user(*, session: SessionDep, user_in: UserCreate) -> Any:
     """
     Create new user.
@@ -87,6 +89,7 @@ def update_user_me(
 
 
 @router.patch("/me/password", response_model=Message)
+@bulkhead(AUTH)
 def update_password_me(
     *, session: SessionDep, body: UpdatePassword, current_user: CurrentUser
 ) -> Any:
@@ -130,6 +133,7 @@ def delete_user_me(session: SessionDep, current_user: CurrentUser) -> Any:
 
 
 @router.post("/signup", response_model=UserPublic)
+@bulkhead(AUTH)
 def register_user(session: SessionDep, user_in: UserRegister) -> Any:
     """
     Create new user without the need to be logged in.
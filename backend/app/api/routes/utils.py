@@ -1,4 +1,10 @@
-from fastapi import APIRouter
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_active_superuser
+from app.core.bulkhead import bulkheads
+from app.models import BulkheadPublic, BulkheadsPublic
 
 router = APIRouter(prefix="/utils", tags=["utils"])
 
@@ -6,3 +12,18 @@ router = APIRouter(prefix="/utils", tags=["utils"])
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
+
+
+@router.get(
+    "/bulkheads/",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=BulkheadsPublic,
+)
+async def read_bulkheads() -> BulkheadsPublic:
+    """Threads, queue depth and rejections per route class."""
+    return BulkheadsPublic(
+        data=[
+            BulkheadPublic(name=name, **asdict(pool.snapshot()))
+            for name, pool in bulkheads.items()
+        ]
+    )
@@ -1,15 +1,165 @@
-from fastapi import APIRouter, Depends, Request
+import asyncio
+import json
+import logging
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import aclosing
+from dataclasses import asdict
+from typing import Any, TypeVar
 
-from app.video_processor.schemas import ErrorResponse, VideoProcessRequest, VideoProcessResponse
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.datastructures import State
+
+from app.api.deps import get_current_active_superuser
+from app.core.bulkhead import CRUD, VIDEO, bulkhead, bulkhead_route, bulkheads
+from app.core.config import settings
+from app.video_processor.admission import AdmissionController
+from app.video_processor.batch import stream_batch
+from app.video_processor.cancellation import DISCONNECT, CancelToken
+from app.video_processor.exceptions import (
+    ConfigurationError,
+    VideoValidationError,
+    describe_error,
+)
+from app.video_processor.jobs import VideoJobRunner, to_job_data
+from app.video_processor.scheduler import BULK, INTERACTIVE, PriorityScheduler
+from app.video_processor.schemas import (
+    ErrorResponse,
+    VideoAdmissionResponse,
+    VideoAdmissionStats,
+    VideoBatchRequest,
+    VideoJobResponse,
+    VideoPriorityClassStats,
+    VideoProcessRequest,
+    VideoProcessResponse,
+    VideoSchedulerResponse,
+    VideoStylesResponse,
+)
 from app.video_processor.service import VideoProcessingService
+from app.video_processor.styles import StyleCatalog
 
+logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/video", tags=["video"])
+router = APIRouter(prefix="/video", tags=["video"], route_class=bulkhead_route(VIDEO))
+
+# Marks the end of a server-sent event stream; never sent to the client.
+_STREAM_END = "end"
+# How often a running request checks whether its client is still connected.
+_DISCONNECT_POLL_SECONDS = 0.25
+
+T = TypeVar("T")
+
+
+def build_video_service(
+    state: State, priority: str = INTERACTIVE
+) -> VideoProcessingService:
+    return VideoProcessingService(
+        api_client=getattr(state, "getoutvideo_api", None),
+        client_pool=getattr(state, "getoutvideo_client_pool", None),
+        rate_limiter=getattr(state, "video_rate_limiter", None),
+        result_cache=getattr(state, "video_result_cache", None),
+        single_flight=getattr(state, "video_single_flight", None),
+        process_lock=getattr(state, "video_process_lock", None),
+        style_executor=getattr(state, "video_style_executor", None),
+        transcript_cache=getattr(state, "video_transcript_cache", None),
+        language_cache=getattr(state, "video_language_cache", None),
+        transcript_fetcher=getattr(state, "video_transcript_fetcher", None),
+        style_catalog=getattr(state, "video_style_catalog", None),
+        output_sink=getattr(state, "video_output_sink", None),
+        scheduler=getattr(state, "video_scheduler", None),
+        priority=priority,
+    )
 
 
 def get_video_service(request: Request) -> VideoProcessingService:
-    api_client = getattr(request.app.state, "getoutvideo_api", None)
-    return VideoProcessingService(api_client=api_client)
+    return build_video_service(request.app.state)
+
+
+def get_bulk_video_service(request: Request) -> VideoProcessingService:
+    return build_video_service(request.app.state, priority=BULK)
+
+
+def get_video_job_runner(request: Request) -> VideoJobRunner:
+    runner: VideoJobRunner | None = getattr(request.app.state, "video_job_runner", None)
+    if runner is None:
+        raise ConfigurationError("Video job runner is not available.")
+    return runner
+
+
+def get_scheduler(request: Request) -> PriorityScheduler:
+    scheduler: PriorityScheduler | None = getattr(
+        request.app.state, "video_scheduler", None
+    )
+    if scheduler is None:
+        raise ConfigurationError("Video scheduler is not available.")
+    return scheduler
+
+
+def get_video_admission(request: Request) -> AdmissionController:
+    admission: AdmissionController | None = getattr(
+        request.app.state, "video_admission", None
+    )
+    if admission is None:
+        raise ConfigurationError("Video admission control is not available.")
+    return admission
+
+
+def get_style_catalog(request: Request) -> StyleCatalog:
+    catalog: StyleCatalog | None = getattr(
+        request.app.state, "video_style_catalog", None
+    )
+    if catalog is None:
+        raise ConfigurationError("Video style catalog is not available.")
+    return catalog
+
+
+@router.get(
+    "/styles",
+    response_model=VideoStylesResponse,
+    responses={500: {"model": ErrorResponse}},
+)
+@bulkhead(CRUD)
+def list_video_styles(
+    catalog: StyleCatalog = Depends(get_style_catalog),
+) -> VideoStylesResponse:
+    return VideoStylesResponse(data=catalog.styles)
+
+
+@router.get(
+    "/scheduler",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=VideoSchedulerResponse,
+    responses={500: {"model": ErrorResponse}},
+)
+@bulkhead(CRUD)
+def read_video_scheduler(
+    scheduler: PriorityScheduler = Depends(get_scheduler),
+) -> VideoSchedulerResponse:
+    """Queue depth, running work and admission wait per priority class."""
+    return VideoSchedulerResponse(
+        data=[
+            VideoPriorityClassStats(priority=priority, **asdict(stats))
+            for priority, stats in scheduler.snapshot().items()
+        ]
+    )
+
+
+@router.get(
+    "/admission",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=VideoAdmissionResponse,
+    responses={500: {"model": ErrorResponse}},
+)
+@bulkhead(CRUD)
+def read_video_admission(
+    admission: AdmissionController = Depends(get_video_admission),
+) -> VideoAdmissionResponse:
+    """Requests in flight, and admissions and rejections since startup."""
+    return VideoAdmissionResponse(
+        data=VideoAdmissionStats(**asdict(admission.snapshot()))
+    )
 
 
 @router.post(
@@ -21,15 +171,247 @@ def get_video_service(request: Request) -> VideoProcessingService:
         422: {"model": ErrorResponse},
         500: {"model": ErrorResponse},
         502: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
     },
 )
-def process_video(
+async def process_video(
     payload: VideoProcessRequest,
+    request: Request,
+    timings: bool = Query(default=False),
     service: VideoProcessingService = Depends(get_video_service),
+    admission: AdmissionController = Depends(get_video_admission),
 ) -> VideoProcessResponse:
-    data = service.process_video(
-        video_url=payload.video_url,
-        styles=payload.styles,
-        output_language=payload.output_language,
-    )
+    release = admission.admit(INTERACTIVE)
+    try:
+        bulkheads[VIDEO].admit()
+        cancel = CancelToken(timeout=payload.deadline_seconds)
+        data = await _run_until_disconnected(
+            request,
+            cancel,
+            lambda: service.process_video(
+                video_url=payload.video_url,
+                styles=payload.styles,
+                output_language=payload.output_language,
+                cancel=cancel,
+                include_timings=timings,
+            ),
+        )
+    finally:
+        release()
     return VideoProcessResponse(data=data)
+
+
+async def _run_until_disconnected(
+    request: Request, cancel: CancelToken, func: Callable[[], T]
+) -> T:
+    """Run ``func`` in the video bulkhead; cancel ``cancel`` if the client leaves.
+
+    Polling also lets ``cancel`` notice its deadline while ``func`` is blocked
+    in an engine call.
+    """
+    task = asyncio.ensure_future(bulkheads[VIDEO].run_sync(func))
+    try:
+        while True:
+            done, _pending = await asyncio.wait(
+                {task}, timeout=_DISCONNECT_POLL_SECONDS
+            )
+            if done:
+                return task.result()
+            if cancel.reason is None and await request.is_disconnected():
+                cancel.cancel(DISCONNECT)
+    finally:
+        if not task.done():
+            cancel.cancel(DISCONNECT)
+
+
+@router.get(
+    "/process/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
+    },
+)
+async def stream_video_processing(
+    video_url: str = Query(max_length=2048),
+    styles: list[str] | None = Query(default=None),
+    output_language: str = Query(default="English", max_length=64),
+    deadline_seconds: float | None = Query(default=None, gt=0),
+    timings: bool = Query(default=False),
+    service: VideoProcessingService = Depends(get_video_service),
+    admission: AdmissionController = Depends(get_video_admission),
+) -> StreamingResponse:
+    """
+    Process a video and stream progress as server-sent events.
+
+    Emits ``validated``, ``languages`` and one ``style`` event per finished
+    style, then a final ``result`` (the /process response body) or ``error``
+    (the error envelope) event.
+    """
+    payload = VideoProcessRequest(
+        video_url=video_url,
+        styles=styles,
+        output_language=output_language,
+        deadline_seconds=deadline_seconds,
+    )
+    service.validate_request(payload.video_url, payload.styles)
+    return _admitted_stream(
+        admission,
+        INTERACTIVE,
+        lambda: _video_event_stream(service, payload, timings),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _admitted_stream(
+    admission: AdmissionController,
+    priority: str,
+    stream: Callable[[], AsyncGenerator[str, None]],
+    **kwargs: Any,
+) -> StreamingResponse:
+    """Admit a streamed request, counting it in flight until the stream ends.
+
+    The background task releases it too, in case the stream never starts.
+    """
+    release = admission.admit(priority)
+    try:
+        bulkheads[VIDEO].admit()
+    except BaseException:
+        release()
+        raise
+
+    async def released_when_done() -> AsyncIterator[str]:
+        try:
+            async with aclosing(stream()) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+        finally:
+            release()
+
+    return StreamingResponse(
+        released_when_done(), background=BackgroundTask(release), **kwargs
+    )
+
+
+async def _video_event_stream(
+    service: VideoProcessingService,
+    payload: VideoProcessRequest,
+    include_timings: bool = False,
+) -> AsyncGenerator[str, None]:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+    cancel = CancelToken(timeout=payload.deadline_seconds)
+
+    def on_event(name: str, data: dict[str, Any]) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, (name, data))
+
+    def run() -> None:
+        try:
+            data = service.process_video(
+                video_url=payload.video_url,
+                styles=payload.styles,
+                output_language=payload.output_language,
+                on_event=on_event,
+                cancel=cancel,
+                include_timings=include_timings,
+            )
+        except Exception as exc:  # noqa: BLE001 - reported as an error event
+            message, code = describe_error(exc)
+            if code == 500:
+                logger.exception("Streamed video processing failed")
+            on_event("error", {"status": "error", "error": message, "code": code})
+        else:
+            response = VideoProcessResponse(data=data)
+            on_event("result", response.model_dump(mode="json", exclude_none=True))
+        finally:
+            on_event(_STREAM_END, {})
+
+    task = asyncio.ensure_future(bulkheads[VIDEO].run_sync(run))
+    try:
+        while True:
+            name, data = await queue.get()
+            if name == _STREAM_END:
+                break
+            yield f"event: {name}\ndata: {json.dumps(data)}\n\n"
+        await task
+    finally:
+        # The client went away: stop the worker. Styles it already finished
+        # are in the result cache for the next request. The task ends once
+        # the worker thread has returned.
+        if not task.done():
+            cancel.cancel(DISCONNECT)
+            task.cancel()
+
+
+@router.post(
+    "/process/batch",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
+    },
+)
+async def process_video_batch(
+    payload: VideoBatchRequest,
+    service: VideoProcessingService = Depends(get_bulk_video_service),
+    admission: AdmissionController = Depends(get_video_admission),
+) -> StreamingResponse:
+    """
+    Process many videos and stream one NDJSON line per item as it finishes.
+
+    Each line is the /process response body or error envelope plus the
+    item's ``index``. Items for the same video, styles and language are
+    processed once.
+    """
+    if len(payload.items) > settings.VIDEO_BATCH_MAX_ITEMS:
+        raise VideoValidationError(
+            f"Batch must contain at most {settings.VIDEO_BATCH_MAX_ITEMS} items."
+        )
+    return _admitted_stream(
+        admission,
+        BULK,
+        lambda: stream_batch(service, payload.items, settings.VIDEO_BATCH_CONCURRENCY),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post(
+    "/jobs",
+    status_code=202,
+    response_model=VideoJobResponse,
+    response_model_exclude_none=True,
+    responses={
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+)
+def create_video_job(
+    payload: VideoProcessRequest,
+    service: VideoProcessingService = Depends(get_video_service),
+    runner: VideoJobRunner = Depends(get_video_job_runner),
+) -> VideoJobResponse:
+    service.validate_request(payload.video_url, payload.styles)
+    job = runner.submit(payload)
+    return VideoJobResponse(data=to_job_data(job))
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=VideoJobResponse,
+    response_model_exclude_none=True,
+    responses={
+        404: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+)
+@bulkhead(CRUD)
+def read_video_job(
+    job_id: uuid.UUID,
+    runner: VideoJobRunner = Depends(get_video_job_runner),
+) -> VideoJobResponse:
+    return VideoJobResponse(data=to_job_data(runner.get(job_id)))
@@ -0,0 +1,150 @@
+import inspect
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import anyio
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.config import settings
+
+VIDEO = "video"
+AUTH = "auth"
+CRUD = "crud"
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class BulkheadStats:
+    max_concurrency: int
+    max_queue: int
+    running: int
+    queued: int
+    admitted: int
+    rejected: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class BulkheadFullError(Exception):
+    def __init__(self, name: str) -> None:
+        super().__init__(f"The {name} worker pool is saturated, retry later.")
+        self.name = name
+
+
+class Bulkhead:
+    """Worker threads reserved for one class of routes.
+
+    Sync work for the class runs on at most ``max_concurrency`` threads of its
+    own, so a flood in one class cannot take the threads another needs.
+    ``admit`` rejects new work while ``max_queue`` callers are already waiting
+    for a thread; 0 lets the queue grow without bound. Queue state is read on
+    the event loop, so ``admit`` and ``snapshot`` must be called from it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.max_queue = max_queue
+        self._limiter = anyio.CapacityLimiter(max(max_concurrency, 1))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def admit(self) -> None:
+        """Raise ``BulkheadFullError`` if the queue for a thread is full."""
+        if not self.max_queue or self._limiter.available_tokens > 0:
+            return
+        if self._limiter.statistics().tasks_waiting >= self.max_queue:
+            with self._lock:
+                self._rejected += 1
+            raise BulkheadFullError(self.name)
+
+    async def run_sync(self, func: Callable[..., T], *args: Any) -> T:
+        """Run ``func`` on one of this bulkhead's threads, waiting for one."""
+        enqueued_at = self._clock()
+
+        def run() -> T:
+            waited = self._clock() - enqueued_at
+            with self._lock:
+                self._admitted += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+            return func(*args)
+
+        return await anyio.to_thread.run_sync(run, limiter=self._limiter)
+
+    def snapshot(self) -> BulkheadStats:
+        limiter = self._limiter.statistics()
+        with self._lock:
+            return BulkheadStats(
+                max_concurrency=int(limiter.total_tokens),
+                max_queue=self.max_queue,
+                running=limiter.borrowed_tokens,
+                queued=limiter.tasks_waiting,
+                admitted=self._admitted,
+                rejected=self._rejected,
+                wait_seconds_total=self._wait_total,
+                wait_seconds_max=self._wait_max,
+            )
+
+
+bulkheads = {
+    VIDEO: Bulkhead(
+        VIDEO, settings.BULKHEAD_VIDEO_THREADS, settings.BULKHEAD_VIDEO_QUEUE
+    ),
+    AUTH: Bulkhead(AUTH, settings.BULKHEAD_AUTH_THREADS, settings.BULKHEAD_AUTH_QUEUE),
+    CRUD: Bulkhead(CRUD, settings.BULKHEAD_CRUD_THREADS, settings.BULKHEAD_CRUD_QUEUE),
+}
+
+
+def bulkhead(name: str) -> Callable[[F], F]:
+    """Run a sync endpoint in the ``name`` bulkhead instead of its router's."""
+
+    def decorate(endpoint: F) -> F:
+        endpoint.__bulkhead__ = name  # type: ignore[attr-defined]
+        return endpoint
+
+    return decorate
+
+
+def bulkhead_route(name: str) -> type[APIRoute]:
+    """Route class running a router's sync endpoints in the ``name`` bulkhead.
+
+    Async endpoints are left alone; they pick a bulkhead for their blocking
+    calls themselves. Only the endpoint is isolated: sync dependencies such
+    as ``get_db`` and ``get_current_user`` still run on Starlette's shared
+    threadpool, since wrapping them would break ``dependency_overrides``.
+    """
+
+    class BulkheadRoute(APIRoute):
+        def get_route_handler(
+            self,
+        ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            call = self.dependant.call
+            if call is not None and not inspect.iscoroutinefunction(call):
+                pool_name = getattr(call, "__bulkhead__", name)
+
+                async def run_in_bulkhead(**values: Any) -> Any:
+                    pool = bulkheads[pool_name]
+                    pool.admit()
+                    return await pool.run_sync(lambda: call(**values))
+
+                self.dependant.call = run_in_bulkhead
+            return super().get_route_handler()
+
+    BulkheadRoute.__name__ = f"{name.capitalize()}BulkheadRoute"
+    return BulkheadRoute
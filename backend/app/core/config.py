@@ -47,6 +47,17 @@ class Settings(BaseSettings):
 
     PROJECT_NAME: str
     SENTRY_DSN: HttpUrl | None = None
+    # Share of requests traced, by Sentry and by the exporter below. Route
+    # rates are keyed by path prefix (longest wins), e.g. as JSON:
+    # {"/api/v1/video/": 0.2, "/api/v1/utils/health-check/": 0}
+    TRACING_SAMPLE_RATE: float = 0.1
+    TRACING_ROUTE_SAMPLE_RATES: dict[str, float] = {}
+    # Where sampled traces go without Sentry: OTLP/JSON lines in a file, or an
+    # OTLP/HTTP collector. Unset disables it
+    TRACING_EXPORTER: Literal["file", "otlp"] | None = None
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_OTLP_HEADERS: dict[str, str] = {}
     POSTGRES_SERVER: str
     POSTGRES_PORT: int = 5432
     POSTGRES_USER: str
@@ -69,6 +80,86 @@ class Settings(BaseSettings):
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
     OPENAI_API_KEY: str | None = None
+    # Another OpenAI-compatible endpoint for model calls, e.g. the stub server
+    # in backend/benchmarks for offline load tests
+    OPENAI_BASE_URL: str | None = None
+    # Worker threads per route class, so slow video work cannot take the
+    # threads logins and CRUD need; new requests are rejected with 503 while
+    # a class already has its queue limit waiting. A queue limit of 0 is unbounded
+    BULKHEAD_VIDEO_THREADS: int = 16
+    BULKHEAD_VIDEO_QUEUE: int = 32
+    BULKHEAD_AUTH_THREADS: int = 8
+    BULKHEAD_AUTH_QUEUE: int = 64
+    BULKHEAD_CRUD_THREADS: int = 16
+    BULKHEAD_CRUD_QUEUE: int = 128
+    BULKHEAD_RETRY_AFTER_SECONDS: int = 1
+    # Idle processing clients kept per worker process; all share one HTTP pool
+    VIDEO_CLIENT_POOL_SIZE: int = 8
+    # Provider budget shared by every worker through Postgres (or per process
+    # with "local"); model calls wait for budget. 0 disables a limit
+    VIDEO_LLM_REQUESTS_PER_MINUTE: int = 500
+    VIDEO_LLM_TOKENS_PER_MINUTE: int = 200_000
+    VIDEO_RATE_LIMIT_BACKEND: Literal["database", "local"] = "database"
+    VIDEO_RESULT_CACHE_ENABLED: bool = True
+    # Per-process LRU entries kept in front of the VideoResult table
+    VIDEO_RESULT_CACHE_SIZE: int = 512
+    VIDEO_TRANSCRIPT_CACHE_ENABLED: bool = True
+    # Per-process LRU entries kept in front of the VideoTranscript table
+    VIDEO_TRANSCRIPT_CACHE_SIZE: int = 128
+    # Available caption languages per video; empty lists use the negative TTL
+    VIDEO_LANGUAGE_CACHE_SIZE: int = 2048
+    VIDEO_LANGUAGE_CACHE_TTL_SECONDS: int = 6 * 60 * 60
+    VIDEO_LANGUAGE_NEGATIVE_TTL_SECONDS: int = 10 * 60
+    # Largest /video/process/batch request, and its items processed at once
+    VIDEO_BATCH_MAX_ITEMS: int = 500
+    VIDEO_BATCH_CONCURRENCY: int = 4
+    # Where style outputs are collected: in memory, or files on tmpfs
+    VIDEO_OUTPUT_SINK: Literal["memory", "tmpfs"] = "memory"
+    # Serialize identical video work across worker processes via pg advisory locks
+    VIDEO_ADVISORY_LOCKS_ENABLED: bool = True
+    # Background threads per worker process executing /video/jobs
+    VIDEO_JOB_WORKERS: int = 2
+    # Jobs still running this long after they started are assumed lost to a
+    # crash or shutdown, and run again when a worker process starts
+    VIDEO_JOB_STALE_SECONDS: int = 60 * 60
+    # Per-process pool shared by all requests for running styles concurrently
+    VIDEO_STYLE_POOL_SIZE: int = 8
+    # Styles of one request allowed to run at once; 1 runs them sequentially
+    VIDEO_STYLE_CONCURRENCY: int = 5
+    # Uncached videos processed at once per worker process, shared between
+    # interactive requests and bulk work (batch API, jobs) by weight and cap
+    VIDEO_SCHEDULER_CAPACITY: int = 8
+    VIDEO_INTERACTIVE_WEIGHT: int = 4
+    VIDEO_INTERACTIVE_MAX_CONCURRENCY: int = 8
+    VIDEO_BULK_WEIGHT: int = 1
+    VIDEO_BULK_MAX_CONCURRENCY: int = 4
+    # Video requests are rejected with 503 while this many are in flight per
+    # worker process, or while queued work of their priority has waited longer
+    # than the threshold. 0 disables a check. Unset, the in-flight limit is
+    # the video bulkhead's threads plus queue, so admission rejects before
+    # the bulkhead would
+    VIDEO_ADMISSION_MAX_IN_FLIGHT: int | None = None
+    VIDEO_ADMISSION_MAX_QUEUE_WAIT_SECONDS: float = 30.0
+    VIDEO_ADMISSION_RETRY_AFTER_SECONDS: int = 5
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def video_admission_max_in_flight(self) -> int:
+        if self.VIDEO_ADMISSION_MAX_IN_FLIGHT is not None:
+            return self.VIDEO_ADMISSION_MAX_IN_FLIGHT
+        if not self.BULKHEAD_VIDEO_QUEUE:
+            # An unbounded video queue rejects nothing either.
+            return 0
+        return self.BULKHEAD_VIDEO_THREADS + self.BULKHEAD_VIDEO_QUEUE
+
+    # Transcripts over this many estimated tokens are condensed segment by
+    # segment before each style runs; 0 (default) sends them to the model whole,
+    # as the engine chunks them itself. Condensing costs about twice the model
+    # calls and summarizes a summary, so set it near the model's context limit
+    # only if whole transcripts overflow it
+    VIDEO_CHUNK_MAX_TOKENS: int = 0
+    # Segments of one request condensed at once on the style pool
+    VIDEO_CHUNK_CONCURRENCY: int = 8
 
     def _check_default_secret(self, var_name: str, value: str | None) -> None:
         if value == "changethis":
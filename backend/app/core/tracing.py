@@ -0,0 +1,479 @@
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import httpx
+import sentry_sdk
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Span kinds, as numbered by OTLP.
+INTERNAL = 1
+SERVER = 2
+CLIENT = 3
+
+# Attribute values longer than this are cut, so SQL and prompts stay small.
+MAX_ATTRIBUTE_LENGTH = 1024
+
+
+@dataclass
+class Span:
+    trace: "_Trace"
+    span_id: str
+    parent_id: str | None
+    name: str
+    kind: int
+    start_ns: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    end_ns: int | None = None
+    error: str | None = None
+    # The same span in Sentry's transaction, when Sentry traces the request.
+    sentry: Any = None
+    # Roots mirror the transaction Sentry's middleware opened and will finish.
+    owns_sentry: bool = True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+        if self.sentry is not None:
+            self.sentry.set_data(key, value)
+
+    def end(self, error: BaseException | None = None) -> None:
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self.end_ns = time.time_ns()
+        if self.sentry is not None and self.owns_sentry:
+            if error is not None:
+                self.sentry.set_status("internal_error")
+            self.sentry.finish()
+        self.trace.finish(self)
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: list[Span]) -> None: ...
+
+
+class _Trace:
+    """Spans of one sampled request, exported together when its root ends.
+
+    Spans from threads still running after that are dropped. Without a
+    ``tracer`` the spans only go to Sentry.
+    """
+
+    def __init__(self, tracer: "Tracer | None", trace_id: str) -> None:
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self._lock = threading.Lock()
+        self.root_id: str | None = None
+        self._finished: list[Span] = []
+        self._closed = False
+
+    def finish(self, span: Span) -> None:
+        if self.tracer is None:
+            return
+        with self._lock:
+            if self._closed:
+                return
+            self._finished.append(span)
+            if span.span_id != self.root_id:
+                return
+            self._closed = True
+            spans, self._finished = self._finished, []
+        self.tracer.enqueue(spans)
+
+
+_current: ContextVar[Span | None] = ContextVar("trace_span", default=None)
+
+
+def start_span(
+    name: str, kind: int = INTERNAL, *, to_sentry: bool = True, **attributes: Any
+) -> Span | None:
+    """Start a child of the current span; ``None`` when nothing is traced.
+
+    Outside a span of ours, the child hangs off the Sentry transaction of a
+    request Sentry samples, so spans are recorded with Sentry alone too.
+    ``to_sentry=False`` keeps the span out of Sentry. The span is not made
+    current; end it with ``Span.end``.
+    """
+    clean = _clean(attributes)
+    parent = _current.get()
+    if parent is not None:
+        trace, parent_id, sentry_parent = parent.trace, parent.span_id, parent.sentry
+    else:
+        sentry_parent = _sentry_transaction() if to_sentry else None
+        if sentry_parent is None or not sentry_parent.sampled:
+            return None
+        trace, parent_id = _Trace(None, sentry_parent.trace_id), None
+    sentry = None
+    if to_sentry and sentry_parent is not None:
+        sentry = sentry_parent.start_child(op=name, description=name)
+        for key, value in clean.items():
+            sentry.set_data(key, value)
+    return Span(
+        trace=trace,
+        span_id=_random_id(8),
+        parent_id=parent_id,
+        name=name,
+        kind=kind,
+        start_ns=time.time_ns(),
+        attributes=clean,
+        sentry=sentry,
+    )
+
+
+@contextmanager
+def span(name: str, kind: int = INTERNAL, **attributes: Any) -> Iterator[Span | None]:
+    """Trace the block as a child of the current span, if a trace is sampled."""
+    child = start_span(name, kind, **attributes)
+    if child is None:
+        yield None
+        return
+    token = _current.set(child)
+    try:
+        yield child
+    except BaseException as exc:
+        _current.reset(token)
+        child.end(exc)
+        raise
+    _current.reset(token)
+    child.end()
+
+
+class Tracer:
+    """Samples requests and exports their spans off the request path.
+
+    ``sample_rate`` applies to paths without a more specific entry in
+    ``route_sample_rates``, keyed by path prefix; the longest match wins.
+    A sampled ``traceparent`` header from a caller always continues the trace.
+    Otherwise, when Sentry has opened a transaction for the request, its
+    sampling decision and trace ID are reused, and spans go to both.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        sample_rate: float = 0.0,
+        route_sample_rates: dict[str, float] | None = None,
+        max_queue: int = 1024,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self._exporter = exporter
+        self._sample_rate = sample_rate
+        self._route_sample_rates = route_sample_rates or {}
+        self._rng = rng
+        self._queue: queue.Queue[list[Span] | None] = queue.Queue(max_queue)
+        self._worker = threading.Thread(
+            target=self._export_loop, name="trace-export", daemon=True
+        )
+        self._worker.start()
+
+    def sample_rate_for(self, path: str) -> float:
+        return route_sample_rate(path, self._sample_rate, self._route_sample_rates)
+
+    @contextmanager
+    def trace(
+        self, name: str, path: str, traceparent: str | None = None, **attributes: Any
+    ) -> Iterator[Span | None]:
+        """Start a root span for a request at ``path``, if it is sampled."""
+        parent = _parse_traceparent(traceparent)
+        transaction = _sentry_transaction()
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        elif transaction is not None:
+            trace_id, parent_id = transaction.trace_id, None
+            sampled = bool(transaction.sampled)
+        else:
+            trace_id, parent_id = _random_id(16), None
+            sampled = self._rng() < self.sample_rate_for(path)
+        if not sampled:
+            yield None
+            return
+        trace = _Trace(self, trace_id)
+        root = Span(
+            trace=trace,
+            span_id=_random_id(8),
+            parent_id=parent_id,
+            name=name,
+            kind=SERVER,
+            start_ns=time.time_ns(),
+            attributes=_clean(attributes),
+            sentry=transaction if transaction and transaction.sampled else None,
+            owns_sentry=False,
+        )
+        trace.root_id = root.span_id
+        token = _current.set(root)
+        try:
+            yield root
+        except BaseException as exc:
+            _current.reset(token)
+            root.end(exc)
+            raise
+        _current.reset(token)
+        root.end()
+
+    def enqueue(self, spans: list[Span]) -> None:
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            logger.warning("Trace export queue full, dropping %d spans", len(spans))
+
+    def shutdown(self) -> None:
+        """Export what is queued, then stop the export thread."""
+        self._queue.put(None)
+        self._worker.join(timeout=5)
+
+    def _export_loop(self) -> None:
+        while True:
+            spans = self._queue.get()
+            if spans is None:
+                return
+            try:
+                self._exporter.export(spans)
+            except Exception:  # noqa: BLE001 - tracing must not break serving
+                logger.warning("Trace export failed", exc_info=True)
+
+
+class FileSpanExporter:
+    """Appends one OTLP/JSON ``TracesData`` document per trace to ``path``.
+
+    The file is JSON lines, as read by the OpenTelemetry Collector's
+    ``otlpjsonfile`` receiver.
+    """
+
+    def __init__(self, path: str, service_name: str) -> None:
+        self._path = path
+        self._service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        line = json.dumps(to_otlp(spans, self._service_name))
+        with self._lock, open(self._path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+class OTLPSpanExporter:
+    """Posts spans to an OTLP/HTTP collector endpoint as JSON."""
+
+    def __init__(
+        self, endpoint: str, service_name: str, headers: dict[str, str] | None = None
+    ) -> None:
+        self._endpoint = endpoint
+        self._service_name = service_name
+        self._client = httpx.Client(headers=headers, timeout=10)
+
+    def export(self, spans: list[Span]) -> None:
+        response = self._client.post(
+            self._endpoint, json=to_otlp(spans, self._service_name)
+        )
+        response.raise_for_status()
+
+
+class TracingMiddleware:
+    """Opens the root span of each sampled HTTP request."""
+
+    def __init__(self, app: ASGIApp, tracer: Tracer) -> None:
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or [])
+        traceparent = headers.get(b"traceparent")
+        method, path = scope["method"], scope["path"]
+        with self.tracer.trace(
+            f"{method} {path}",
+            path,
+            traceparent.decode("latin-1") if traceparent else None,
+            **{"http.request.method": method, "url.path": path},
+        ) as root:
+            if root is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_traced(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    root.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        root.error = f"HTTP {message['status']}"
+                await send(message)
+
+            await self.app(scope, receive, send_traced)
+            route = scope.get("route")
+            if route is not None:
+                root.name = f"{method} {getattr(route, 'path', path)}"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Trace every SQL statement ``engine`` runs within a sampled request.
+
+    Sentry records these itself through its SQLAlchemy integration.
+    """
+
+    system = engine.dialect.name
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(
+        _conn: Any, _cursor: Any, statement: str, _params: Any, context: Any, _many: Any
+    ) -> None:
+        context._trace_span = start_span(
+            "db.query",
+            CLIENT,
+            to_sentry=False,
+            **{"db.system": system, "db.statement": statement},
+        )
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end(
+        _conn: Any,
+        _cursor: Any,
+        _statement: str,
+        _params: Any,
+        context: Any,
+        _many: Any,
+    ) -> None:
+        query_span = getattr(context, "_trace_span", None)
+        if query_span is not None:
+            query_span.end()
+
+    @event.listens_for(engine, "handle_error")
+    def _fail(exception_context: Any) -> None:
+        context = exception_context.execution_context
+        query_span = getattr(context, "_trace_span", None)
+        if query_span is not None:
+            query_span.end(exception_context.original_exception)
+
+
+def _sentry_transaction() -> Any:
+    """The Sentry transaction of the current request, if Sentry is on."""
+    hub = sentry_sdk.Hub.current
+    if hub.client is None:
+        return None
+    return hub.scope.transaction
+
+
+def route_sample_rate(
+    path: str, default: float, route_sample_rates: dict[str, float]
+) -> float:
+    matches = [prefix for prefix in route_sample_rates if path.startswith(prefix)]
+    if not matches:
+        return default
+    return route_sample_rates[max(matches, key=len)]
+
+
+def build_tracer() -> Tracer | None:
+    """The tracer configured by the TRACING_* settings, if any."""
+    if settings.TRACING_EXPORTER == "file":
+        exporter: SpanExporter = FileSpanExporter(
+            settings.TRACING_FILE_PATH, settings.PROJECT_NAME
+        )
+    elif settings.TRACING_EXPORTER == "otlp":
+        exporter = OTLPSpanExporter(
+            settings.TRACING_OTLP_ENDPOINT,
+            settings.PROJECT_NAME,
+            headers=settings.TRACING_OTLP_HEADERS,
+        )
+    else:
+        return None
+    return Tracer(
+        exporter,
+        sample_rate=settings.TRACING_SAMPLE_RATE,
+        route_sample_rates=settings.TRACING_ROUTE_SAMPLE_RATES,
+    )
+
+
+def to_otlp(spans: list[Span], service_name: str) -> dict[str, Any]:
+    """Spans as an OTLP/JSON ``TracesData`` document."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes(
+                        {"service.name": service_name, "process.pid": os.getpid()}
+                    )
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [_otlp_span(item) for item in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def _otlp_span(item: Span) -> dict[str, Any]:
+    data: dict[str, Any] = {
+        "traceId": item.trace.trace_id,
+        "spanId": item.span_id,
+        "name": item.name,
+        "kind": item.kind,
+        "startTimeUnixNano": str(item.start_ns),
+        "endTimeUnixNano": str(item.end_ns or item.start_ns),
+        "attributes": _otlp_attributes(item.attributes),
+        # 1 is OK, 2 is ERROR.
+        "status": {"code": 2, "message": item.error} if item.error else {"code": 1},
+    }
+    if item.parent_id is not None:
+        data["parentSpanId"] = item.parent_id
+    return data
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)} for key, value in attributes.items()
+    ]
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _clean(attributes: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: value[:MAX_ATTRIBUTE_LENGTH] if isinstance(value, str) else value
+        for key, value in attributes.items()
+        if value is not None
+    }
+
+
+def _parse_traceparent(header: str | None) -> tuple[str, str, bool] | None:
+    """Trace ID, parent span ID and sampled flag of a W3C ``traceparent``."""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        flags = int(parts[3], 16)
+        int(parts[1], 16)
+        int(parts[2], 16)
+    except ValueError:
+        return None
+    if set(parts[1]) == {"0"} or set(parts[2]) == {"0"}:
+        return None
+    return parts[1], parts[2], bool(flags & 1)
+
+
+def _random_id(num_bytes: int) -> str:
+    return os.urandom(num_bytes).hex()
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 import sentry_sdk
 from fastapi import FastAPI, Request
 from fastapi.exception_handlers import request_validation_exception_handler
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
@@ -12,16 +15,71 @@ except ImportError:  # pragma: no cover - dependency handled by project config
     GetOutVideoAPI = None  # type: ignore[assignment]
 
 from app.api.main import api_router
+from app.api.routes.video import build_video_service
+from app.core.bulkhead import BulkheadFullError
 from app.core.config import settings
+from app.core.db import engine
+from app.core.tracing import (
+    TracingMiddleware,
+    build_tracer,
+    instrument_engine,
+    route_sample_rate,
+)
+from app.video_processor.admission import AdmissionController
+from app.video_processor.cache import (
+    DatabaseResultStore,
+    DatabaseTranscriptStore,
+    ResultCache,
+    TranscriptCache,
+    TTLCache,
+)
+from app.video_processor.clients import create_client_pool
 from app.video_processor.exceptions import register_video_exception_handlers
+from app.video_processor.jobs import DatabaseJobStore, VideoJobRunner
+from app.video_processor.metrics import mark_worker_dead, render_metrics
+from app.video_processor.outputs import (
+    DirectoryOutputSink,
+    default_output_sink,
+    tmpfs_dir,
+)
+from app.video_processor.ratelimit import (
+    BucketStore,
+    DatabaseBucketStore,
+    LocalBucketStore,
+    RateLimiter,
+)
+from app.video_processor.scheduler import (
+    BULK,
+    INTERACTIVE,
+    PriorityClass,
+    PriorityScheduler,
+)
+from app.video_processor.singleflight import AdvisoryLock, SingleFlight
+from app.video_processor.styles import load_style_catalog
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+def sentry_traces_sampler(sampling_context: dict[str, Any]) -> float:
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return float(parent_sampled)
+    scope = sampling_context.get("asgi_scope") or {}
+    return route_sample_rate(
+        scope.get("path", ""),
+        settings.TRACING_SAMPLE_RATE,
+        settings.TRACING_ROUTE_SAMPLE_RATES,
+    )
+
+
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
-    sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
+    sentry_sdk.init(dsn=str(settings.SENTRY_DSN), traces_sampler=sentry_traces_sampler)
+
+tracer = build_tracer()
+if tracer is not None:
+    instrument_engine(engine)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -39,8 +97,14 @@ async def video_request_validation_handler(
     video_process_paths = {
         f"{settings.API_V1_STR}/video/process",
         f"{settings.API_V1_STR}/video/process/",
+        f"{settings.API_V1_STR}/video/process/stream",
+        f"{settings.API_V1_STR}/video/process/batch",
+        f"{settings.API_V1_STR}/video/jobs",
     }
-    if request.url.path in video_process_paths:
+    path = request.url.path
+    if path in video_process_paths or path.startswith(
+        f"{settings.API_V1_STR}/video/jobs/"
+    ):
         return JSONResponse(
             status_code=400,
             content={
@@ -52,14 +116,171 @@ async def video_request_validation_handler(
     return await request_validation_exception_handler(request, exc)
 
 
+@app.exception_handler(BulkheadFullError)
+async def bulkhead_full_handler(
+    request: Request, exc: BulkheadFullError
+) -> JSONResponse:
+    headers = {"Retry-After": str(settings.BULKHEAD_RETRY_AFTER_SECONDS)}
+    if request.url.path.startswith(f"{settings.API_V1_STR}/video/"):
+        return JSONResponse(
+            status_code=503,
+            content={"status": "error", "error": str(exc), "code": 503},
+            headers=headers,
+        )
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers=headers)
+
+
+@app.get("/metrics", tags=["metrics"], include_in_schema=False)
+def metrics() -> Response:
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.on_event("startup")
 def init_getoutvideo_client() -> None:
+    if GetOutVideoAPI is not None:
+        app.state.video_style_catalog = load_style_catalog()
     if settings.OPENAI_API_KEY and GetOutVideoAPI is not None:
-        app.state.getoutvideo_api = GetOutVideoAPI(
-            openai_api_key=settings.OPENAI_API_KEY
+        app.state.getoutvideo_client_pool = create_client_pool(
+            settings.OPENAI_API_KEY,
+            max_idle=settings.VIDEO_CLIENT_POOL_SIZE,
+            base_url=settings.OPENAI_BASE_URL,
         )
 
 
+@app.on_event("startup")
+def init_video_output_sink() -> None:
+    if settings.VIDEO_OUTPUT_SINK == "memory":
+        app.state.video_output_sink = default_output_sink()
+    else:
+        app.state.video_output_sink = DirectoryOutputSink(tmpfs_dir())
+
+
+@app.on_event("startup")
+def init_video_result_cache() -> None:
+    if settings.VIDEO_RESULT_CACHE_ENABLED:
+        app.state.video_result_cache = ResultCache(
+            store=DatabaseResultStore(engine),
+            max_entries=settings.VIDEO_RESULT_CACHE_SIZE,
+        )
+
+
+@app.on_event("startup")
+def init_video_transcript_cache() -> None:
+    if settings.VIDEO_TRANSCRIPT_CACHE_ENABLED:
+        app.state.video_transcript_cache = TranscriptCache(
+            store=DatabaseTranscriptStore(engine),
+            max_entries=settings.VIDEO_TRANSCRIPT_CACHE_SIZE,
+        )
+
+
+@app.on_event("startup")
+def init_video_language_cache() -> None:
+    app.state.video_language_cache = TTLCache(
+        max_entries=settings.VIDEO_LANGUAGE_CACHE_SIZE
+    )
+
+
+@app.on_event("startup")
+def init_video_rate_limiter() -> None:
+    if settings.VIDEO_RATE_LIMIT_BACKEND == "database":
+        store: BucketStore = DatabaseBucketStore(engine)
+    else:
+        store = LocalBucketStore()
+    app.state.video_rate_limiter = RateLimiter(
+        store,
+        requests_per_minute=settings.VIDEO_LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute=settings.VIDEO_LLM_TOKENS_PER_MINUTE,
+    )
+
+
+@app.on_event("startup")
+def init_video_scheduler() -> None:
+    app.state.video_scheduler = PriorityScheduler(
+        [
+            PriorityClass(
+                INTERACTIVE,
+                weight=settings.VIDEO_INTERACTIVE_WEIGHT,
+                max_concurrency=settings.VIDEO_INTERACTIVE_MAX_CONCURRENCY,
+            ),
+            PriorityClass(
+                BULK,
+                weight=settings.VIDEO_BULK_WEIGHT,
+                max_concurrency=settings.VIDEO_BULK_MAX_CONCURRENCY,
+            ),
+        ],
+        capacity=settings.VIDEO_SCHEDULER_CAPACITY,
+    )
+
+
+@app.on_event("startup")
+def init_video_admission() -> None:
+    app.state.video_admission = AdmissionController(
+        max_in_flight=settings.video_admission_max_in_flight,
+        max_queue_wait_seconds=settings.VIDEO_ADMISSION_MAX_QUEUE_WAIT_SECONDS,
+        retry_after_seconds=settings.VIDEO_ADMISSION_RETRY_AFTER_SECONDS,
+        scheduler=getattr(app.state, "video_scheduler", None),
+    )
+
+
+@app.on_event("startup")
+def init_video_coordination() -> None:
+    app.state.video_single_flight = SingleFlight()
+    if settings.VIDEO_ADVISORY_LOCKS_ENABLED:
+        app.state.video_process_lock = AdvisoryLock(engine)
+
+
+@app.on_event("startup")
+def init_video_style_executor() -> None:
+    app.state.video_style_executor = ThreadPoolExecutor(
+        max_workers=settings.VIDEO_STYLE_POOL_SIZE, thread_name_prefix="video-style"
+    )
+
+
+@app.on_event("startup")
+def init_video_job_runner() -> None:
+    runner = VideoJobRunner(
+        store=DatabaseJobStore(engine),
+        service_factory=lambda: build_video_service(app.state, priority=BULK),
+        max_workers=settings.VIDEO_JOB_WORKERS,
+        stale_after_seconds=settings.VIDEO_JOB_STALE_SECONDS,
+    )
+    app.state.video_job_runner = runner
+    runner.resume_pending()
+
+
+@app.on_event("shutdown")
+def shutdown_getoutvideo_client_pool() -> None:
+    pool = getattr(app.state, "getoutvideo_client_pool", None)
+    if pool is not None:
+        pool.close()
+
+
+@app.on_event("shutdown")
+def shutdown_video_job_runner() -> None:
+    runner = getattr(app.state, "video_job_runner", None)
+    if runner is not None:
+        runner.shutdown()
+
+
+@app.on_event("shutdown")
+def shutdown_video_metrics() -> None:
+    mark_worker_dead()
+
+
+@app.on_event("shutdown")
+def shutdown_tracer() -> None:
+    if tracer is not None:
+        tracer.shutdown()
+
+
+@app.on_event("shutdown")
+def shutdown_video_style_executor() -> None:
+    executor = getattr(app.state, "video_style_executor", None)
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _format_validation_error(exc: RequestValidationError) -> str:
     errors = exc.errors()
     if not errors:
@@ -84,4 +305,7 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
+if tracer is not None:
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -1,8 +1,9 @@
 import uuid
 from datetime import datetime, timezone
+from typing import Any
 
 from pydantic import EmailStr
-from sqlalchemy import DateTime
+from sqlalchemy import JSON, DateTime, LargeBinary, Text, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -108,6 +109,80 @@ class ItemsPublic(SQLModel):
     count: int
 
 
+# Database model for processed video output, one row per style and language
+class VideoResult(SQLModel, table=True):
+    __table_args__ = (
+        UniqueConstraint(
+            "video_id",
+            "style",
+            "output_language",
+            "engine_version",
+            name="uq_videoresult_key",
+        ),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    video_id: str = Field(index=True, max_length=64)
+    style: str = Field(max_length=64)
+    output_language: str = Field(max_length=64)
+    engine_version: str = Field(max_length=32)
+    video_title: str = Field(max_length=512)
+    content: str = Field(sa_type=Text)  # type: ignore
+    created_at: datetime | None = Field(
+        default_factory=get_datetime_utc,
+        sa_type=DateTime(timezone=True),  # type: ignore
+    )
+
+
+# Database model for fetched captions, zlib-compressed, one row per language
+class VideoTranscript(SQLModel, table=True):
+    __table_args__ = (
+        UniqueConstraint("video_id", "language", name="uq_videotranscript_key"),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    video_id: str = Field(index=True, max_length=64)
+    language: str = Field(max_length=64)
+    video_title: str = Field(max_length=512)
+    content: bytes = Field(sa_type=LargeBinary)  # type: ignore
+    created_at: datetime | None = Field(
+        default_factory=get_datetime_utc,
+        sa_type=DateTime(timezone=True),  # type: ignore
+    )
+
+
+# Database model for asynchronous video processing jobs
+class VideoJob(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    status: str = Field(default="pending", index=True, max_length=16)
+    video_url: str = Field(max_length=2048)
+    styles: list[str] | None = Field(default=None, sa_type=JSON)  # type: ignore
+    output_language: str = Field(max_length=64)
+    result: dict[str, Any] | None = Field(default=None, sa_type=JSON)  # type: ignore
+    error: str | None = Field(default=None, max_length=1024)
+    error_code: int | None = None
+    created_at: datetime | None = Field(
+        default_factory=get_datetime_utc,
+        sa_type=DateTime(timezone=True),  # type: ignore
+    )
+    started_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore
+    )
+    finished_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),  # type: ignore
+    )
+
+
+# Database model for token buckets shared by every worker process
+class RateLimitBucket(SQLModel, table=True):
+    name: str = Field(primary_key=True, max_length=64)
+    tokens: float
+    # Seconds since the epoch, on the database clock
+    updated_at: float
+
+
 # Generic message
 class Message(SQLModel):
     message: str
@@ -123,3 +198,19 @@ class Token(SQLModel):
 class TokenPayload(SQLModel):
     sub: str | None = None
 
+
+# Saturation of one route class's worker threads
+class BulkheadPublic(SQLModel):
+    name: str
+    max_concurrency: int
+    max_queue: int
+    running: int
+    queued: int
+    admitted: int
+    rejected: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class BulkheadsPublic(SQLModel):
+    data: list[BulkheadPublic]
@@ -0,0 +1,92 @@
+import math
+import threading
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.video_processor.exceptions import VideoOverloadedError
+from app.video_processor.scheduler import PriorityScheduler
+
+IN_FLIGHT = "in_flight"
+QUEUE_WAIT = "queue_wait"
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    in_flight: int
+    admitted: int
+    rejected_in_flight: int
+    rejected_queue_wait: int
+
+
+class AdmissionController:
+    """Rejects video requests up front while the worker is saturated.
+
+    A request is turned away when ``max_in_flight`` requests are already
+    running or queued, or when queued work of its priority has waited longer
+    than ``max_queue_wait_seconds``: a newcomer would wait at least as long,
+    and is better off retrying elsewhere or later. 0 disables a check.
+    Rejections carry a retry hint of ``retry_after_seconds``, raised to the
+    current queue wait when that is longer.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_queue_wait_seconds: float,
+        retry_after_seconds: int,
+        scheduler: PriorityScheduler | None = None,
+    ) -> None:
+        self._max_in_flight = max_in_flight
+        self._max_queue_wait = max_queue_wait_seconds
+        self._retry_after = retry_after_seconds
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._admitted = 0
+        self._rejected: Counter[str] = Counter()
+
+    def admit(self, priority: str) -> Callable[[], None]:
+        """Admit one request or raise ``VideoOverloadedError``.
+
+        Returns the function to call once the request has finished; calling
+        it again does nothing.
+        """
+        queue_wait = (
+            self._scheduler.queue_wait(priority) if self._scheduler is not None else 0.0
+        )
+        with self._lock:
+            if self._max_in_flight and self._in_flight >= self._max_in_flight:
+                reason = IN_FLIGHT
+            elif self._max_queue_wait and queue_wait > self._max_queue_wait:
+                reason = QUEUE_WAIT
+            else:
+                self._in_flight += 1
+                self._admitted += 1
+                return self._releaser()
+            self._rejected[reason] += 1
+        raise VideoOverloadedError(
+            "Video processing is overloaded, retry later.",
+            retry_after=max(self._retry_after, math.ceil(queue_wait)),
+        )
+
+    def snapshot(self) -> AdmissionStats:
+        with self._lock:
+            return AdmissionStats(
+                in_flight=self._in_flight,
+                admitted=self._admitted,
+                rejected_in_flight=self._rejected[IN_FLIGHT],
+                rejected_queue_wait=self._rejected[QUEUE_WAIT],
+            )
+
+    def _releaser(self) -> Callable[[], None]:
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            with self._lock:
+                if not released:
+                    released = True
+                    self._in_flight -= 1
+
+        return release
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import logging
+from collections.abc import AsyncGenerator, Hashable
+from typing import Any
+
+from app.core.bulkhead import VIDEO, bulkheads
+from app.video_processor.cancellation import DISCONNECT, CancelToken
+from app.video_processor.exceptions import describe_error
+from app.video_processor.schemas import VideoProcessRequest, VideoProcessResponse
+from app.video_processor.service import VideoProcessingService, _extract_video_id
+
+logger = logging.getLogger(__name__)
+
+
+def batch_key(item: VideoProcessRequest) -> Hashable:
+    """Items with the same key are computed once and share one outcome."""
+    styles = tuple(sorted(item.styles)) if item.styles is not None else None
+    return (
+        _extract_video_id(item.video_url) or item.video_url,
+        styles,
+        item.output_language,
+    )
+
+
+async def stream_batch(
+    service: VideoProcessingService,
+    items: list[VideoProcessRequest],
+    concurrency: int,
+) -> AsyncGenerator[str, None]:
+    """Yield one NDJSON line per item, in completion order.
+
+    Each line is the /process response body or the error envelope, plus the
+    item's ``index`` in the request.
+    """
+    groups: dict[Hashable, list[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(batch_key(item), []).append(index)
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    batch_cancel = CancelToken()
+
+    async def run(indexes: list[int]) -> dict[str, Any]:
+        async with semaphore:
+            # A shared outcome must not fail an item before its own deadline,
+            # so the group runs under the longest one.
+            deadlines = [items[index].deadline_seconds for index in indexes]
+            timeout = None if None in deadlines else max(filter(None, deadlines))
+            cancel = CancelToken(timeout=timeout, parent=batch_cancel)
+            return await bulkheads[VIDEO].run_sync(
+                _process_item, service, items[indexes[0]], cancel
+            )
+
+    tasks = {
+        asyncio.ensure_future(run(indexes)): indexes for indexes in groups.values()
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                body = task.result()
+                for index in tasks[task]:
+                    yield json.dumps({"index": index, **body}) + "\n"
+    finally:
+        # If the client goes away, items waiting for a slot are dropped and
+        # running items are cancelled.
+        if pending:
+            batch_cancel.cancel(DISCONNECT)
+        for task in pending:
+            task.cancel()
+
+
+def _process_item(
+    service: VideoProcessingService, item: VideoProcessRequest, cancel: CancelToken
+) -> dict[str, Any]:
+    try:
+        data = service.process_video(
+            video_url=item.video_url,
+            styles=item.styles,
+            output_language=item.output_language,
+            cancel=cancel,
+        )
+    except Exception as exc:  # noqa: BLE001 - reported on the item's line
+        message, code = describe_error(exc)
+        if code == 500:
+            logger.exception("Batch item %s failed", item.video_url)
+        return {"status": "error", "error": message, "code": code}
+    response = VideoProcessResponse(data=data)
+    return response.model_dump(mode="json", exclude_none=True)
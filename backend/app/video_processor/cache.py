@@ -0,0 +1,297 @@
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from typing import Generic, Protocol, TypeVar
+
+from sqlalchemy import Engine
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, select
+
+from app.models import VideoResult, VideoTranscript
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def _engine_version() -> str:
+    try:
+        return version("getoutvideo")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+ENGINE_VERSION = _engine_version()
+
+
+@dataclass(frozen=True)
+class ResultKey:
+    video_id: str
+    style: str
+    output_language: str
+    engine_version: str = ENGINE_VERSION
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    video_title: str
+    content: str
+
+
+@dataclass(frozen=True)
+class TranscriptKey:
+    video_id: str
+    language: str
+
+
+@dataclass(frozen=True)
+class CachedTranscript:
+    video_title: str
+    text: str
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU whose entries expire after a per-entry time-to-live."""
+
+    def __init__(
+        self, max_entries: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        if self._max_entries <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResultStore(Protocol):
+    def get_many(self, keys: Iterable[ResultKey]) -> dict[ResultKey, CachedResult]: ...
+
+    def put_many(self, results: dict[ResultKey, CachedResult]) -> None: ...
+
+
+class DatabaseResultStore:
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+
+    def get_many(self, keys: Iterable[ResultKey]) -> dict[ResultKey, CachedResult]:
+        wanted = set(keys)
+        if not wanted:
+            return {}
+        statement = select(VideoResult).where(
+            col(VideoResult.video_id).in_({key.video_id for key in wanted}),
+            col(VideoResult.style).in_({key.style for key in wanted}),
+        )
+        found: dict[ResultKey, CachedResult] = {}
+        with Session(self._engine) as session:
+            for row in session.exec(statement):
+                key = ResultKey(
+                    video_id=row.video_id,
+                    style=row.style,
+                    output_language=row.output_language,
+                    engine_version=row.engine_version,
+                )
+                if key in wanted:
+                    found[key] = CachedResult(
+                        video_title=row.video_title, content=row.content
+                    )
+        return found
+
+    def put_many(self, results: dict[ResultKey, CachedResult]) -> None:
+        if not results:
+            return
+        rows = [
+            VideoResult(
+                video_id=key.video_id,
+                style=key.style,
+                output_language=key.output_language,
+                engine_version=key.engine_version,
+                video_title=result.video_title,
+                content=result.content,
+            ).model_dump()
+            for key, result in results.items()
+        ]
+        statement = insert(VideoResult).values(rows).on_conflict_do_nothing()
+        with Session(self._engine) as session:
+            session.execute(statement)
+            session.commit()
+
+
+class ResultCache:
+    """In-process LRU in front of an optional persistent result store.
+
+    Store failures are logged and treated as misses so a database outage
+    degrades to recomputing results instead of failing requests.
+    """
+
+    def __init__(
+        self, store: ResultStore | None = None, max_entries: int = 512
+    ) -> None:
+        self._store = store
+        self._memory: LRUCache[ResultKey, CachedResult] = LRUCache(max_entries)
+
+    def get_many(self, keys: Iterable[ResultKey]) -> dict[ResultKey, CachedResult]:
+        found: dict[ResultKey, CachedResult] = {}
+        missing: list[ResultKey] = []
+        for key in keys:
+            cached = self._memory.get(key)
+            if cached is None:
+                missing.append(key)
+            else:
+                found[key] = cached
+        if missing and self._store is not None:
+            try:
+                stored = self._store.get_many(missing)
+            except Exception:  # noqa: BLE001 - cache must never fail a request
+                logger.warning("Video result store lookup failed", exc_info=True)
+                stored = {}
+            for key, cached in stored.items():
+                self._memory.set(key, cached)
+                found[key] = cached
+        return found
+
+    def put_many(self, results: dict[ResultKey, CachedResult]) -> None:
+        for key, cached in results.items():
+            self._memory.set(key, cached)
+        if self._store is None:
+            return
+        try:
+            self._store.put_many(results)
+        except Exception:  # noqa: BLE001 - cache must never fail a request
+            logger.warning("Video result store write failed", exc_info=True)
+
+
+class TranscriptStore(Protocol):
+    def get(self, key: TranscriptKey) -> CachedTranscript | None: ...
+
+    def put(self, key: TranscriptKey, transcript: CachedTranscript) -> None: ...
+
+
+class DatabaseTranscriptStore:
+    """Transcript store backed by the VideoTranscript table, zlib-compressed."""
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+
+    def get(self, key: TranscriptKey) -> CachedTranscript | None:
+        statement = select(VideoTranscript).where(
+            col(VideoTranscript.video_id) == key.video_id,
+            col(VideoTranscript.language) == key.language,
+        )
+        with Session(self._engine) as session:
+            row = session.exec(statement).first()
+        if row is None:
+            return None
+        return CachedTranscript(
+            video_title=row.video_title,
+            text=zlib.decompress(row.content).decode("utf-8"),
+        )
+
+    def put(self, key: TranscriptKey, transcript: CachedTranscript) -> None:
+        row = VideoTranscript(
+            video_id=key.video_id,
+            language=key.language,
+            video_title=transcript.video_title,
+            content=zlib.compress(transcript.text.encode("utf-8")),
+        ).model_dump()
+        statement = insert(VideoTranscript).values(row).on_conflict_do_nothing()
+        with Session(self._engine) as session:
+            session.execute(statement)
+            session.commit()
+
+
+class TranscriptCache:
+    """In-process LRU of fetched captions in front of an optional store.
+
+    Like ResultCache, store failures are logged and treated as misses.
+    """
+
+    def __init__(
+        self, store: TranscriptStore | None = None, max_entries: int = 128
+    ) -> None:
+        self._store = store
+        self._memory: LRUCache[TranscriptKey, CachedTranscript] = LRUCache(max_entries)
+
+    def get(self, key: TranscriptKey) -> CachedTranscript | None:
+        cached = self._memory.get(key)
+        if cached is not None or self._store is None:
+            return cached
+        try:
+            cached = self._store.get(key)
+        except Exception:  # noqa: BLE001 - cache must never fail a request
+            logger.warning("Video transcript store lookup failed", exc_info=True)
+            return None
+        if cached is not None:
+            self._memory.set(key, cached)
+        return cached
+
+    def put(self, key: TranscriptKey, transcript: CachedTranscript) -> None:
+        self._memory.set(key, transcript)
+        if self._store is None:
+            return
+        try:
+            self._store.put(key, transcript)
+        except Exception:  # noqa: BLE001 - cache must never fail a request
+            logger.warning("Video transcript store write failed", exc_info=True)
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from app.video_processor.exceptions import (
+    DeadlineExceededError,
+    ProcessingCancelledError,
+)
+
+DISCONNECT = "disconnect"
+DEADLINE = "deadline"
+
+# How often blocked waits re-check for cancellation and deadlines.
+POLL_SECONDS = 0.1
+
+
+class CancelToken:
+    """Cancellation signal for one request, shared by its worker threads.
+
+    A token is cancelled explicitly (the client went away), when its
+    ``deadline`` passes, or when its ``parent`` is. Deadlines are noticed the
+    next time the token is checked; callbacks registered with ``on_cancel``
+    run once, on the thread that first notices.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        parent: "CancelToken | None" = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._deadline = clock() + timeout if timeout is not None else None
+        self._parent = parent
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._reason: str | None = None
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def reason(self) -> str | None:
+        """``DISCONNECT`` or ``DEADLINE`` once cancelled, else ``None``."""
+        if self._reason is None:
+            if self._parent is not None and self._parent.reason is not None:
+                self._fire(self._parent.reason)
+            elif self._deadline is not None and self._clock() >= self._deadline:
+                self._fire(DEADLINE)
+        return self._reason
+
+    def cancel(self, reason: str = DISCONNECT) -> None:
+        self._fire(reason)
+
+    def check(self) -> None:
+        """Raise if the token is cancelled."""
+        reason = self.reason
+        if reason == DEADLINE:
+            raise DeadlineExceededError("Video processing deadline exceeded.")
+        if reason is not None:
+            raise ProcessingCancelledError("Video processing was cancelled.")
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep, waking early to raise if the token is cancelled."""
+        until = self._clock() + seconds
+        while True:
+            self.check()
+            remaining = until - self._clock()
+            if remaining <= 0:
+                return
+            self._event.wait(min(remaining, POLL_SECONDS))
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], None]) -> Iterator[None]:
+        """Run ``callback`` if the token is cancelled while the block runs."""
+        with self._lock:
+            fired = self._reason is not None
+            if not fired:
+                self._callbacks.append(callback)
+        if fired:
+            callback()
+        try:
+            yield
+        finally:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+    def _fire(self, reason: str) -> None:
+        with self._lock:
+            if self._reason is not None:
+                return
+            self._reason = reason
+            callbacks, self._callbacks = self._callbacks, []
+        self._event.set()
+        for callback in callbacks:
+            callback()
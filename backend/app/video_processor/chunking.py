@@ -0,0 +1,54 @@
+import math
+import re
+from collections.abc import Iterator
+
+# Characters that cost roughly one model token each.
+_CJK_PATTERN = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]")
+_WORD_PATTERN = re.compile(r"\S+\s*")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the model token count of ``text`` without a tokenizer.
+
+    CJK characters count as one token each, everything else as four
+    characters per token.
+    """
+    cjk = len(_CJK_PATTERN.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / 4)
+
+
+def split_into_segments(text: str, max_tokens: int) -> list[str]:
+    """Split ``text`` into segments of at most ``max_tokens`` estimated tokens.
+
+    Segments break between words; a single word longer than the budget (such
+    as unspaced CJK captions) is cut by characters. ``max_tokens <= 0``
+    disables splitting.
+    """
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    segments: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    for piece in _pieces(text, max_tokens):
+        tokens = estimate_tokens(piece)
+        if current and current_tokens + tokens > max_tokens:
+            segments.append("".join(current).strip())
+            current = []
+            current_tokens = 0
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        segments.append("".join(current).strip())
+    return [segment for segment in segments if segment]
+
+
+def _pieces(text: str, max_tokens: int) -> Iterator[str]:
+    for match in _WORD_PATTERN.finditer(text):
+        word = match.group()
+        if estimate_tokens(word) <= max_tokens:
+            yield word
+            continue
+        # Worst case is one token per character.
+        for start in range(0, len(word), max_tokens):
+            yield word[start : start + max_tokens]
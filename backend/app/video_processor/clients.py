@@ -0,0 +1,116 @@
+import functools
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import openai
+from getoutvideo import GetOutVideoAPI
+
+from app.core.tracing import CLIENT, span
+
+
+class ClientPool:
+    """Hands out GetOutVideoAPI clients, one request at a time per client.
+
+    A checked-out client is used by a single request only, so state the
+    engine keeps on the instance never leaks between requests. Clients are
+    built on demand and up to ``max_idle`` are kept for reuse. All of them
+    send through one OpenAI client, so HTTP connections stay warm across
+    requests.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], GetOutVideoAPI],
+        max_idle: int = 8,
+        close: Callable[[], None] | None = None,
+    ) -> None:
+        self._factory = factory
+        self._max_idle = max_idle
+        self._close = close
+        self._idle: list[GetOutVideoAPI] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def checkout(self) -> Iterator[GetOutVideoAPI]:
+        with self._lock:
+            client = self._idle.pop() if self._idle else None
+        if client is None:
+            client = self._factory()
+        try:
+            yield client
+        finally:
+            with self._lock:
+                if len(self._idle) < self._max_idle:
+                    self._idle.append(client)
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def close(self) -> None:
+        with self._lock:
+            self._idle.clear()
+        if self._close is not None:
+            self._close()
+
+
+def create_client_pool(
+    openai_api_key: str, max_idle: int = 8, base_url: str | None = None
+) -> ClientPool:
+    """Build a pool whose clients share one keep-alive OpenAI HTTP client.
+
+    ``base_url`` sends the model calls to another OpenAI-compatible server.
+    """
+    # The SDK's HTTP client keeps a connection pool of its own.
+    shared = openai.OpenAI(api_key=openai_api_key, base_url=base_url)
+    trace_completions(shared)
+
+    def factory() -> GetOutVideoAPI:
+        return _with_openai_client(
+            GetOutVideoAPI(openai_api_key=openai_api_key), shared
+        )
+
+    return ClientPool(factory, max_idle=max_idle, close=shared.close)
+
+
+def create_api_client(
+    openai_api_key: str, base_url: str | None = None
+) -> GetOutVideoAPI:
+    """Build an unpooled client, calling ``base_url`` instead of OpenAI if set."""
+    api = GetOutVideoAPI(openai_api_key=openai_api_key)
+    if base_url is None:
+        return api
+    return _with_openai_client(
+        api, openai.OpenAI(api_key=openai_api_key, base_url=base_url)
+    )
+
+
+def _with_openai_client(api: GetOutVideoAPI, client: openai.OpenAI) -> GetOutVideoAPI:
+    api.ai_processor.client.close()
+    api.ai_processor.client = client
+    return api
+
+
+def trace_completions(client: openai.OpenAI) -> None:
+    """Make each chat completion ``client`` sends an ``llm.chat`` span."""
+    create = client.chat.completions.create
+
+    @functools.wraps(create)
+    def traced_create(*args: Any, **kwargs: Any) -> Any:
+        with span(
+            "llm.chat",
+            CLIENT,
+            **{"gen_ai.system": "openai", "gen_ai.request.model": kwargs.get("model")},
+        ) as llm_span:
+            response = create(*args, **kwargs)
+            usage = getattr(response, "usage", None)
+            if llm_span is not None and usage is not None:
+                llm_span.set_attribute("gen_ai.usage.input_tokens", usage.prompt_tokens)
+                llm_span.set_attribute(
+                    "gen_ai.usage.output_tokens", usage.completion_tokens
+                )
+            return response
+
+    client.chat.completions.create = traced_create  # type: ignore[method-assign]
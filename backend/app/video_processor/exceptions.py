@@ -10,6 +10,14 @@ class ProcessingTimeoutError(Exception):
     pass
 
 
+class DeadlineExceededError(ProcessingTimeoutError):
+    pass
+
+
+class ProcessingCancelledError(Exception):
+    pass
+
+
 class ConfigurationError(Exception):
     pass
 
@@ -18,10 +26,53 @@ class ExternalServiceError(Exception):
     pass
 
 
-def _error_response(message: str, code: int) -> JSONResponse:
+class VideoJobNotFoundError(Exception):
+    pass
+
+
+class VideoOverloadedError(Exception):
+    def __init__(self, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+ERROR_STATUS_CODES: dict[type[Exception], int] = {
+    VideoValidationError: 400,
+    VideoJobNotFoundError: 404,
+    ProcessingTimeoutError: 422,
+    # Client closed the connection; nginx's convention, never seen by it.
+    ProcessingCancelledError: 499,
+    ConfigurationError: 500,
+    ExternalServiceError: 502,
+    VideoOverloadedError: 503,
+}
+
+
+def error_status_code(exc: Exception) -> int:
+    for exc_type, code in ERROR_STATUS_CODES.items():
+        if isinstance(exc, exc_type):
+            return code
+    return 500
+
+
+def describe_error(exc: Exception) -> tuple[str, int]:
+    """Return the client-facing message and status code for ``exc``.
+
+    Unexpected exceptions get a generic message so internals never leak into
+    job records or streamed events.
+    """
+    if isinstance(exc, tuple(ERROR_STATUS_CODES)):
+        return str(exc), error_status_code(exc)
+    return "Video processing failed.", 500
+
+
+def _error_response(
+    message: str, code: int, headers: dict[str, str] | None = None
+) -> JSONResponse:
     return JSONResponse(
         status_code=code,
         content={"status": "error", "error": message, "code": code},
+        headers=headers,
     )
 
 
@@ -32,12 +83,24 @@ def register_video_exception_handlers(app: FastAPI) -> None:
     ) -> JSONResponse:
         return _error_response(str(exc), 400)
 
+    @app.exception_handler(VideoJobNotFoundError)
+    async def _handle_video_job_not_found(
+        _request, exc: VideoJobNotFoundError
+    ) -> JSONResponse:
+        return _error_response(str(exc), 404)
+
     @app.exception_handler(ProcessingTimeoutError)
     async def _handle_processing_timeout(
         _request, exc: ProcessingTimeoutError
     ) -> JSONResponse:
         return _error_response(str(exc), 422)
 
+    @app.exception_handler(ProcessingCancelledError)
+    async def _handle_processing_cancelled(
+        _request, exc: ProcessingCancelledError
+    ) -> JSONResponse:
+        return _error_response(str(exc), 499)
+
     @app.exception_handler(ConfigurationError)
     async def _handle_configuration_error(
         _request, exc: ConfigurationError
@@ -49,3 +112,11 @@ def register_video_exception_handlers(app: FastAPI) -> None:
         _request, exc: ExternalServiceError
     ) -> JSONResponse:
         return _error_response(str(exc), 502)
+
+    @app.exception_handler(VideoOverloadedError)
+    async def _handle_video_overloaded(
+        _request, exc: VideoOverloadedError
+    ) -> JSONResponse:
+        return _error_response(
+            str(exc), 503, headers={"Retry-After": str(exc.retry_after)}
+        )
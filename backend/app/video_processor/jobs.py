@@ -0,0 +1,201 @@
+import logging
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Protocol
+
+from sqlalchemy import Engine
+from sqlmodel import Session, col, select, update
+
+from app.models import VideoJob, get_datetime_utc
+from app.video_processor.exceptions import VideoJobNotFoundError, describe_error
+from app.video_processor.schemas import (
+    VideoJobData,
+    VideoProcessData,
+    VideoProcessRequest,
+)
+from app.video_processor.service import VideoProcessingService
+
+logger = logging.getLogger(__name__)
+
+
+class JobStore(Protocol):
+    def create(self, request: VideoProcessRequest) -> VideoJob: ...
+
+    def get(self, job_id: uuid.UUID) -> VideoJob | None: ...
+
+    def claim(self, job_id: uuid.UUID) -> VideoJob | None: ...
+
+    def complete(self, job_id: uuid.UUID, data: VideoProcessData) -> None: ...
+
+    def fail(self, job_id: uuid.UUID, message: str, code: int) -> None: ...
+
+    def pending_ids(self) -> list[uuid.UUID]: ...
+
+    def requeue_stale(self, started_before: datetime) -> int: ...
+
+
+class DatabaseJobStore:
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+
+    def create(self, request: VideoProcessRequest) -> VideoJob:
+        job = VideoJob(
+            video_url=request.video_url,
+            styles=request.styles,
+            output_language=request.output_language,
+        )
+        with Session(self._engine) as session:
+            session.add(job)
+            session.commit()
+            session.refresh(job)
+        return job
+
+    def get(self, job_id: uuid.UUID) -> VideoJob | None:
+        with Session(self._engine) as session:
+            return session.get(VideoJob, job_id)
+
+    def claim(self, job_id: uuid.UUID) -> VideoJob | None:
+        """Move a pending job to running; only one worker process can win."""
+        statement = (
+            update(VideoJob)
+            .where(col(VideoJob.id) == job_id, col(VideoJob.status) == "pending")
+            .values(status="running", started_at=get_datetime_utc())
+            .returning(col(VideoJob.id))
+        )
+        with Session(self._engine) as session:
+            claimed = session.execute(statement).scalar_one_or_none()
+            session.commit()
+            if claimed is None:
+                return None
+            return session.get(VideoJob, job_id)
+
+    def complete(self, job_id: uuid.UUID, data: VideoProcessData) -> None:
+        self._finish(job_id, status="succeeded", result=data.model_dump(mode="json"))
+
+    def fail(self, job_id: uuid.UUID, message: str, code: int) -> None:
+        self._finish(job_id, status="failed", error=message, error_code=code)
+
+    def pending_ids(self) -> list[uuid.UUID]:
+        statement = (
+            select(VideoJob.id)
+            .where(col(VideoJob.status) == "pending")
+            .order_by(col(VideoJob.created_at))
+        )
+        with Session(self._engine) as session:
+            return list(session.exec(statement).all())
+
+    def requeue_stale(self, started_before: datetime) -> int:
+        """Move running jobs started before ``started_before`` back to pending."""
+        statement = (
+            update(VideoJob)
+            .where(
+                col(VideoJob.status) == "running",
+                col(VideoJob.started_at) < started_before,
+            )
+            .values(status="pending", started_at=None)
+            .returning(col(VideoJob.id))
+        )
+        with Session(self._engine) as session:
+            requeued = session.execute(statement).scalars().all()
+            session.commit()
+            return len(requeued)
+
+    def _finish(self, job_id: uuid.UUID, **values: object) -> None:
+        statement = (
+            update(VideoJob)
+            .where(col(VideoJob.id) == job_id)
+            .values(finished_at=get_datetime_utc(), **values)
+        )
+        with Session(self._engine) as session:
+            session.execute(statement)
+            session.commit()
+
+
+class VideoJobRunner:
+    """Execute persisted video jobs on a bounded pool of background threads.
+
+    Jobs are claimed atomically before they run, so every uvicorn worker can
+    resume pending jobs at startup without processing any of them twice.
+    Jobs left running for ``stale_after_seconds``, by a crashed worker or one
+    shut down mid-job, are resumed as well.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        service_factory: Callable[[], VideoProcessingService],
+        max_workers: int,
+        stale_after_seconds: float = 60 * 60,
+    ) -> None:
+        self._store = store
+        self._stale_after = timedelta(seconds=stale_after_seconds)
+        self._service_factory = service_factory
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="video-job"
+        )
+
+    def submit(self, request: VideoProcessRequest) -> VideoJob:
+        job = self._store.create(request)
+        self._executor.submit(self._run, job.id)
+        return job
+
+    def get(self, job_id: uuid.UUID) -> VideoJob:
+        job = self._store.get(job_id)
+        if job is None:
+            raise VideoJobNotFoundError("Video job not found.")
+        return job
+
+    def resume_pending(self) -> int:
+        try:
+            requeued = self._store.requeue_stale(get_datetime_utc() - self._stale_after)
+            if requeued:
+                logger.warning("Requeued %d stale running video jobs", requeued)
+            job_ids = self._store.pending_ids()
+        except Exception:  # noqa: BLE001 - startup must not depend on the DB
+            logger.warning("Could not load pending video jobs", exc_info=True)
+            return 0
+        for job_id in job_ids:
+            self._executor.submit(self._run, job_id)
+        return len(job_ids)
+
+    def shutdown(self) -> None:
+        # Queued jobs stay pending in the store and resume on the next start;
+        # running ones once they are stale.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job_id: uuid.UUID) -> None:
+        try:
+            job = self._store.claim(job_id)
+            if job is None:
+                return
+            try:
+                data = self._service_factory().process_video(
+                    video_url=job.video_url,
+                    styles=job.styles,
+                    output_language=job.output_language,
+                )
+            except Exception as exc:  # noqa: BLE001 - recorded on the job
+                message, code = describe_error(exc)
+                if code == 500:
+                    logger.exception("Video job %s failed", job_id)
+                self._store.fail(job_id, message, code)
+            else:
+                self._store.complete(job_id, data)
+        except Exception:  # noqa: BLE001 - keep the worker thread alive
+            logger.exception("Video job %s could not be updated", job_id)
+
+
+def to_job_data(job: VideoJob) -> VideoJobData:
+    return VideoJobData(
+        job_id=job.id,
+        state=job.status,  # type: ignore[arg-type]
+        video_url=job.video_url,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        result=VideoProcessData.model_validate(job.result) if job.result else None,
+        error=job.error,
+        error_code=job.error_code,
+    )
@@ -0,0 +1,150 @@
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from app.core.tracing import span
+
+# With several worker processes, prometheus_client writes every sample to
+# files in this directory and /metrics sums them. It must be set before the
+# workers start and emptied when the server (re)starts.
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+if os.environ.get(MULTIPROCESS_DIR_ENV):
+    os.makedirs(os.environ[MULTIPROCESS_DIR_ENV], exist_ok=True)
+
+STAGE_SECONDS = Histogram(
+    "video_stage_seconds",
+    "Time spent in each stage of video processing.",
+    ["stage"],
+    buckets=(0.005, 0.025, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+ERRORS = Counter(
+    "video_errors",
+    "Failed video processing requests by exception class.",
+    ["error"],
+)
+CANCELLED = Counter(
+    "video_cancelled_requests",
+    "Cancelled video processing requests by reason.",
+    ["reason"],
+)
+CANCELLED_STYLES = Counter(
+    "video_cancelled_styles_skipped",
+    "Styles cancelled requests did not compute, by reason.",
+    ["reason"],
+)
+IN_FLIGHT = Gauge(
+    "video_requests_in_flight",
+    "Video processing requests currently running, by priority.",
+    ["priority"],
+    multiprocess_mode="livesum",
+)
+
+
+class RequestTimings:
+    """Stage and style durations and cache outcomes of one request.
+
+    Filled in by whatever runs while ``collect_timings`` is active, from any
+    thread the request's context was copied to. A stage that runs more than
+    once accumulates.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stages_ms: dict[str, float] = {}
+        self.styles_ms: dict[str, float] = {}
+        self.cache_hits: dict[str, bool] = {}
+
+    def add_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stages_ms[stage] = self.stages_ms.get(stage, 0.0) + seconds * 1000
+
+    def add_style(self, style: str, seconds: float) -> None:
+        with self._lock:
+            self.styles_ms[style] = self.styles_ms.get(style, 0.0) + seconds * 1000
+
+    def set_cache_hit(self, lookup: str, hit: bool) -> None:
+        with self._lock:
+            self.cache_hits[lookup] = hit
+
+
+_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "video_request_timings", default=None
+)
+
+
+@contextmanager
+def collect_timings() -> Iterator[RequestTimings]:
+    """Record the timings of the work the block runs."""
+    timings = RequestTimings()
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+@contextmanager
+def time_stage(stage: str) -> Iterator[None]:
+    """Observe the block's duration in the ``stage`` histogram, even if it fails.
+
+    The block is also a ``video.<stage>`` span when the request is traced.
+    """
+    started = time.perf_counter()
+    try:
+        with span(f"video.{stage}"):
+            yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.labels(stage).observe(elapsed)
+        timings = _timings.get()
+        if timings is not None:
+            timings.add_stage(stage, elapsed)
+
+
+@contextmanager
+def time_style(style: str) -> Iterator[None]:
+    """Add the block's duration to the request's time for ``style``."""
+    started = time.perf_counter()
+    try:
+        with span("video.style", style=style):
+            yield
+    finally:
+        timings = _timings.get()
+        if timings is not None:
+            timings.add_style(style, time.perf_counter() - started)
+
+
+def record_cache_lookup(lookup: str, hit: bool) -> None:
+    timings = _timings.get()
+    if timings is not None:
+        timings.set_cache_hit(lookup, hit)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Exposition body and content type, summed over all worker processes."""
+    if not os.environ.get(MULTIPROCESS_DIR_ENV):
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess totals."""
+    if os.environ.get(MULTIPROCESS_DIR_ENV):
+        multiprocess.mark_process_dead(os.getpid())  # type: ignore[no-untyped-call]
@@ -0,0 +1,157 @@
+import io
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Protocol
+
+# Shared-memory mount used for output files when capturing in memory is not
+# possible; falls back to the default temp directory when it is missing.
+TMPFS_DIR = "/dev/shm"
+
+EngineRun = Callable[[str], list[Any]]
+
+
+@dataclass(frozen=True)
+class StyleOutput:
+    style: str
+    title: str
+    text: str
+
+
+class OutputSink(Protocol):
+    def collect(self, run: EngineRun) -> list[StyleOutput]:
+        """Call ``run(output_dir)`` and return the outputs it produced.
+
+        ``run`` returns getoutvideo ProcessingResult records.
+        """
+        ...
+
+
+class DirectoryOutputSink:
+    """Let the engine write files into a scratch directory, then read them.
+
+    Outputs are located through the engine's ProcessingResult records rather
+    than by scanning the directory and parsing file names.
+    """
+
+    def __init__(self, base_dir: str | None = None) -> None:
+        self._base_dir = base_dir
+
+    def collect(self, run: EngineRun) -> list[StyleOutput]:
+        with TemporaryDirectory(dir=self._base_dir) as output_dir:
+            return [
+                StyleOutput(
+                    style=result.style_name,
+                    title=result.video_transcript.title,
+                    text=Path(result.output_file_path)
+                    .read_text(encoding="utf-8")
+                    .strip(),
+                )
+                for result in run(output_dir)
+            ]
+
+
+class MemoryOutputSink:
+    """Capture the engine's output files in memory instead of on disk.
+
+    getoutvideo's AIProcessor writes each style with the builtin ``open``;
+    a hook installed in its module hands writes made while collecting on
+    the current thread to in-memory buffers. Other threads are unaffected.
+    """
+
+    def __init__(self) -> None:
+        _install_write_hooks()
+
+    def collect(self, run: EngineRun) -> list[StyleOutput]:
+        with _capture_writes() as captured:
+            # Never created: the directory hook skips it while capturing.
+            results = run(os.path.join(tempfile.gettempdir(), "getoutvideo-memory"))
+        outputs = []
+        for result in results:
+            buffer = captured.get(os.fspath(result.output_file_path))
+            if buffer is None:
+                continue
+            outputs.append(
+                StyleOutput(
+                    style=result.style_name,
+                    title=result.video_transcript.title,
+                    text=buffer.text.strip(),
+                )
+            )
+        return outputs
+
+
+def default_output_sink() -> OutputSink:
+    """Capture in memory when the engine allows it, else use tmpfs."""
+    if memory_capture_supported():
+        return MemoryOutputSink()
+    return DirectoryOutputSink(tmpfs_dir())
+
+
+def memory_capture_supported() -> bool:
+    try:
+        from getoutvideo import ai_processor
+    except Exception:  # noqa: BLE001 - optional runtime dependency
+        return False
+    return hasattr(ai_processor, "ensure_directory_exists")
+
+
+def tmpfs_dir() -> str | None:
+    if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK):
+        return TMPFS_DIR
+    return None
+
+
+class _CapturedFile(io.StringIO):
+    text = ""
+
+    def close(self) -> None:
+        if not self.closed:
+            self.text = self.getvalue()
+        super().close()
+
+
+_capture = threading.local()
+_hooks_lock = threading.Lock()
+_hooks_installed = False
+
+
+@contextmanager
+def _capture_writes() -> Iterator[dict[str, _CapturedFile]]:
+    captured: dict[str, _CapturedFile] = {}
+    _capture.files = captured
+    try:
+        yield captured
+    finally:
+        _capture.files = None
+
+
+def _install_write_hooks() -> None:
+    global _hooks_installed
+    with _hooks_lock:
+        if _hooks_installed:
+            return
+        from getoutvideo import ai_processor
+
+        ensure_directory_exists = ai_processor.ensure_directory_exists
+
+        def engine_open(file: Any, mode: str = "r", *args: Any, **kwargs: Any) -> Any:
+            captured = getattr(_capture, "files", None)
+            if captured is not None and "w" in mode:
+                buffer = _CapturedFile()
+                captured[os.fspath(file)] = buffer
+                return buffer
+            return open(file, mode, *args, **kwargs)
+
+        def engine_ensure_directory_exists(directory_path: str) -> None:
+            if getattr(_capture, "files", None) is None:
+                ensure_directory_exists(directory_path)
+
+        ai_processor.open = engine_open
+        ai_processor.ensure_directory_exists = engine_ensure_directory_exists
+        _hooks_installed = True
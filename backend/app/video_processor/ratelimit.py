@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from sqlalchemy import Engine, text
+
+from app.video_processor.cancellation import CancelToken
+
+logger = logging.getLogger(__name__)
+
+REQUESTS_BUCKET = "openai:requests"
+TOKENS_BUCKET = "openai:tokens"
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """A token bucket holding at most ``capacity`` and refilling continuously."""
+
+    name: str
+    capacity: float
+    per_second: float
+
+
+class BucketStore(Protocol):
+    def take(self, costs: list[tuple[Bucket, float]]) -> float:
+        """Deduct each cost from its bucket, even into debt.
+
+        Returns the seconds until every bucket is out of debt again, which is
+        how long the caller has to wait before spending what it took.
+        """
+        ...
+
+
+class LocalBucketStore:
+    """In-process buckets, for tests and single-process deployments."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._balances: dict[str, tuple[float, float]] = {}
+
+    def take(self, costs: list[tuple[Bucket, float]]) -> float:
+        wait = 0.0
+        with self._lock:
+            now = self._clock()
+            for bucket, cost in costs:
+                tokens, updated_at = self._balances.get(
+                    bucket.name, (bucket.capacity, now)
+                )
+                tokens = _refill(bucket, tokens, now - updated_at) - cost
+                self._balances[bucket.name] = (tokens, now)
+                wait = max(wait, _debt_seconds(bucket, tokens))
+        return wait
+
+
+class DatabaseBucketStore:
+    """Buckets in the ``ratelimitbucket`` table, shared by all workers.
+
+    Each take is one upsert per bucket in a single transaction, refilled
+    against the database clock so workers on different hosts agree.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+
+    def take(self, costs: list[tuple[Bucket, float]]) -> float:
+        wait = 0.0
+        with self._engine.begin() as connection:
+            # A fixed order keeps concurrent takes from deadlocking.
+            for bucket, cost in sorted(costs, key=lambda item: item[0].name):
+                tokens = connection.execute(
+                    _TAKE,
+                    {
+                        "name": bucket.name,
+                        "capacity": bucket.capacity,
+                        "rate": bucket.per_second,
+                        "cost": cost,
+                    },
+                ).scalar_one()
+                wait = max(wait, _debt_seconds(bucket, tokens))
+        return wait
+
+
+_TAKE = text(
+    """
+    INSERT INTO ratelimitbucket (name, tokens, updated_at)
+    VALUES (:name, :capacity - :cost, EXTRACT(EPOCH FROM clock_timestamp()))
+    ON CONFLICT (name) DO UPDATE SET
+        tokens = LEAST(
+            :capacity,
+            ratelimitbucket.tokens
+            + GREATEST(EXCLUDED.updated_at - ratelimitbucket.updated_at, 0) * :rate
+        ) - :cost,
+        updated_at = EXCLUDED.updated_at
+    RETURNING tokens
+    """
+)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budget for model calls.
+
+    ``acquire`` reserves budget up front and sleeps while the buckets are in
+    debt, so callers queue for capacity instead of being rejected by the
+    provider, and sustained throughput settles at the configured limits.
+    A limit of 0 disables that bucket. When the store fails, calls proceed
+    unthrottled.
+    """
+
+    def __init__(
+        self,
+        store: BucketStore,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._store = store
+        self._sleep = sleep
+        self._requests = _minute_bucket(REQUESTS_BUCKET, requests_per_minute)
+        self._tokens = _minute_bucket(TOKENS_BUCKET, tokens_per_minute)
+
+    def acquire(
+        self, requests: int, tokens: int, cancel: CancelToken | None = None
+    ) -> float:
+        """Reserve budget for ``requests`` calls and ``tokens`` tokens.
+
+        Returns the seconds spent waiting. A cancelled ``cancel`` ends the
+        wait by raising; the reserved budget is not returned.
+        """
+        costs = []
+        if self._requests is not None:
+            costs.append((self._requests, float(requests)))
+        if self._tokens is not None:
+            # Larger than the whole bucket could never be paid off at once.
+            costs.append((self._tokens, float(min(tokens, self._tokens.capacity))))
+        if not costs:
+            return 0.0
+        try:
+            wait = self._store.take(costs)
+        except Exception:  # noqa: BLE001 - throttling is best effort
+            logger.warning("Rate limiter unavailable, continuing", exc_info=True)
+            return 0.0
+        if wait > 0:
+            if cancel is not None:
+                cancel.sleep(wait)
+            else:
+                self._sleep(wait)
+        return wait
+
+
+def _minute_bucket(name: str, per_minute: int) -> Bucket | None:
+    if per_minute <= 0:
+        return None
+    return Bucket(name=name, capacity=float(per_minute), per_second=per_minute / 60)
+
+
+def _refill(bucket: Bucket, tokens: float, elapsed: float) -> float:
+    return min(bucket.capacity, tokens + max(elapsed, 0.0) * bucket.per_second)
+
+
+def _debt_seconds(bucket: Bucket, tokens: float) -> float:
+    return max(0.0, -tokens / bucket.per_second)
@@ -0,0 +1,154 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from app.video_processor.cancellation import POLL_SECONDS, CancelToken
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+
+@dataclass(frozen=True)
+class PriorityClass:
+    name: str
+    weight: int
+    max_concurrency: int
+
+
+@dataclass(frozen=True)
+class ClassStats:
+    queued: int
+    running: int
+    admitted: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class _Waiter:
+    __slots__ = ("enqueued_at", "granted")
+
+    def __init__(self, enqueued_at: float) -> None:
+        self.enqueued_at = enqueued_at
+        self.granted = False
+
+
+class _ClassState:
+    def __init__(self, policy: PriorityClass) -> None:
+        self.policy = policy
+        self.waiting: deque[_Waiter] = deque()
+        self.running = 0
+        self.admitted = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        # Virtual finish time of the class's last admission.
+        self.tag = 0.0
+
+
+class PriorityScheduler:
+    """Shares ``capacity`` processing slots between priority classes.
+
+    Waiting callers are admitted by weighted fair queueing: with every class
+    backlogged, each receives slots in proportion to its weight, and a class
+    never holds more than its ``max_concurrency`` slots. An idle class does
+    not bank credit, so it cannot starve the others when it comes back.
+    Within a class, callers are admitted in arrival order.
+    """
+
+    def __init__(
+        self,
+        classes: list[PriorityClass],
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._classes = {policy.name: _ClassState(policy) for policy in classes}
+        self._capacity = max(capacity, 1)
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._running = 0
+        self._virtual_time = 0.0
+
+    @contextmanager
+    def slot(self, priority: str, cancel: CancelToken | None = None) -> Iterator[None]:
+        """Hold one slot for ``priority`` while the block runs.
+
+        A cancelled ``cancel`` gives up the place in the queue by raising.
+        """
+        state = self._classes[priority]
+        waiter = _Waiter(self._clock())
+        with self._condition:
+            if not state.waiting and not state.running:
+                state.tag = max(state.tag, self._virtual_time)
+            state.waiting.append(waiter)
+            try:
+                self._dispatch()
+                while not waiter.granted:
+                    if cancel is None:
+                        self._condition.wait()
+                        continue
+                    cancel.check()
+                    self._condition.wait(POLL_SECONDS)
+            except BaseException:
+                if waiter.granted:
+                    self._release(state)
+                else:
+                    state.waiting.remove(waiter)
+                raise
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._release(state)
+
+    def snapshot(self) -> dict[str, ClassStats]:
+        with self._condition:
+            return {
+                name: ClassStats(
+                    queued=len(state.waiting),
+                    running=state.running,
+                    admitted=state.admitted,
+                    wait_seconds_total=state.wait_total,
+                    wait_seconds_max=state.wait_max,
+                )
+                for name, state in self._classes.items()
+            }
+
+    def queue_wait(self, priority: str) -> float:
+        """Seconds the longest-waiting ``priority`` caller has been queued."""
+        with self._condition:
+            waiting = self._classes[priority].waiting
+            if not waiting:
+                return 0.0
+            return self._clock() - waiting[0].enqueued_at
+
+    def _release(self, state: _ClassState) -> None:
+        state.running -= 1
+        self._running -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        admitted = False
+        while self._running < self._capacity:
+            eligible = [
+                state
+                for state in self._classes.values()
+                if state.waiting and state.running < state.policy.max_concurrency
+            ]
+            if not eligible:
+                break
+            state = min(eligible, key=lambda item: item.tag + 1 / item.policy.weight)
+            self._virtual_time = state.tag
+            state.tag += 1 / state.policy.weight
+            waiter = state.waiting.popleft()
+            waited = self._clock() - waiter.enqueued_at
+            state.running += 1
+            state.admitted += 1
+            state.wait_total += waited
+            state.wait_max = max(state.wait_max, waited)
+            self._running += 1
+            waiter.granted = True
+            admitted = True
+        if admitted:
+            self._condition.notify_all()
@@ -1,3 +1,5 @@
+import uuid
+from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -28,9 +30,16 @@ API_STYLE_TO_RESULT_KEY = {
 
 
 class VideoProcessRequest(BaseModel):
-    video_url: str
+    # Limits match the videojob, videoresult and videotranscript columns.
+    video_url: str = Field(max_length=2048)
     styles: list[str] | None = None
-    output_language: str = Field(default="English")
+    output_language: str = Field(default="English", max_length=64)
+    # Give up after this many seconds; not applied to /video/jobs.
+    deadline_seconds: float | None = Field(default=None, gt=0)
+
+
+class VideoBatchRequest(BaseModel):
+    items: list[VideoProcessRequest] = Field(min_length=1)
 
 
 class VideoProcessResults(BaseModel):
@@ -41,10 +50,21 @@ class VideoProcessResults(BaseModel):
     narrative: str | None = None
 
 
+class VideoProcessTimings(BaseModel):
+    # Milliseconds per pipeline stage, and per style for styles computed now.
+    stages_ms: dict[str, float]
+    styles_ms: dict[str, float]
+    # Hit (true) or miss per cache consulted: result, languages, transcript.
+    cache_hits: dict[str, bool]
+
+
 class VideoProcessMetadata(BaseModel):
     processing_time: float
     language: str
     styles_processed: list[str]
+    cache_hit: bool = False
+    cached_styles: list[str] | None = None
+    timings: VideoProcessTimings | None = None
 
 
 class VideoProcessData(BaseModel):
@@ -60,6 +80,63 @@ class VideoProcessResponse(BaseModel):
     data: VideoProcessData
 
 
+class VideoStyle(BaseModel):
+    style: str
+    api_style: str
+    result_key: str
+
+
+class VideoStylesResponse(BaseModel):
+    status: Literal["success"] = "success"
+    data: list[VideoStyle]
+
+
+class VideoPriorityClassStats(BaseModel):
+    priority: str
+    queued: int
+    running: int
+    admitted: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class VideoSchedulerResponse(BaseModel):
+    status: Literal["success"] = "success"
+    data: list[VideoPriorityClassStats]
+
+
+class VideoAdmissionStats(BaseModel):
+    in_flight: int
+    admitted: int
+    rejected_in_flight: int
+    rejected_queue_wait: int
+
+
+class VideoAdmissionResponse(BaseModel):
+    status: Literal["success"] = "success"
+    data: VideoAdmissionStats
+
+
+VideoJobState = Literal["pending", "running", "succeeded", "failed"]
+
+
+class VideoJobData(BaseModel):
+    job_id: uuid.UUID
+    state: VideoJobState
+    video_url: str
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: VideoProcessData | None = None
+    error: str | None = None
+    error_code: int | None = None
+
+
+class VideoJobResponse(BaseModel):
+    status: Literal["success"] = "success"
+    data: VideoJobData
+
+
 class ErrorResponse(BaseModel):
     status: Literal["error"] = "error"
     error: str
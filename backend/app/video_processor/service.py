@@ -1,16 +1,43 @@
+import contextvars
+import copy
+import logging
+import math
 import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import replace
 from datetime import datetime, timezone
-from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Iterable
+from typing import Any, TypeVar
 from urllib.parse import parse_qs, urlparse
 
-from getoutvideo import GetOutVideoAPI
+from getoutvideo import GetOutVideoAPI, ProcessingConfig, VideoTranscript
+from getoutvideo.prompts import get_prompt_for_style
 
 from app.core.config import settings
+from app.core.tracing import CLIENT, span
+from app.video_processor.cache import (
+    CachedResult,
+    CachedTranscript,
+    ResultCache,
+    ResultKey,
+    TranscriptCache,
+    TranscriptKey,
+    TTLCache,
+)
+from app.video_processor.cancellation import (
+    POLL_SECONDS,
+    CancelToken,
+)
+from app.video_processor.chunking import estimate_tokens, split_into_segments
+from app.video_processor.clients import ClientPool, create_api_client
 from app.video_processor.exceptions import (
+    ERROR_STATUS_CODES,
     ConfigurationError,
+    DeadlineExceededError,
     ExternalServiceError,
+    ProcessingCancelledError,
     ProcessingTimeoutError,
     VideoValidationError,
 )
@@ -21,9 +48,33 @@ from app.video_processor.schemas import (
     VideoProcessData,
     VideoProcessMetadata,
     VideoProcessResults,
+    VideoProcessTimings,
+)
+from app.video_processor.metrics import (
+    CANCELLED,
+    CANCELLED_STYLES,
+    ERRORS,
+    IN_FLIGHT,
+    RequestTimings,
+    collect_timings,
+    record_cache_lookup,
+    time_stage,
+    time_style,
+)
+from app.video_processor.outputs import OutputSink, StyleOutput, default_output_sink
+from app.video_processor.ratelimit import RateLimiter
+from app.video_processor.scheduler import INTERACTIVE, PriorityScheduler
+from app.video_processor.singleflight import AdvisoryLock, SingleFlight
+from app.video_processor.styles import StyleCatalog
+from app.video_processor.transcripts import (
+    TranscriptFetcher,
+    TranscriptProbe,
+    YouTubeTranscriptFetcher,
 )
 
 
+logger = logging.getLogger(__name__)
+
 YOUTUBE_URL_PATTERNS = [
     r"^https?://(www\.)?youtube\.com/watch\?.*v=[^&]+",
     r"^https?://youtu\.be/[^?]+",
@@ -31,164 +82,829 @@ YOUTUBE_URL_PATTERNS = [
     r"^https?://(www\.)?youtube\.com/v/[^?]+",
 ]
 
+# The video_id column of the result and transcript caches.
+MAX_VIDEO_ID_LENGTH = 64
+
+API_TO_REQUEST_STYLE = {value: key for key, value in REQUEST_TO_API_STYLE.items()}
+RESULT_KEY_TO_API_STYLE = {value: key for key, value in API_STYLE_TO_RESULT_KEY.items()}
+
+# Receives (event name, payload) as the pipeline progresses; see process_video.
+VideoEventCallback = Callable[[str, dict[str, Any]], None]
+StyleCallback = Callable[[str, str, str], None]
+
+# Map rounds over partial outputs before a long transcript goes to the reduce.
+MAX_CONDENSE_ROUNDS = 3
+# Completion tokens budgeted per model call, on top of its estimated input.
+OUTPUT_TOKENS_PER_CALL = 2000
+
+S = TypeVar("S")
+T = TypeVar("T")
+
 
 class VideoProcessingService:
-    def __init__(self, api_client: GetOutVideoAPI | None = None) -> None:
+    def __init__(
+        self,
+        api_client: GetOutVideoAPI | None = None,
+        result_cache: ResultCache | None = None,
+        single_flight: SingleFlight[tuple[dict[str, str], str]] | None = None,
+        process_lock: AdvisoryLock | None = None,
+        style_executor: Executor | None = None,
+        transcript_cache: TranscriptCache | None = None,
+        language_cache: TTLCache[str, list[str]] | None = None,
+        transcript_fetcher: TranscriptFetcher | None = None,
+        style_catalog: StyleCatalog | None = None,
+        output_sink: OutputSink | None = None,
+        client_pool: ClientPool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        scheduler: PriorityScheduler | None = None,
+        priority: str = INTERACTIVE,
+    ) -> None:
         self._api_client = api_client
+        self._scheduler = scheduler
+        self._priority = priority
+        self._client_pool = client_pool
+        self._rate_limiter = rate_limiter
+        self._result_cache = result_cache
+        self._single_flight = single_flight
+        self._process_lock = process_lock
+        self._style_executor = style_executor
+        self._transcript_cache = transcript_cache
+        self._language_cache = language_cache
+        self._transcript_fetcher = transcript_fetcher or YouTubeTranscriptFetcher()
+        self._style_catalog = style_catalog
+        self._output_sink = output_sink or default_output_sink()
 
     def process_video(
-        self, video_url: str, styles: list[str] | None, output_language: str
+        self,
+        video_url: str,
+        styles: list[str] | None,
+        output_language: str,
+        on_event: VideoEventCallback | None = None,
+        cancel: CancelToken | None = None,
+        include_timings: bool = False,
+    ) -> VideoProcessData:
+        """Run the pipeline, reporting progress to ``on_event`` if given.
+
+        Events are ``validated``, ``languages`` (after transcript probing) and
+        one ``style`` event per finished style, cached styles first. Once
+        ``cancel`` fires, styles not yet started are skipped, running engine
+        calls are abandoned, and ProcessingCancelledError or
+        DeadlineExceededError is raised. ``include_timings`` adds the stage
+        breakdown to the metadata.
+        """
+        with IN_FLIGHT.labels(self._priority).track_inprogress():
+            try:
+                if not include_timings:
+                    return self._process_video(
+                        video_url, styles, output_language, on_event, cancel
+                    )
+                with collect_timings() as timings:
+                    data = self._process_video(
+                        video_url, styles, output_language, on_event, cancel
+                    )
+                data.metadata.timings = _timings_model(timings)
+                return data
+            except Exception as exc:
+                ERRORS.labels(_error_label(exc)).inc()
+                raise
+
+    def _process_video(
+        self,
+        video_url: str,
+        styles: list[str] | None,
+        output_language: str,
+        on_event: VideoEventCallback | None,
+        cancel: CancelToken | None,
     ) -> VideoProcessData:
         start_time = time.perf_counter()
+        cancel = cancel or CancelToken()
+        with time_stage("validate"):
+            self.validate_request(video_url, styles)
+
+        video_id = _extract_video_id(video_url)
+        _emit(on_event, "validated", {"video_url": video_url, "video_id": video_id})
+        requested_styles = self._requested_api_styles(styles)
+        with time_stage("cache_lookup"):
+            cached = self._lookup_cached_results(
+                video_id, requested_styles, output_language
+            )
+        if self._result_cache is not None and video_id:
+            record_cache_lookup("result", len(cached) == len(requested_styles))
+        for api_style, result in cached.items():
+            _emit_style(on_event, api_style, result.content, result.video_title, True)
+        if cached and len(cached) == len(requested_styles):
+            return self._build_process_data(
+                video_url,
+                {},
+                "",
+                cached,
+                output_language,
+                self._resolve_processed_styles(styles, requested_styles),
+                start_time,
+            )
+
+        delivered: set[str] = set()
+        try:
+            return self._process_uncached(
+                video_url,
+                video_id,
+                styles,
+                output_language,
+                cached,
+                start_time,
+                on_event,
+                cancel,
+                delivered,
+            )
+        except (ProcessingCancelledError, DeadlineExceededError):
+            skipped = [
+                style
+                for style in requested_styles
+                if style not in cached and style not in delivered
+            ]
+            self._record_cancellation(cancel, len(skipped))
+            raise
+
+    def _process_uncached(
+        self,
+        video_url: str,
+        video_id: str | None,
+        styles: list[str] | None,
+        output_language: str,
+        cached: dict[str, CachedResult],
+        start_time: float,
+        on_event: VideoEventCallback | None,
+        cancel: CancelToken,
+        delivered: set[str],
+    ) -> VideoProcessData:
+        cancel.check()
+        with time_stage("probe_languages"):
+            probe = self._probe_transcripts(video_id)
+        if probe is not None and not probe.languages:
+            raise VideoValidationError("No subtitles found for this video.")
+        _emit(
+            on_event,
+            "languages",
+            {"languages": probe.languages if probe is not None else []},
+        )
+        with time_stage("resolve_styles"):
+            selected_styles = self._resolve_styles(styles)
+        cached = {style: cached[style] for style in selected_styles if style in cached}
+        missing_styles = [style for style in selected_styles if style not in cached]
+
+        results: dict[str, str] = {}
+        video_title = ""
+        if missing_styles:
+
+            def on_style(api_style: str, content: str, title: str) -> None:
+                delivered.add(api_style)
+                _emit_style(on_event, api_style, content, title, False)
+
+            results, video_title = self._compute_styles(
+                video_url,
+                video_id,
+                missing_styles,
+                output_language,
+                probe,
+                cancel,
+                on_style,
+            )
+            # Coalesced callers receive every style at once from the leader.
+            for result_key, content in results.items():
+                api_style = RESULT_KEY_TO_API_STYLE[result_key]
+                if api_style not in delivered:
+                    _emit_style(on_event, api_style, content, video_title, False)
+
+        return self._build_process_data(
+            video_url,
+            results,
+            video_title,
+            cached,
+            output_language,
+            self._resolve_processed_styles(styles, selected_styles),
+            start_time,
+        )
+
+    def validate_request(self, video_url: str, styles: list[str] | None) -> None:
         self._validate_video_url(video_url)
         if styles is not None:
             self._validate_styles(styles)
 
-        api = self._get_api_client()
-        _ensure_youtube_transcript_api_compat()
-        available_languages = self._configure_transcript_language_preferences(api, video_url)
-        if available_languages == []:
-            raise VideoValidationError("No subtitles found for this video.")
-        selected_styles = self._resolve_styles(styles, api)
+    def _compute_styles(
+        self,
+        video_url: str,
+        video_id: str | None,
+        api_styles: list[str],
+        output_language: str,
+        probe: TranscriptProbe | None,
+        cancel: CancelToken,
+        on_style: StyleCallback | None = None,
+    ) -> tuple[dict[str, str], str]:
+        def compute() -> tuple[dict[str, str], str]:
+            # Only the leader waits for a scheduler slot and holds a client;
+            # coalesced callers just wait for its result.
+            with self._scheduled(cancel), self._checkout_api_client() as api:
+                return self._compute_styles_exclusive(
+                    api,
+                    video_url,
+                    video_id,
+                    api_styles,
+                    output_language,
+                    probe,
+                    cancel,
+                    on_style,
+                )
 
-        with TemporaryDirectory() as temp_dir:
-            output_dir = Path(temp_dir)
+        if self._single_flight is None:
+            return compute()
+        flight_key = (video_id or video_url, tuple(api_styles), output_language)
+        while True:
             try:
-                api.process_youtube_url(
-                    video_url,
-                    output_dir=output_dir,
-                    styles=selected_styles,
-                    output_language=output_language,
+                outcome, _shared = self._single_flight.do(
+                    flight_key, compute, cancel
+                )
+            except (ProcessingCancelledError, DeadlineExceededError):
+                cancel.check()
+                # The leader was cancelled but this caller was not; take over.
+                continue
+            return outcome
+
+    def _compute_styles_exclusive(
+        self,
+        api: GetOutVideoAPI,
+        video_url: str,
+        video_id: str | None,
+        api_styles: list[str],
+        output_language: str,
+        probe: TranscriptProbe | None,
+        cancel: CancelToken,
+        on_style: StyleCallback | None,
+    ) -> tuple[dict[str, str], str]:
+        # Same key as the single flight, so other styles of the video proceed.
+        styles_key = ",".join(sorted(api_styles))
+        lock_key = f"video:{video_id or video_url}:{styles_key}:{output_language}"
+        lock = (
+            self._process_lock.hold(lock_key, cancel)
+            if self._process_lock is not None
+            else nullcontext()
+        )
+        with lock:
+            # Another worker may have finished these styles while we waited.
+            finished = self._lookup_cached_results(
+                video_id, api_styles, output_language
+            )
+            missing_styles = [style for style in api_styles if style not in finished]
+
+            results: dict[str, str] = {}
+            video_title = ""
+            if missing_styles:
+                cancel.check()
+                with time_stage("fetch_transcript"):
+                    transcripts = self._load_transcripts(video_url, video_id, probe)
+                with time_stage("engine"):
+                    results, video_title = self._run_engine(
+                        api,
+                        transcripts,
+                        missing_styles,
+                        output_language,
+                        cancel,
+                        on_style,
+                    )
+                if not results:
+                    raise ExternalServiceError("No processed results were returned.")
+                self._store_results(video_id, results, video_title, output_language)
+
+        for style, cached in finished.items():
+            results[API_STYLE_TO_RESULT_KEY[style]] = cached.content
+            video_title = video_title or cached.video_title
+        return results, video_title
+
+    def _load_transcripts(
+        self,
+        video_url: str,
+        video_id: str | None,
+        probe: TranscriptProbe | None,
+    ) -> list[VideoTranscript]:
+        """Acquire the caption text once and wrap it for the engine.
+
+        Replaces getoutvideo's own extraction, which would list and fetch the
+        captions again. The transcript cache is keyed by the preferred caption
+        language, which is always the one fetched when the probe succeeded.
+        """
+        if not video_id:
+            raise VideoValidationError("Invalid YouTube URL.")
+        languages = _choose_language_priority(probe.languages) if probe else None
+        key = (
+            TranscriptKey(video_id=video_id, language=languages[0])
+            if self._transcript_cache is not None and languages
+            else None
+        )
+        cached = (
+            self._transcript_cache.get(key)
+            if key is not None and self._transcript_cache is not None
+            else None
+        )
+        if key is not None:
+            record_cache_lookup("transcript", cached is not None)
+        if cached is None:
+            with span(
+                "transcript.fetch",
+                CLIENT,
+                video_id=video_id,
+                language=languages[0] if languages else None,
+            ):
+                fetched = self._transcript_fetcher.fetch(video_id, languages, probe)
+            cached = CachedTranscript(
+                video_title=self._transcript_fetcher.video_title(video_url),
+                text=fetched.text,
+            )
+            if self._transcript_cache is not None and fetched.text:
+                self._transcript_cache.put(
+                    TranscriptKey(video_id=video_id, language=fetched.language),
+                    cached,
+                )
+        if not cached.text:
+            return []
+        return [
+            VideoTranscript(
+                title=cached.video_title or video_id,
+                url=video_url,
+                transcript_text=cached.text,
+                source="youtube_api",
+            )
+        ]
+
+    def _run_engine(
+        self,
+        api: GetOutVideoAPI,
+        transcripts: list[VideoTranscript],
+        api_styles: list[str],
+        output_language: str,
+        cancel: CancelToken,
+        on_style: StyleCallback | None = None,
+    ) -> tuple[dict[str, str], str]:
+        # Equivalent to process_youtube_url, but on a transcript the service
+        # already acquired, and each style runs as its own task so finished
+        # styles can be reported, concurrently when a style executor is set.
+        if not transcripts:
+            return {}, ""
+
+        results: dict[str, str] = {}
+        video_title = transcripts[0].title
+        condensed = self._condense_transcripts(
+            api, transcripts[0], api_styles, output_language, cancel
+        )
+        api_styles = [api_style for api_style in api_styles if api_style in condensed]
+
+        def run_style(api_style: str) -> list[StyleOutput]:
+            with time_style(api_style):
+                return self._run_style(
+                    api, [condensed[api_style]], api_style, output_language, cancel
                 )
-            except TimeoutError as exc:
-                raise ProcessingTimeoutError("Video processing timed out.") from exc
-            except Exception as exc:  # noqa: BLE001 - external library surface
-                raise ExternalServiceError("Video processing failed.") from exc
 
-            results, video_title = self._parse_outputs(output_dir)
+        limit = min(settings.VIDEO_STYLE_CONCURRENCY, len(api_styles))
+        if self._style_executor is None or limit <= 1:
+            outcomes: Iterable[list[StyleOutput]] = map(run_style, api_styles)
+        else:
+            outcomes = _fan_out(
+                self._style_executor, run_style, api_styles, limit, cancel
+            )
+        for outputs in outcomes:
+            for output in outputs:
+                result_key = API_STYLE_TO_RESULT_KEY.get(output.style)
+                if not result_key:
+                    continue
+                video_title = video_title or output.title
+                results[result_key] = output.text
+                if on_style is not None:
+                    on_style(output.style, output.text, video_title)
+        return results, video_title
 
-        if not results:
-            raise ExternalServiceError("No processed results were returned.")
+    def _run_style(
+        self,
+        api: GetOutVideoAPI,
+        transcripts: list[VideoTranscript],
+        api_style: str,
+        output_language: str,
+        cancel: CancelToken,
+    ) -> list[StyleOutput]:
+        cancel.check()
+        processing_config = replace(
+            api.config.processing_config,
+            styles=[api_style],
+            output_language=output_language,
+        )
+        engine = _isolated_engine(api, processing_config)
+        self._reserve_model_budget(transcripts, api_style, processing_config, cancel)
+        with cancel.on_cancel(lambda: _stop_engine(engine)):
+            outputs = self._output_sink.collect(
+                lambda output_dir: _call_engine(
+                    engine.process_with_ai, transcripts, output_dir
+                )
+            )
+        # A stopped engine returns whatever it finished; drop it.
+        cancel.check()
+        return outputs
+
+    def _reserve_model_budget(
+        self,
+        transcripts: list[VideoTranscript],
+        api_style: str,
+        processing_config: ProcessingConfig,
+        cancel: CancelToken,
+    ) -> None:
+        """Wait until the shared rate limits allow the engine's model calls.
+
+        The engine makes one call per ``chunk_size`` words of each transcript,
+        each sending the style prompt with its chunk.
+        """
+        if self._rate_limiter is None:
+            return
+        prompt_tokens = estimate_tokens(get_prompt_for_style(api_style))
+        requests = 0
+        tokens = 0
+        for transcript in transcripts:
+            words = len(transcript.transcript_text.split())
+            calls = max(1, math.ceil(words / processing_config.chunk_size))
+            requests += calls
+            tokens += estimate_tokens(transcript.transcript_text)
+            tokens += calls * (prompt_tokens + OUTPUT_TOKENS_PER_CALL)
+        with span("ratelimit.acquire", requests=requests, tokens=tokens) as wait_span:
+            waited = self._rate_limiter.acquire(
+                requests=requests, tokens=tokens, cancel=cancel
+            )
+            if wait_span is not None:
+                wait_span.set_attribute("wait_seconds", waited)
+
+    def _condense_transcripts(
+        self,
+        api: GetOutVideoAPI,
+        transcript: VideoTranscript,
+        api_styles: list[str],
+        output_language: str,
+        cancel: CancelToken,
+    ) -> dict[str, VideoTranscript]:
+        """Map step for transcripts too long for one model call.
+
+        Each segment of at most VIDEO_CHUNK_MAX_TOKENS is rewritten in every
+        style on its own, segments running concurrently on the style pool.
+        The partial outputs, in order, become that style's transcript; the
+        final style pass over them is the reduce. Rounds repeat while the
+        partials are still too long, up to MAX_CONDENSE_ROUNDS. A style with
+        a segment the engine returned nothing for is left out, like a style
+        whose own run returns nothing.
+        """
+        condensed = dict.fromkeys(api_styles, transcript)
+        max_tokens = settings.VIDEO_CHUNK_MAX_TOKENS
+        for _round in range(MAX_CONDENSE_ROUNDS):
+            tasks = [
+                (api_style, index, segment)
+                for api_style in api_styles
+                for index, segment in enumerate(
+                    split_into_segments(
+                        condensed[api_style].transcript_text, max_tokens
+                    )
+                )
+            ]
+            counts = Counter(api_style for api_style, _index, _segment in tasks)
+            tasks = [task for task in tasks if counts[task[0]] > 1]
+            if not tasks:
+                break
+
+            def run_segment(
+                task: tuple[str, int, str],
+            ) -> tuple[str, int, str | None]:
+                api_style, index, segment = task
+                part = replace(transcript, transcript_text=segment, word_count=None)
+                outputs = self._run_style(
+                    api, [part], api_style, output_language, cancel
+                )
+                if not outputs:
+                    return api_style, index, None
+                return api_style, index, _strip_engine_header(outputs[0].text, part)
+
+            limit = min(settings.VIDEO_CHUNK_CONCURRENCY, len(tasks))
+            if self._style_executor is None or limit <= 1:
+                partials: Iterable[tuple[str, int, str | None]] = map(
+                    run_segment, tasks
+                )
+            else:
+                partials = _fan_out(
+                    self._style_executor, run_segment, tasks, limit, cancel
+                )
+            parts: dict[str, dict[int, str]] = {}
+            failed: set[str] = set()
+            for api_style, index, text in partials:
+                if text is None:
+                    failed.add(api_style)
+                else:
+                    parts.setdefault(api_style, {})[index] = text
+            for api_style in failed:
+                logger.warning(
+                    "Dropping %s: a transcript segment returned no output", api_style
+                )
+                del condensed[api_style]
+                parts.pop(api_style, None)
+            api_styles = [style for style in api_styles if style not in failed]
+            for api_style, texts in parts.items():
+                condensed[api_style] = replace(
+                    transcript,
+                    transcript_text="\n\n".join(texts[i] for i in sorted(texts)),
+                    word_count=None,
+                )
+        return condensed
+
+    @time_stage("build_response")
+    def _build_process_data(
+        self,
+        video_url: str,
+        results: dict[str, str],
+        video_title: str,
+        cached: dict[str, CachedResult],
+        output_language: str,
+        styles_processed: list[str],
+        start_time: float,
+    ) -> VideoProcessData:
+        merged = {
+            API_STYLE_TO_RESULT_KEY[style]: result.content
+            for style, result in cached.items()
+        }
+        merged.update(results)
+        if not video_title:
+            video_title = next(
+                (
+                    result.video_title
+                    for result in cached.values()
+                    if result.video_title
+                ),
+                "",
+            )
+        cached_styles = [API_TO_REQUEST_STYLE.get(style, style) for style in cached]
 
         processing_time = round(time.perf_counter() - start_time, 2)
         processed_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        styles_processed = self._resolve_processed_styles(styles, selected_styles)
-
         return VideoProcessData(
             video_url=video_url,
             video_title=video_title or video_url,
             processed_at=processed_at,
-            results=VideoProcessResults(**results),
+            results=VideoProcessResults(**merged),
             metadata=VideoProcessMetadata(
                 processing_time=processing_time,
                 language=output_language,
                 styles_processed=styles_processed,
+                cache_hit=bool(cached) and not results,
+                cached_styles=cached_styles or None,
             ),
         )
 
-    def _get_api_client(self) -> GetOutVideoAPI:
+    def _requested_api_styles(self, styles: list[str] | None) -> list[str]:
+        if styles is None:
+            return list(REQUEST_TO_API_STYLE.values())
+        return [REQUEST_TO_API_STYLE[style] for style in styles]
+
+    def _lookup_cached_results(
+        self, video_id: str | None, api_styles: list[str], output_language: str
+    ) -> dict[str, CachedResult]:
+        if self._result_cache is None or not video_id:
+            return {}
+        keys = [
+            ResultKey(
+                video_id=video_id, style=api_style, output_language=output_language
+            )
+            for api_style in api_styles
+        ]
+        found = self._result_cache.get_many(keys)
+        return {key.style: found[key] for key in keys if key in found}
+
+    def _store_results(
+        self,
+        video_id: str | None,
+        results: dict[str, str],
+        video_title: str,
+        output_language: str,
+    ) -> None:
+        if self._result_cache is None or not video_id:
+            return
+        self._result_cache.put_many(
+            {
+                ResultKey(
+                    video_id=video_id,
+                    style=RESULT_KEY_TO_API_STYLE[result_key],
+                    output_language=output_language,
+                ): CachedResult(video_title=video_title, content=content)
+                for result_key, content in results.items()
+            }
+        )
+
+    def _scheduled(self, cancel: CancelToken) -> AbstractContextManager[None]:
+        if self._scheduler is None:
+            return nullcontext()
+        return self._scheduler.slot(self._priority, cancel)
+
+    def _record_cancellation(self, cancel: CancelToken, styles_skipped: int) -> None:
+        reason = cancel.reason
+        if reason is None:
+            return
+        logger.info(
+            "Video processing cancelled (%s), %d styles skipped",
+            reason,
+            styles_skipped,
+        )
+        CANCELLED.labels(reason=reason).inc()
+        CANCELLED_STYLES.labels(reason=reason).inc(styles_skipped)
+
+    @contextmanager
+    def _checkout_api_client(self) -> Iterator[GetOutVideoAPI]:
         if self._api_client is not None:
-            return self._api_client
-        if not settings.OPENAI_API_KEY:
+            yield self._api_client
+        elif self._client_pool is not None:
+            with self._client_pool.checkout() as api:
+                yield api
+        elif not settings.OPENAI_API_KEY:
             raise ConfigurationError("OPENAI_API_KEY is not configured.")
-        return GetOutVideoAPI(openai_api_key=settings.OPENAI_API_KEY)
+        else:
+            yield create_api_client(settings.OPENAI_API_KEY, settings.OPENAI_BASE_URL)
 
     def _validate_video_url(self, video_url: str) -> None:
         if not any(_matches_pattern(video_url, pattern) for pattern in YOUTUBE_URL_PATTERNS):
             raise VideoValidationError("Invalid YouTube URL.")
+        video_id = _extract_video_id(video_url)
+        if video_id is not None and len(video_id) > MAX_VIDEO_ID_LENGTH:
+            raise VideoValidationError("Invalid YouTube URL.")
 
     def _validate_styles(self, styles: Iterable[str]) -> None:
         invalid = [style for style in styles if style not in ALLOWED_STYLES]
         if invalid:
             raise VideoValidationError(f"Invalid styles: {', '.join(invalid)}.")
 
-    def _resolve_styles(
-        self, styles: list[str] | None, api: GetOutVideoAPI
-    ) -> list[str]:
-        try:
-            available_styles = set(api.get_available_styles())
-        except Exception as exc:  # noqa: BLE001 - external library surface
-            raise ExternalServiceError("Failed to retrieve available styles.") from exc
-        if styles is None:
-            resolved = [
-                api_style
-                for api_style in REQUEST_TO_API_STYLE.values()
-                if api_style in available_styles
-            ]
-            if not resolved:
-                raise ExternalServiceError("No compatible styles returned by the API.")
-            return resolved
-
-        api_styles = [REQUEST_TO_API_STYLE[style] for style in styles]
-        unsupported = [style for style in api_styles if style not in available_styles]
-        if unsupported:
-            raise VideoValidationError(
-                f"Styles not supported by the API: {', '.join(unsupported)}."
-            )
-        return api_styles
+    def _resolve_styles(self, styles: list[str] | None) -> list[str]:
+        catalog = self._style_catalog
+        if catalog is None:
+            with self._checkout_api_client() as api:
+                try:
+                    catalog = StyleCatalog(api.get_available_styles())
+                except Exception as exc:  # noqa: BLE001 - external library surface
+                    raise ExternalServiceError(
+                        "Failed to retrieve available styles."
+                    ) from exc
+        return catalog.resolve(styles)
 
     def _resolve_processed_styles(
         self, styles: list[str] | None, selected_styles: list[str]
     ) -> list[str]:
         if styles is not None:
             return styles
-        api_to_request = {value: key for key, value in REQUEST_TO_API_STYLE.items()}
-        return [api_to_request.get(style, style) for style in selected_styles]
-
-    def _configure_transcript_language_preferences(
-        self, api: GetOutVideoAPI, video_url: str
-    ) -> list[str] | None:
-        config = getattr(api, "config", None)
-        transcript_config = getattr(config, "transcript_config", None)
-        if transcript_config is None:
-            return None
+        return [API_TO_REQUEST_STYLE.get(style, style) for style in selected_styles]
 
-        video_id = _extract_video_id(video_url)
+    def _probe_transcripts(self, video_id: str | None) -> TranscriptProbe | None:
+        """Probe caption languages, caching answers but not lookup failures."""
         if not video_id:
-            transcript_config.transcript_languages = None
             return None
+        if self._language_cache is not None:
+            cached = self._language_cache.get(video_id)
+            record_cache_lookup("languages", cached is not None)
+            if cached is not None:
+                return TranscriptProbe(languages=list(cached))
+
+        with span("transcript.probe", CLIENT, video_id=video_id):
+            probe = self._transcript_fetcher.probe(video_id)
+        if self._language_cache is not None and probe is not None:
+            ttl = (
+                settings.VIDEO_LANGUAGE_CACHE_TTL_SECONDS
+                if probe.languages
+                else settings.VIDEO_LANGUAGE_NEGATIVE_TTL_SECONDS
+            )
+            self._language_cache.set(video_id, list(probe.languages), ttl)
+        return probe
 
-        available_languages = _fetch_available_transcript_languages(video_id)
-        if available_languages is None:
-            transcript_config.transcript_languages = None
-            return None
-        transcript_config.transcript_languages = _choose_language_priority(
-            available_languages
-        )
-        return available_languages
 
-    def _parse_outputs(self, output_dir: Path) -> tuple[dict[str, str], str]:
-        results: dict[str, str] = {}
-        video_title = ""
-        for file_path in sorted(output_dir.iterdir()):
-            if not file_path.is_file():
-                continue
-            api_style = self._detect_style(file_path.name)
-            if not api_style:
-                continue
-            result_key = API_STYLE_TO_RESULT_KEY.get(api_style)
-            if not result_key:
-                continue
-            content = file_path.read_text(encoding="utf-8").strip()
-            results[result_key] = content
-            if not video_title:
-                video_title = self._extract_title(file_path.stem, api_style)
-        return results, video_title
+def _timings_model(timings: RequestTimings) -> VideoProcessTimings:
+    return VideoProcessTimings(
+        stages_ms={stage: round(ms, 1) for stage, ms in timings.stages_ms.items()},
+        styles_ms={
+            API_TO_REQUEST_STYLE.get(style, style): round(ms, 1)
+            for style, ms in timings.styles_ms.items()
+        },
+        cache_hits=dict(timings.cache_hits),
+    )
 
-    def _detect_style(self, filename: str) -> str | None:
-        lower_name = filename.lower()
-        for api_style in API_STYLE_TO_RESULT_KEY:
-            if api_style.lower() in lower_name:
-                return api_style
-        return None
 
-    def _extract_title(self, stem: str, api_style: str) -> str:
-        lower_stem = stem.lower()
-        index = lower_stem.find(api_style.lower())
-        if index == -1:
-            return _cleanup_title(stem)
-        title_part = stem[:index].rstrip(" -_")
-        return _cleanup_title(title_part or stem)
+def _error_label(exc: Exception) -> str:
+    """Exception class name for known failures; one label for the rest."""
+    if isinstance(exc, tuple(ERROR_STATUS_CODES)):
+        return type(exc).__name__
+    return "UnexpectedError"
+
+
+def _call_engine(func: Callable[..., T], *args: Any) -> T:
+    try:
+        return func(*args)
+    except TimeoutError as exc:
+        raise ProcessingTimeoutError("Video processing timed out.") from exc
+    except Exception as exc:  # noqa: BLE001 - external library surface
+        raise ExternalServiceError("Video processing failed.") from exc
+
+
+def _strip_engine_header(text: str, transcript: VideoTranscript) -> str:
+    header = f"# {transcript.title}\n\n**Original Video URL:** {transcript.url}"
+    return text.removeprefix(header).strip()
+
+
+def _stop_engine(engine: GetOutVideoAPI) -> None:
+    # The engine checks this flag before each chunk's model call.
+    processor = getattr(engine, "ai_processor", None)
+    if processor is not None:
+        processor.cancel()
+
+
+def _isolated_engine(
+    api: GetOutVideoAPI, processing_config: ProcessingConfig
+) -> GetOutVideoAPI:
+    """Return a shallow copy of ``api`` with its own config.
+
+    process_with_ai(config=...) swaps the config of the instance it is called
+    on and builds a new AI processor, and with it a new OpenAI client. The copy
+    instead gets a copy of the processor bound to its config that keeps the
+    original's OpenAI client, so concurrent styles share warm connections.
+    """
+    engine = copy.copy(api)
+    engine.config = replace(api.config, processing_config=processing_config)
+    processor = getattr(api, "ai_processor", None)
+    if processor is not None:
+        engine.ai_processor = copy.copy(processor)
+        engine.ai_processor.config = engine.config
+    return engine
+
+
+def _fan_out(
+    executor: Executor,
+    func: Callable[[S], T],
+    items: Iterable[S],
+    limit: int,
+    cancel: CancelToken | None = None,
+) -> Iterator[T]:
+    """Yield ``func(item)`` results as they finish, with at most ``limit`` running.
+
+    On the first failure, or once ``cancel`` fires, tasks not yet started are
+    cancelled and the error is raised to the caller. Running tasks are left
+    to finish on their own.
+    """
+    remaining = iter(items)
+    running: set[Future[T]] = set()
+
+    def submit_next() -> None:
+        for item in remaining:
+            # Carry the request's timings over to the worker thread.
+            context = contextvars.copy_context()
+            running.add(executor.submit(context.run, func, item))
+            return
+
+    for _ in range(limit):
+        submit_next()
+    try:
+        while running:
+            if cancel is not None:
+                cancel.check()
+            done, _pending = wait(
+                running,
+                timeout=POLL_SECONDS if cancel is not None else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                running.discard(future)
+                result = future.result()
+                submit_next()
+                yield result
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def _emit(
+    on_event: VideoEventCallback | None, name: str, payload: dict[str, Any]
+) -> None:
+    if on_event is not None:
+        on_event(name, payload)
+
+
+def _emit_style(
+    on_event: VideoEventCallback | None,
+    api_style: str,
+    content: str,
+    video_title: str,
+    cached: bool,
+) -> None:
+    _emit(
+        on_event,
+        "style",
+        {
+            "style": API_TO_REQUEST_STYLE.get(api_style, api_style),
+            "result_key": API_STYLE_TO_RESULT_KEY[api_style],
+            "video_title": video_title,
+            "content": content,
+            "cached": cached,
+        },
+    )
 
 
 def _matches_pattern(value: str, pattern: str) -> bool:
@@ -197,10 +913,6 @@ def _matches_pattern(value: str, pattern: str) -> bool:
     return re.match(pattern, value) is not None
 
 
-def _cleanup_title(value: str) -> str:
-    return value.replace("_", " ").replace("-", " ").strip()
-
-
 def _extract_video_id(video_url: str) -> str | None:
     parsed = urlparse(video_url)
     host = parsed.netloc.lower()
@@ -218,25 +930,6 @@ def _extract_video_id(video_url: str) -> str | None:
     return None
 
 
-def _fetch_available_transcript_languages(video_id: str) -> list[str] | None:
-    try:
-        from youtube_transcript_api import YouTubeTranscriptApi
-    except Exception:  # noqa: BLE001 - optional runtime dependency
-        return None
-
-    try:
-        transcript_list = YouTubeTranscriptApi().list(video_id)
-    except Exception:  # noqa: BLE001 - network and upstream errors
-        return None
-
-    codes: list[str] = []
-    for transcript in transcript_list:
-        code = getattr(transcript, "language_code", "")
-        if code:
-            codes.append(code)
-    return codes
-
-
 def _choose_language_priority(available_languages: list[str]) -> list[str] | None:
     if not available_languages:
         return None
@@ -254,18 +947,3 @@ def _choose_language_priority(available_languages: list[str]) -> list[str] | Non
 
     remainder = [code for code in unique_languages if code not in prioritized]
     return prioritized + remainder
-
-
-def _ensure_youtube_transcript_api_compat() -> None:
-    try:
-        from youtube_transcript_api import YouTubeTranscriptApi
-    except Exception:  # noqa: BLE001 - optional runtime dependency
-        return
-
-    if hasattr(YouTubeTranscriptApi, "list_transcripts"):
-        return
-
-    def _list_transcripts(video_id: str):
-        return YouTubeTranscriptApi().list(video_id)
-
-    YouTubeTranscriptApi.list_transcripts = staticmethod(_list_transcripts)
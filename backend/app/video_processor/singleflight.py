@@ -0,0 +1,119 @@
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future, wait
+from contextlib import contextmanager
+from typing import Generic, TypeVar
+
+from sqlalchemy import Connection, Engine, text
+
+from app.video_processor.cancellation import POLL_SECONDS, CancelToken
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one call per key at a time within this process.
+
+    The first caller for a key executes ``fn``; callers arriving while it runs
+    wait on the same future and receive its result or exception. A follower
+    whose ``cancel`` fires stops waiting by raising; the leader carries on.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[T]] = {}
+
+    def do(
+        self, key: Hashable, fn: Callable[[], T], cancel: CancelToken | None = None
+    ) -> tuple[T, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+        if not leader:
+            while cancel is not None and not future.done():
+                cancel.check()
+                wait([future], timeout=POLL_SECONDS)
+            return future.result(), True
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+class AdvisoryLock:
+    """Cross-process mutual exclusion backed by Postgres advisory locks.
+
+    Each held lock pins one pooled connection for its duration; waiters
+    retry every ``POLL_SECONDS`` without holding one, and a cancelled
+    ``cancel`` ends the wait by raising. When the database is unreachable the
+    lock is skipped so processing still proceeds.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+
+    @contextmanager
+    def hold(self, key: str, cancel: CancelToken | None = None) -> Iterator[None]:
+        lock_id = _advisory_lock_id(key)
+        connection = self._acquire(lock_id, cancel)
+        try:
+            yield
+        finally:
+            if connection is not None:
+                self._release(connection, lock_id)
+
+    def _acquire(self, lock_id: int, cancel: CancelToken | None) -> Connection | None:
+        while True:
+            try:
+                connection = self._engine.connect()
+            except Exception:  # noqa: BLE001 - coordination is best effort
+                logger.warning("Advisory lock unavailable, continuing", exc_info=True)
+                return None
+            try:
+                locked = connection.execute(
+                    text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": lock_id}
+                ).scalar()
+            except Exception:  # noqa: BLE001 - coordination is best effort
+                logger.warning("Advisory lock unavailable, continuing", exc_info=True)
+                connection.close()
+                return None
+            if locked:
+                return connection
+            # Give the connection back to the pool while another session holds it.
+            connection.close()
+            if cancel is not None:
+                cancel.sleep(POLL_SECONDS)
+            else:
+                time.sleep(POLL_SECONDS)
+
+    def _release(self, connection: Connection, lock_id: int) -> None:
+        try:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": lock_id}
+            )
+        except Exception:  # noqa: BLE001 - drop the session to free the lock
+            logger.warning("Advisory unlock failed", exc_info=True)
+            connection.invalidate()
+        finally:
+            connection.close()
+
+
+def _advisory_lock_id(key: str) -> int:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
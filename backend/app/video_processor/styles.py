@@ -0,0 +1,53 @@
+from collections.abc import Iterable
+
+from app.video_processor.exceptions import ExternalServiceError, VideoValidationError
+from app.video_processor.schemas import (
+    API_STYLE_TO_RESULT_KEY,
+    REQUEST_TO_API_STYLE,
+    VideoStyle,
+)
+
+
+class StyleCatalog:
+    """Request styles supported by the installed engine.
+
+    The engine's style set is static for a library version, so the catalog
+    is resolved once at startup instead of on every request.
+    """
+
+    def __init__(self, available_styles: Iterable[str]) -> None:
+        available = set(available_styles)
+        self.styles = [
+            VideoStyle(
+                style=style,
+                api_style=api_style,
+                result_key=API_STYLE_TO_RESULT_KEY[api_style],
+            )
+            for style, api_style in REQUEST_TO_API_STYLE.items()
+            if api_style in available
+        ]
+        self._supported = {style.style for style in self.styles}
+
+    def resolve(self, styles: list[str] | None) -> list[str]:
+        """Map request styles to API styles, defaulting to every supported one."""
+        if styles is None:
+            if not self.styles:
+                raise ExternalServiceError("No compatible styles returned by the API.")
+            return [style.api_style for style in self.styles]
+
+        unsupported = [
+            REQUEST_TO_API_STYLE[style]
+            for style in styles
+            if style not in self._supported
+        ]
+        if unsupported:
+            raise VideoValidationError(
+                f"Styles not supported by the API: {', '.join(unsupported)}."
+            )
+        return [REQUEST_TO_API_STYLE[style] for style in styles]
+
+
+def load_style_catalog() -> StyleCatalog:
+    from getoutvideo import get_available_styles
+
+    return StyleCatalog(get_available_styles())
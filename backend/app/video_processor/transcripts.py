@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from app.video_processor.exceptions import ExternalServiceError, VideoValidationError
+
+
+@dataclass(frozen=True)
+class TranscriptProbe:
+    """Caption languages of a video, plus the listing they came from.
+
+    ``listing`` is the library's transcript list when the probe went to
+    YouTube; it is reused by the fetch so the video is listed only once.
+    """
+
+    languages: list[str]
+    listing: Any = None
+
+
+@dataclass(frozen=True)
+class FetchedTranscript:
+    language: str
+    text: str
+
+
+class TranscriptFetcher(Protocol):
+    def probe(self, video_id: str) -> TranscriptProbe | None: ...
+
+    def fetch(
+        self, video_id: str, languages: list[str] | None, probe: TranscriptProbe | None
+    ) -> FetchedTranscript: ...
+
+    def video_title(self, video_url: str) -> str: ...
+
+
+class YouTubeTranscriptFetcher:
+    """Lists and fetches captions with youtube_transcript_api.
+
+    ``probe`` returns ``None`` on any error and an empty language list for
+    videos without subtitles. ``fetch`` raises VideoValidationError when no
+    caption track exists and ExternalServiceError for anything else.
+    """
+
+    def probe(self, video_id: str) -> TranscriptProbe | None:
+        try:
+            from youtube_transcript_api import YouTubeTranscriptApi
+        except Exception:  # noqa: BLE001 - optional runtime dependency
+            return None
+
+        try:
+            listing = YouTubeTranscriptApi().list(video_id)
+        except Exception:  # noqa: BLE001 - network and upstream errors
+            return None
+
+        codes: list[str] = []
+        for transcript in listing:
+            code = getattr(transcript, "language_code", "")
+            if code:
+                codes.append(code)
+        return TranscriptProbe(languages=codes, listing=listing)
+
+    def fetch(
+        self, video_id: str, languages: list[str] | None, probe: TranscriptProbe | None
+    ) -> FetchedTranscript:
+        try:
+            from youtube_transcript_api import (
+                NoTranscriptFound,
+                TranscriptsDisabled,
+                YouTubeTranscriptApi,
+            )
+        except Exception as exc:  # noqa: BLE001 - optional runtime dependency
+            raise ExternalServiceError("Failed to fetch the video transcript.") from exc
+
+        try:
+            listing = probe.listing if probe is not None else None
+            if listing is None:
+                listing = YouTubeTranscriptApi().list(video_id)
+            if languages:
+                transcript = listing.find_transcript(languages)
+            else:
+                transcript = next(iter(listing))
+            fetched = transcript.fetch()
+        except (NoTranscriptFound, TranscriptsDisabled, StopIteration) as exc:
+            raise VideoValidationError("No subtitles found for this video.") from exc
+        except Exception as exc:  # noqa: BLE001 - network and upstream errors
+            raise ExternalServiceError("Failed to fetch the video transcript.") from exc
+
+        text = " ".join(snippet.text for snippet in fetched)
+        return FetchedTranscript(language=transcript.language_code, text=text)
+
+    def video_title(self, video_url: str) -> str:
+        try:
+            from pytubefix import YouTube
+
+            return str(YouTube(video_url).title or "")
+        except Exception:  # noqa: BLE001 - the title is best effort
+            return ""
@@ -0,0 +1,157 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from types import SimpleNamespace
+
+from getoutvideo import ProcessingResult, VideoTranscript
+from getoutvideo.ai_processor import AIProcessor
+from getoutvideo.config import APIConfig, ProcessingConfig
+from getoutvideo.prompts import get_prompt_for_style
+
+from app.video_processor.chunking import estimate_tokens
+from app.video_processor.schemas import REQUEST_TO_API_STYLE
+from app.video_processor.transcripts import FetchedTranscript, TranscriptProbe
+
+
+class InjectedFailure(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """How the fake engine's model calls behave.
+
+    A call for a style takes its ``style_latency`` seconds, or
+    ``default_latency`` for styles not listed, spread uniformly by ``jitter``
+    as a fraction of it. Each call fails with probability ``failure_rate``.
+    Draws come from one generator seeded with ``seed``.
+    """
+
+    default_latency: float = 0.2
+    style_latency: dict[str, float] = field(default_factory=dict)
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    seed: int = 0
+
+
+class FakeGetOutVideoAPI:
+    """GetOutVideoAPI whose model calls are answered locally.
+
+    Everything else is the real AIProcessor: prompts, chunking and the output
+    files the service parses, so only the provider is simulated. A call for a
+    style answers "{style} in {language}" after the latency ``model`` draws
+    for it, or raises InjectedFailure. Clients sharing ``model``, including
+    shallow copies, share its counters.
+    """
+
+    def __init__(
+        self,
+        profile: EngineProfile | None = None,
+        model: "SimulatedModel | None" = None,
+    ) -> None:
+        self.profile = profile or EngineProfile(default_latency=0.0)
+        self.model = model or SimulatedModel(self.profile)
+        self.config = APIConfig(openai_api_key="fake-key")
+        self._lock = threading.Lock()
+
+    @property
+    def style_calls(self) -> list[str]:
+        return self.model.style_calls
+
+    def get_available_styles(self) -> list[str]:
+        return list(REQUEST_TO_API_STYLE.values())
+
+    def process_with_ai(
+        self,
+        transcripts: list[VideoTranscript],
+        output_dir: str,
+        config: ProcessingConfig | None = None,
+    ) -> list[ProcessingResult]:
+        processing = config or self.config.processing_config
+        processor = AIProcessor(replace(self.config, processing_config=processing))
+        processor.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=_Completions(self.model, processing))
+        )
+        results: list[ProcessingResult] = processor.process_transcripts(
+            transcripts, output_dir
+        )
+        return results
+
+
+class SimulatedModel:
+    """Draws latencies and failures for model calls, shared by all clients.
+
+    ``style_calls`` lists the style of every call, in the order they started.
+    """
+
+    def __init__(self, profile: EngineProfile) -> None:
+        self.profile = profile
+        self._random = random.Random(profile.seed)
+        self._lock = threading.Lock()
+        self.style_calls: list[str] = []
+        self.failures = 0
+
+    @property
+    def calls(self) -> int:
+        return len(self.style_calls)
+
+    def call(self, style: str) -> None:
+        base = self.profile.style_latency.get(style, self.profile.default_latency)
+        with self._lock:
+            spread = self._random.uniform(-self.profile.jitter, self.profile.jitter)
+            failed = self._random.random() < self.profile.failure_rate
+            self.style_calls.append(style)
+            self.failures += failed
+        time.sleep(max(0.0, base * (1 + spread)))
+        if failed:
+            raise InjectedFailure(f"Injected failure for {style}.")
+
+
+class _Completions:
+    def __init__(self, model: SimulatedModel, processing: ProcessingConfig) -> None:
+        self._model = model
+        self._language = processing.output_language
+        self._prompts = {
+            style: get_prompt_for_style(style).replace("[Language]", self._language)
+            for style in processing.styles
+        }
+
+    def create(self, *, messages: list[dict[str, str]], **_: object) -> SimpleNamespace:
+        prompt = messages[0]["content"]
+        style = next(
+            style for style, text in self._prompts.items() if prompt.startswith(text)
+        )
+        self._model.call(style)
+        content = f"{style} in {self._language}"
+        usage = SimpleNamespace(
+            prompt_tokens=estimate_tokens(prompt),
+            completion_tokens=estimate_tokens(content),
+        )
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+class SyntheticTranscriptFetcher:
+    """Captions of ``words`` words for any video, after ``latency`` seconds."""
+
+    def __init__(self, words: int = 1500, latency: float = 0.0) -> None:
+        self.text = " ".join(f"word{index % 100}" for index in range(words))
+        self.latency = latency
+
+    def probe(self, _video_id: str) -> TranscriptProbe | None:
+        return TranscriptProbe(languages=["en"])
+
+    def fetch(
+        self,
+        _video_id: str,
+        languages: list[str] | None,
+        _probe: TranscriptProbe | None,
+    ) -> FetchedTranscript:
+        time.sleep(self.latency)
+        return FetchedTranscript(
+            language=languages[0] if languages else "en", text=self.text
+        )
+
+    def video_title(self, video_url: str) -> str:
+        return f"Benchmark {video_url.rsplit('=', 1)[-1]}"
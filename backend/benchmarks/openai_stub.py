@@ -0,0 +1,264 @@
+"""OpenAI-compatible chat completions server for offline load tests.
+
+    python -m benchmarks.openai_stub --port 8090 --tokens-per-second 80 \\
+        --time-to-first-token 0.4 --rate-limit-rate 0.02
+
+Then start the backend with OPENAI_BASE_URL=http://localhost:8090/v1 and any
+OPENAI_API_KEY, or pass --openai-base-url to benchmarks.video_process.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from app.video_processor.chunking import estimate_tokens
+
+# Streamed tokens are sent in batches at least this far apart.
+MIN_CHUNK_SECONDS = 0.01
+
+_WORDS = (
+    "the video explains how each part of the system fits together and why "
+    "the results matter for anyone who wants to learn more about it"
+).split()
+
+
+@dataclass(frozen=True)
+class StubConfig:
+    """How the stub answers.
+
+    A completion has ``output_tokens`` tokens, fewer when the request's
+    ``max_completion_tokens`` or ``max_tokens`` is lower. The first token
+    comes after ``time_to_first_token`` seconds and the rest at
+    ``tokens_per_second``; 0 sends them all at once. Each request is answered
+    429 with probability ``rate_limit_rate``, asking the caller to retry
+    after ``retry_after`` seconds.
+    """
+
+    tokens_per_second: float = 100.0
+    time_to_first_token: float = 0.2
+    output_tokens: int = 200
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    seed: int = 0
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    rate_limited: int = 0
+    streamed: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+def create_stub_app(config: StubConfig) -> FastAPI:
+    app = FastAPI(title="OpenAI stub")
+    stats = StubStats()
+    rng = random.Random(config.seed)
+    app.state.stub_stats = stats
+
+    @app.get("/v1/models")
+    async def list_models() -> dict[str, Any]:
+        return {
+            "object": "list",
+            "data": [
+                {
+                    "id": "gpt-4o-mini",
+                    "object": "model",
+                    "created": 0,
+                    "owned_by": "stub",
+                }
+            ],
+        }
+
+    @app.post("/v1/chat/completions")
+    async def create_chat_completion(request: Request) -> Response:
+        body = await request.json()
+        stats.requests += 1
+        if rng.random() < config.rate_limit_rate:
+            stats.rate_limited += 1
+            return _rate_limited(config.retry_after)
+
+        limit = body.get("max_completion_tokens") or body.get("max_tokens")
+        tokens = min(config.output_tokens, limit) if limit else config.output_tokens
+        completion = _Completion(
+            model=body.get("model", "stub"),
+            prompt_tokens=sum(
+                estimate_tokens(_message_text(message))
+                for message in body.get("messages", [])
+            ),
+            tokens=tokens,
+            finish_reason="length" if tokens < config.output_tokens else "stop",
+        )
+        stats.prompt_tokens += completion.prompt_tokens
+        stats.completion_tokens += tokens
+        if body.get("stream"):
+            stats.streamed += 1
+            include_usage = bool(
+                (body.get("stream_options") or {}).get("include_usage")
+            )
+            return StreamingResponse(
+                _stream(completion, config, include_usage),
+                media_type="text/event-stream",
+            )
+        await asyncio.sleep(
+            config.time_to_first_token + _generation_seconds(tokens - 1, config)
+        )
+        return JSONResponse(completion.response())
+
+    @app.get("/stats")
+    async def read_stats() -> dict[str, int]:
+        return asdict(stats)
+
+    return app
+
+
+class _Completion:
+    def __init__(
+        self, model: str, prompt_tokens: int, tokens: int, finish_reason: str
+    ) -> None:
+        self.id = f"chatcmpl-{uuid.uuid4().hex}"
+        self.created = int(time.time())
+        self.model = model
+        self.prompt_tokens = prompt_tokens
+        self.tokens = tokens
+        self.finish_reason = finish_reason
+
+    def text(self, start: int = 0, stop: int | None = None) -> str:
+        end = self.tokens if stop is None else stop
+        return "".join(f"{_WORDS[index % len(_WORDS)]} " for index in range(start, end))
+
+    def usage(self) -> dict[str, int]:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.tokens,
+            "total_tokens": self.prompt_tokens + self.tokens,
+        }
+
+    def response(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "object": "chat.completion",
+            "created": self.created,
+            "model": self.model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.text().strip()},
+                    "finish_reason": self.finish_reason,
+                }
+            ],
+            "usage": self.usage(),
+        }
+
+    def chunk(
+        self,
+        delta: dict[str, str],
+        finish_reason: str | None = None,
+        usage: dict[str, int] | None = None,
+    ) -> str:
+        data: dict[str, Any] = {
+            "id": self.id,
+            "object": "chat.completion.chunk",
+            "created": self.created,
+            "model": self.model,
+            "choices": (
+                []
+                if usage is not None
+                else [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            ),
+        }
+        if usage is not None:
+            data["usage"] = usage
+        return f"data: {json.dumps(data)}\n\n"
+
+
+async def _stream(
+    completion: _Completion, config: StubConfig, include_usage: bool
+) -> AsyncIterator[str]:
+    yield completion.chunk({"role": "assistant", "content": ""})
+    await asyncio.sleep(config.time_to_first_token)
+    batch = (
+        completion.tokens
+        if config.tokens_per_second <= 0
+        else max(1, math.ceil(config.tokens_per_second * MIN_CHUNK_SECONDS))
+    )
+    for start in range(0, completion.tokens, batch):
+        if start:
+            await asyncio.sleep(_generation_seconds(batch, config))
+        stop = min(start + batch, completion.tokens)
+        yield completion.chunk({"content": completion.text(start, stop)})
+    yield completion.chunk({}, finish_reason=completion.finish_reason)
+    if include_usage:
+        yield completion.chunk({}, usage=completion.usage())
+    yield "data: [DONE]\n\n"
+
+
+def _rate_limited(retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={
+            "error": {
+                "message": "Rate limit reached for requests (stub).",
+                "type": "requests",
+                "param": None,
+                "code": "rate_limit_exceeded",
+            }
+        },
+        headers={
+            "retry-after": str(math.ceil(retry_after)),
+            "retry-after-ms": str(int(retry_after * 1000)),
+            "x-ratelimit-remaining-requests": "0",
+        },
+    )
+
+
+def _generation_seconds(tokens: int, config: StubConfig) -> float:
+    if config.tokens_per_second <= 0:
+        return 0.0
+    return max(tokens, 0) / config.tokens_per_second
+
+
+def _message_text(message: dict[str, Any]) -> str:
+    content = message.get("content") or ""
+    if isinstance(content, str):
+        return content
+    return "".join(part.get("text", "") for part in content)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--tokens-per-second", type=float, default=100.0)
+    parser.add_argument("--time-to-first-token", type=float, default=0.2)
+    parser.add_argument("--output-tokens", type=int, default=200)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = StubConfig(
+        tokens_per_second=args.tokens_per_second,
+        time_to_first_token=args.time_to_first_token,
+        output_tokens=args.output_tokens,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    uvicorn.run(create_stub_app(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
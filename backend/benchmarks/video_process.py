@@ -0,0 +1,451 @@
+"""Throughput and latency of POST /video/process at increasing concurrency.
+
+Runs the real app in process, with a fake engine standing in for OpenAI, or
+the real one calling --openai-base-url, and synthetic captions standing in
+for YouTube:
+
+    python -m benchmarks.video_process --concurrency 1,4,16,64 \\
+        --latency 0.5 --jitter 0.3 --output results.json --baseline before.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+
+from app.core.bulkhead import VIDEO, bulkheads
+from app.core.config import settings
+from app.main import (
+    app,
+    init_video_admission,
+    init_video_language_cache,
+    init_video_output_sink,
+    init_video_scheduler,
+    init_video_style_executor,
+)
+from app.video_processor.clients import ClientPool, create_client_pool
+from app.video_processor.scheduler import INTERACTIVE
+from app.video_processor.schemas import REQUEST_TO_API_STYLE
+from app.video_processor.singleflight import SingleFlight
+from benchmarks.engine import (
+    EngineProfile,
+    FakeGetOutVideoAPI,
+    SimulatedModel,
+    SyntheticTranscriptFetcher,
+)
+
+PROCESS_PATH = f"{settings.API_V1_STR}/video/process"
+
+# Startup hooks that need nothing outside the process.
+_STARTUP_HOOKS: list[Callable[[], None]] = [
+    init_video_output_sink,
+    init_video_language_cache,
+    init_video_scheduler,
+    init_video_admission,
+    init_video_style_executor,
+]
+# Left unset, so every request runs the whole pipeline without a database.
+_DISABLED_STATE = [
+    "getoutvideo_api",
+    "video_result_cache",
+    "video_transcript_cache",
+    "video_process_lock",
+    "video_rate_limiter",
+    "video_job_runner",
+]
+_STATE_KEYS = [
+    "getoutvideo_client_pool",
+    "video_transcript_fetcher",
+    "video_single_flight",
+    "video_style_catalog",
+    "video_output_sink",
+    "video_language_cache",
+    "video_scheduler",
+    "video_admission",
+    "video_style_executor",
+    *_DISABLED_STATE,
+]
+_UNSET = object()
+
+
+@contextmanager
+def benchmark_app(
+    profile: EngineProfile,
+    fetcher: SyntheticTranscriptFetcher,
+    openai_base_url: str | None = None,
+) -> Iterator[SimulatedModel]:
+    """Wire ``app.state`` to the fake engine, restoring it afterwards.
+
+    With ``openai_base_url``, the real engine calls that server instead, such
+    as ``benchmarks.openai_stub``, and ``profile`` is unused.
+    """
+    saved = {key: getattr(app.state, key, _UNSET) for key in _STATE_KEYS}
+    model = SimulatedModel(profile)
+    if openai_base_url is None:
+        pool = ClientPool(
+            lambda: FakeGetOutVideoAPI(profile, model),
+            max_idle=settings.VIDEO_CLIENT_POOL_SIZE,
+        )
+    else:
+        pool = create_client_pool(
+            "benchmark",
+            max_idle=settings.VIDEO_CLIENT_POOL_SIZE,
+            base_url=openai_base_url,
+        )
+    for hook in _STARTUP_HOOKS:
+        hook()
+    for key in _DISABLED_STATE:
+        setattr(app.state, key, None)
+    app.state.video_style_catalog = None
+    app.state.getoutvideo_client_pool = pool
+    app.state.video_transcript_fetcher = fetcher
+    app.state.video_single_flight = SingleFlight()
+    try:
+        yield model
+    finally:
+        app.state.video_style_executor.shutdown(wait=False, cancel_futures=True)
+        pool.close()
+        for key, value in saved.items():
+            if value is _UNSET:
+                delattr(app.state, key)
+            else:
+                setattr(app.state, key, value)
+
+
+class SaturationSampler:
+    """Samples the video worker threads and the scheduler while a level runs."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self._interval = interval
+        self._pool = bulkheads[VIDEO]
+        self._samples: list[tuple[int, int, int, int]] = []
+        self._pool_start = self._pool.snapshot()
+        self._scheduler_start = app.state.video_scheduler.snapshot()[INTERACTIVE]
+
+    async def run(self) -> None:
+        while True:
+            pool = self._pool.snapshot()
+            scheduler = app.state.video_scheduler.snapshot()[INTERACTIVE]
+            self._samples.append(
+                (pool.running, pool.queued, scheduler.running, scheduler.queued)
+            )
+            await asyncio.sleep(self._interval)
+
+    def summary(self) -> dict[str, Any]:
+        pool = self._pool.snapshot()
+        scheduler = app.state.video_scheduler.snapshot()[INTERACTIVE]
+        samples = self._samples or [(0, 0, 0, 0)]
+        threads = pool.max_concurrency
+        return {
+            "threadpool": {
+                "threads": threads,
+                "peak_running": max(sample[0] for sample in samples),
+                "mean_busy_ratio": _mean([sample[0] / threads for sample in samples]),
+                "saturated_ratio": _mean(
+                    [float(sample[0] >= threads) for sample in samples]
+                ),
+                "peak_queued": max(sample[1] for sample in samples),
+                "mean_wait_ms": _mean_wait_ms(
+                    pool.wait_seconds_total - self._pool_start.wait_seconds_total,
+                    pool.admitted - self._pool_start.admitted,
+                ),
+                "rejected": pool.rejected - self._pool_start.rejected,
+            },
+            "scheduler": {
+                "slots": min(
+                    settings.VIDEO_SCHEDULER_CAPACITY,
+                    settings.VIDEO_INTERACTIVE_MAX_CONCURRENCY,
+                ),
+                "peak_running": max(sample[2] for sample in samples),
+                "peak_queued": max(sample[3] for sample in samples),
+                "mean_wait_ms": _mean_wait_ms(
+                    scheduler.wait_seconds_total
+                    - self._scheduler_start.wait_seconds_total,
+                    scheduler.admitted - self._scheduler_start.admitted,
+                ),
+            },
+        }
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    concurrency: int,
+    requests: int,
+    styles: list[str],
+    first_video: int = 0,
+) -> dict[str, Any]:
+    """Send ``requests`` requests from ``concurrency`` closed-loop callers.
+
+    Every request names a different video, so no cache or coalescing helps.
+    Latency percentiles cover successful requests only.
+    """
+    indexes = iter(range(requests))
+    latencies: list[float] = []
+    statuses: Counter[int] = Counter()
+
+    async def caller() -> None:
+        for index in indexes:
+            payload = {
+                "video_url": _video_url(first_video + index),
+                "styles": styles,
+                "output_language": "English",
+            }
+            started = time.perf_counter()
+            response = await client.post(PROCESS_PATH, json=payload)
+            elapsed = time.perf_counter() - started
+            statuses[response.status_code] += 1
+            if response.status_code == 200:
+                latencies.append(elapsed)
+
+    sampler = SaturationSampler()
+    sampling = asyncio.ensure_future(sampler.run())
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(caller() for _ in range(concurrency)))
+    finally:
+        sampling.cancel()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "succeeded": len(latencies),
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+        "elapsed_seconds": elapsed,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": _percentile_ms(latencies, 50),
+            "p95": _percentile_ms(latencies, 95),
+            "p99": _percentile_ms(latencies, 99),
+            "mean": _mean(latencies) * 1000 if latencies else None,
+            "max": latencies[-1] * 1000 if latencies else None,
+        },
+        **sampler.summary(),
+    }
+
+
+async def run_benchmark(
+    concurrency_levels: list[int],
+    requests_per_level: int,
+    styles: list[str],
+    profile: EngineProfile,
+    transcript_words: int = 1500,
+    transcript_latency: float = 0.0,
+    warmup: int = 0,
+    openai_base_url: str | None = None,
+) -> dict[str, Any]:
+    """Run every level in turn and return the report."""
+    fetcher = SyntheticTranscriptFetcher(transcript_words, transcript_latency)
+    levels = []
+    with benchmark_app(profile, fetcher, openai_base_url) as model:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", timeout=None
+        ) as client:
+            if warmup:
+                await run_level(client, 1, warmup, styles, first_video=0)
+            first_video = warmup
+            for concurrency in concurrency_levels:
+                levels.append(
+                    await run_level(
+                        client, concurrency, requests_per_level, styles, first_video
+                    )
+                )
+                first_video += requests_per_level
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "git_commit": _git_commit(),
+        },
+        "settings": {
+            name: getattr(settings, name)
+            for name in (
+                "BULKHEAD_VIDEO_THREADS",
+                "BULKHEAD_VIDEO_QUEUE",
+                "video_admission_max_in_flight",
+                "VIDEO_SCHEDULER_CAPACITY",
+                "VIDEO_INTERACTIVE_MAX_CONCURRENCY",
+                "VIDEO_STYLE_POOL_SIZE",
+                "VIDEO_STYLE_CONCURRENCY",
+                "VIDEO_CLIENT_POOL_SIZE",
+            )
+        },
+        "engine": (
+            asdict(profile)
+            if openai_base_url is None
+            else {"openai_base_url": openai_base_url}
+        ),
+        "transcript": {"words": transcript_words, "latency": transcript_latency},
+        "styles": styles,
+        "requests_per_level": requests_per_level,
+        "model_calls": model.calls,
+        "model_failures": model.failures,
+        "levels": levels,
+    }
+
+
+def compare(baseline: dict[str, Any], report: dict[str, Any]) -> list[str]:
+    """Throughput and p95 change per concurrency level both runs measured."""
+    before = {level["concurrency"]: level for level in baseline["levels"]}
+    lines = []
+    for level in report["levels"]:
+        old = before.get(level["concurrency"])
+        if old is None:
+            continue
+        lines.append(
+            f"c={level['concurrency']:<4} "
+            f"throughput {_change(old['throughput_rps'], level['throughput_rps'])}  "
+            f"p95 {_change(old['latency_ms']['p95'], level['latency_ms']['p95'])}"
+        )
+    return lines
+
+
+def format_report(report: dict[str, Any]) -> list[str]:
+    lines = [
+        f"{'conc':>5} {'ok':>5} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'busy':>5} {'queue':>5} {'errors'}"
+    ]
+    for level in report["levels"]:
+        latency = level["latency_ms"]
+        errors = {
+            code: count
+            for code, count in level["status_codes"].items()
+            if code != "200"
+        }
+        lines.append(
+            f"{level['concurrency']:>5} {level['succeeded']:>5} "
+            f"{level['throughput_rps']:>8.2f} {_ms(latency['p50']):>9} "
+            f"{_ms(latency['p95']):>9} {_ms(latency['p99']):>9} "
+            f"{level['threadpool']['mean_busy_ratio']:>5.0%} "
+            f"{level['threadpool']['peak_queued']:>5} {errors or ''}"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,2,4,8,16,32")
+    parser.add_argument("--requests", type=int, default=64, help="per level")
+    parser.add_argument("--styles", default="Summary")
+    parser.add_argument(
+        "--latency", type=float, default=0.2, help="seconds per model call"
+    )
+    parser.add_argument(
+        "--style-latency",
+        default="",
+        help="per style overrides, e.g. 'Summary=0.3,Educational=1.2'",
+    )
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--transcript-words", type=int, default=1500)
+    parser.add_argument("--transcript-latency", type=float, default=0.0)
+    parser.add_argument("--warmup", type=int, default=4)
+    parser.add_argument(
+        "--openai-base-url",
+        help="use the real engine against this server, e.g. benchmarks.openai_stub",
+    )
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report of a run to compare with")
+    args = parser.parse_args(argv)
+
+    styles = [style.strip() for style in args.styles.split(",") if style.strip()]
+    profile = EngineProfile(
+        default_latency=args.latency,
+        style_latency=_parse_style_latency(args.style_latency),
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    report = asyncio.run(
+        run_benchmark(
+            [int(value) for value in args.concurrency.split(",")],
+            args.requests,
+            styles,
+            profile,
+            transcript_words=args.transcript_words,
+            transcript_latency=args.transcript_latency,
+            warmup=args.warmup,
+            openai_base_url=args.openai_base_url,
+        )
+    )
+    lines = format_report(report)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            lines += ["", f"vs {args.baseline}:", *compare(json.load(file), report)]
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        lines.append(f"Report written to {args.output}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _parse_style_latency(value: str) -> dict[str, float]:
+    """Engine style names to seconds, from request style names."""
+    latencies = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        style, _, seconds = item.partition("=")
+        latencies[REQUEST_TO_API_STYLE.get(style, style)] = float(seconds)
+    return latencies
+
+
+def _video_url(index: int) -> str:
+    return f"https://www.youtube.com/watch?v=bm{index:09d}"
+
+
+def _percentile_ms(ordered: list[float], percent: float) -> float | None:
+    """Nearest-rank percentile of sorted seconds, in milliseconds."""
+    if not ordered:
+        return None
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1] * 1000
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def _mean_wait_ms(wait_seconds: float, admitted: int) -> float:
+    return wait_seconds / admitted * 1000 if admitted else 0.0
+
+
+def _change(old: float | None, new: float | None) -> str:
+    if not old or new is None:
+        return "n/a"
+    return f"{old:.1f} -> {new:.1f} ({(new - old) / old:+.1%})"
+
+
+def _ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    main()
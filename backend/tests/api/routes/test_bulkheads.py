@@ -0,0 +1,57 @@
+from fastapi.testclient import TestClient
+
+from app.core import bulkhead
+from app.core.bulkhead import VIDEO, Bulkhead, BulkheadFullError
+from app.core.config import settings
+
+
+class FullBulkhead(Bulkhead):
+    def admit(self) -> None:
+        raise BulkheadFullError(self.name)
+
+
+def test_read_bulkheads(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/utils/bulkheads/", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [item["name"] for item in data] == ["video", "auth", "crud"]
+    assert data[0]["max_concurrency"] == settings.BULKHEAD_VIDEO_THREADS
+    assert data[0]["max_queue"] == settings.BULKHEAD_VIDEO_QUEUE
+
+
+def test_read_bulkheads_requires_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    anonymous = client.get(f"{settings.API_V1_STR}/utils/bulkheads/")
+    normal = client.get(
+        f"{settings.API_V1_STR}/utils/bulkheads/", headers=normal_user_token_headers
+    )
+
+    assert anonymous.status_code == 401
+    assert normal.status_code == 403
+
+
+def test_saturated_video_bulkhead_rejects_video_only(
+    client: TestClient, superuser_token_headers: dict[str, str], monkeypatch
+) -> None:
+    monkeypatch.setitem(bulkhead.bulkheads, VIDEO, FullBulkhead(VIDEO, 1))
+
+    response = client.post(
+        f"{settings.API_V1_STR}/video/process",
+        json={"video_url": "https://www.youtube.com/watch?v=abc123"},
+    )
+    items = client.get(f"{settings.API_V1_STR}/items/", headers=superuser_token_headers)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(settings.BULKHEAD_RETRY_AFTER_SECONDS)
+    assert response.json() == {
+        "status": "error",
+        "error": "The video worker pool is saturated, retry later.",
+        "code": 503,
+    }
+    assert items.status_code == 200
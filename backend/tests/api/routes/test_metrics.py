@@ -0,0 +1,10 @@
+from fastapi.testclient import TestClient
+
+
+def test_read_metrics(client: TestClient) -> None:
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE video_stage_seconds histogram" in response.text
+    assert "# TYPE video_requests_in_flight gauge" in response.text
@@ -0,0 +1,96 @@
+from fastapi.testclient import TestClient
+
+from app.api.routes.video import get_video_admission, get_video_service
+from app.core.config import settings
+from app.main import app
+from app.video_processor.admission import AdmissionController
+from app.video_processor.exceptions import ExternalServiceError
+from app.video_processor.scheduler import INTERACTIVE
+
+
+def test_read_video_admission(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/video/admission", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "success"
+    assert set(body["data"]) == {
+        "in_flight",
+        "admitted",
+        "rejected_in_flight",
+        "rejected_queue_wait",
+    }
+
+
+def test_read_video_admission_requires_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    anonymous = client.get(f"{settings.API_V1_STR}/video/admission")
+    normal = client.get(
+        f"{settings.API_V1_STR}/video/admission", headers=normal_user_token_headers
+    )
+
+    assert anonymous.status_code == 401
+    assert normal.status_code == 403
+
+
+def test_video_process_rejected_when_overloaded(client: TestClient) -> None:
+    admission = AdmissionController(
+        max_in_flight=1, max_queue_wait_seconds=0, retry_after_seconds=7
+    )
+    admission.admit(INTERACTIVE)
+
+    class FailingService:
+        def process_video(self, **_kwargs):
+            raise AssertionError("overloaded requests must not be processed")
+
+    app.dependency_overrides[get_video_admission] = lambda: admission
+    app.dependency_overrides[get_video_service] = lambda: FailingService()
+    try:
+        response = client.post(
+            f"{settings.API_V1_STR}/video/process",
+            json={"video_url": "https://www.youtube.com/watch?v=abc123"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+    assert response.json() == {
+        "status": "error",
+        "error": "Video processing is overloaded, retry later.",
+        "code": 503,
+    }
+    assert admission.snapshot().rejected_in_flight == 1
+
+
+def test_video_process_releases_admission(client: TestClient) -> None:
+    admission = AdmissionController(
+        max_in_flight=1, max_queue_wait_seconds=0, retry_after_seconds=1
+    )
+
+    class FailingService:
+        def process_video(self, **_kwargs):
+            raise ExternalServiceError("Upstream failed.")
+
+    app.dependency_overrides[get_video_admission] = lambda: admission
+    app.dependency_overrides[get_video_service] = lambda: FailingService()
+    try:
+        responses = [
+            client.post(
+                f"{settings.API_V1_STR}/video/process",
+                json={"video_url": "https://www.youtube.com/watch?v=abc123"},
+            )
+            for _ in range(2)
+        ]
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [response.status_code for response in responses] == [502, 502]
+    stats = admission.snapshot()
+    assert stats.in_flight == 0
+    assert stats.admitted == 2
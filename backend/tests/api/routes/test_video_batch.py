@@ -0,0 +1,111 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api.routes.video import get_bulk_video_service
+from app.core.config import settings
+from app.main import app
+from app.video_processor.exceptions import ExternalServiceError
+from app.video_processor.service import VideoProcessingService
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+
+def test_batch_streams_one_line_per_item(client: TestClient) -> None:
+    api = FakeVideoApi()
+    fetcher = FakeTranscriptFetcher(title="Batched")
+    service = VideoProcessingService(api_client=api, transcript_fetcher=fetcher)
+    app.dependency_overrides[get_bulk_video_service] = lambda: service
+    items = [
+        {"video_url": "https://youtu.be/abc123", "styles": ["Summary"]},
+        {"video_url": "https://example.com/video", "styles": ["Summary"]},
+        {"video_url": "https://www.youtube.com/watch?v=abc123", "styles": ["Summary"]},
+        {"video_url": "https://youtu.be/def456", "styles": ["Educational"]},
+    ]
+    try:
+        response = client.post(
+            f"{settings.API_V1_STR}/video/process/batch", json={"items": items}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = {
+        line["index"]: line
+        for line in map(json.loads, response.text.strip().splitlines())
+    }
+    assert sorted(lines) == [0, 1, 2, 3]
+    assert lines[1] == {
+        "index": 1,
+        "status": "error",
+        "error": "Invalid YouTube URL.",
+        "code": 400,
+    }
+    assert lines[0]["status"] == lines[2]["status"] == "success"
+    assert lines[0]["data"] == lines[2]["data"]
+    assert lines[3]["data"]["results"]["educational"].endswith("Educational in English")
+    # Both abc123 items share one computation.
+    assert len(fetcher.fetch_calls) == 2
+    assert sorted(api.style_calls) == ["Educational", "Summary"]
+
+
+def test_batch_shares_items_with_reordered_styles_and_other_deadlines(
+    client: TestClient,
+) -> None:
+    calls = []
+
+    class SlowService:
+        def process_video(self, *, video_url, styles, output_language, cancel):
+            calls.append(styles)
+            cancel.sleep(0.3)
+            raise ExternalServiceError("Upstream failed.")
+
+    app.dependency_overrides[get_bulk_video_service] = lambda: SlowService()
+    items = [
+        {
+            "video_url": "https://youtu.be/abc123",
+            "styles": ["Summary", "Educational"],
+            "deadline_seconds": 0.1,
+        },
+        {
+            "video_url": "https://youtu.be/abc123",
+            "styles": ["Educational", "Summary"],
+            "deadline_seconds": 5,
+        },
+    ]
+    try:
+        response = client.post(
+            f"{settings.API_V1_STR}/video/process/batch", json={"items": items}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    lines = [json.loads(line) for line in response.text.strip().splitlines()]
+    assert len(calls) == 1
+    # The group runs under the longest deadline, so neither item times out.
+    assert [line["code"] for line in lines] == [502, 502]
+
+
+def test_batch_rejects_oversized_requests(client: TestClient, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "VIDEO_BATCH_MAX_ITEMS", 2)
+    items = [{"video_url": "https://youtu.be/abc123"}] * 3
+
+    response = client.post(
+        f"{settings.API_V1_STR}/video/process/batch", json={"items": items}
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "status": "error",
+        "error": "Batch must contain at most 2 items.",
+        "code": 400,
+    }
+
+
+def test_batch_requires_items(client: TestClient) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/video/process/batch", json={"items": []}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["status"] == "error"
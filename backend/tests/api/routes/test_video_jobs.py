@@ -0,0 +1,125 @@
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes.video import get_video_job_runner
+from app.core.config import settings
+from app.main import app
+from app.video_processor.jobs import VideoJobRunner
+from tests.video_processor.test_jobs import FakeJobStore, FakeService
+
+
+def _fake_runner(store: FakeJobStore) -> VideoJobRunner:
+    return VideoJobRunner(store, lambda: FakeService(), max_workers=1)
+
+
+def test_create_and_read_video_job(client: TestClient) -> None:
+    store = FakeJobStore()
+    runner = _fake_runner(store)
+    app.dependency_overrides[get_video_job_runner] = lambda: runner
+    try:
+        response = client.post(
+            f"{settings.API_V1_STR}/video/jobs",
+            json={"video_url": "https://youtu.be/abc123", "styles": ["Summary"]},
+        )
+        assert response.status_code == 202
+        job_id = response.json()["data"]["job_id"]
+        assert response.json()["data"]["state"] in {"pending", "running", "succeeded"}
+
+        deadline = time.monotonic() + 5
+        while True:
+            response = client.get(f"{settings.API_V1_STR}/video/jobs/{job_id}")
+            state = response.json()["data"]["state"]
+            if state == "succeeded" or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+    finally:
+        app.dependency_overrides.clear()
+        runner.shutdown()
+
+    assert response.status_code == 200
+    content = response.json()
+    assert content["status"] == "success"
+    assert content["data"]["state"] == "succeeded"
+    assert content["data"]["result"]["results"]["summary"] == "Summary text"
+
+
+def test_create_video_job_rejects_invalid_url(client: TestClient) -> None:
+    store = FakeJobStore()
+    runner = _fake_runner(store)
+    app.dependency_overrides[get_video_job_runner] = lambda: runner
+    try:
+        response = client.post(
+            f"{settings.API_V1_STR}/video/jobs",
+            json={"video_url": "https://example.com/not-youtube"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+        runner.shutdown()
+
+    assert response.status_code == 400
+    assert "Invalid YouTube URL" in response.json()["error"]
+    assert store.jobs == {}
+
+
+@pytest.mark.parametrize(
+    ("payload", "error"),
+    [
+        (
+            {"video_url": "https://youtu.be/abc123", "output_language": "x" * 65},
+            "output_language: String should have at most 64 characters",
+        ),
+        (
+            {"video_url": "https://youtu.be/" + "a" * 2048},
+            "video_url: String should have at most 2048 characters",
+        ),
+        (
+            {"video_url": "https://youtu.be/" + "a" * 65},
+            "Invalid YouTube URL.",
+        ),
+    ],
+)
+def test_create_video_job_rejects_values_too_long_to_store(
+    client: TestClient, payload: dict[str, str], error: str
+) -> None:
+    store = FakeJobStore()
+    runner = _fake_runner(store)
+    app.dependency_overrides[get_video_job_runner] = lambda: runner
+    try:
+        response = client.post(f"{settings.API_V1_STR}/video/jobs", json=payload)
+    finally:
+        app.dependency_overrides.clear()
+        runner.shutdown()
+
+    assert response.status_code == 400
+    assert response.json() == {"status": "error", "error": error, "code": 400}
+    assert store.jobs == {}
+
+
+def test_read_unknown_video_job(client: TestClient) -> None:
+    runner = _fake_runner(FakeJobStore())
+    app.dependency_overrides[get_video_job_runner] = lambda: runner
+    try:
+        response = client.get(f"{settings.API_V1_STR}/video/jobs/{uuid.uuid4()}")
+    finally:
+        app.dependency_overrides.clear()
+        runner.shutdown()
+
+    assert response.status_code == 404
+    assert response.json() == {
+        "status": "error",
+        "error": "Video job not found.",
+        "code": 404,
+    }
+
+
+def test_read_video_job_rejects_malformed_id(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/video/jobs/not-a-uuid")
+
+    assert response.status_code == 400
+    content = response.json()
+    assert content["status"] == "error"
+    assert content["code"] == 400
+    assert content["error"].startswith("path.job_id: ")
@@ -1,14 +1,18 @@
 from fastapi.testclient import TestClient
+from prometheus_client.parser import text_string_to_metric_families
 
 from app.api.routes.video import get_video_service
 from app.core.config import settings
 from app.main import app
+from app.video_processor.cancellation import DEADLINE
 from app.video_processor.exceptions import ExternalServiceError, ProcessingTimeoutError
 from app.video_processor.schemas import (
     VideoProcessData,
     VideoProcessMetadata,
     VideoProcessResults,
 )
+from app.video_processor.service import VideoProcessingService
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
 
 
 def _build_response(
@@ -39,7 +43,9 @@ def test_video_process_success(
     }
 
     class FakeService:
-        def process_video(self, video_url: str, styles: list[str], output_language: str):
+        def process_video(
+            self, video_url: str, styles: list[str], output_language: str, **_kwargs
+        ):
             return _build_response(video_url, output_language, styles)
 
     app.dependency_overrides[get_video_service] = lambda: FakeService()
@@ -64,7 +70,13 @@ def test_video_process_defaults_output_language(client: TestClient) -> None:
     captured: dict[str, str] = {}
 
     class FakeService:
-        def process_video(self, video_url: str, styles: list[str] | None, output_language: str):
+        def process_video(
+            self,
+            video_url: str,
+            styles: list[str] | None,
+            output_language: str,
+            **_kwargs,
+        ):
             captured["output_language"] = output_language
             styles_processed = styles or ["Summary"]
             return _build_response(video_url, output_language, styles_processed)
@@ -118,8 +130,9 @@ def test_video_process_configuration_error(
     client: TestClient, monkeypatch
 ) -> None:
     monkeypatch.setattr(settings, "OPENAI_API_KEY", None)
-    if hasattr(app.state, "getoutvideo_api"):
-        delattr(app.state, "getoutvideo_api")
+    for name in ("getoutvideo_api", "getoutvideo_client_pool"):
+        if hasattr(app.state, name):
+            delattr(app.state, name)
 
     payload = {
         "video_url": "https://www.youtube.com/watch?v=abc123",
@@ -186,3 +199,63 @@ def test_video_process_timeout_error(client: TestClient) -> None:
     content = response.json()
     assert content["status"] == "error"
     assert content["error"] == "Timed out."
+
+
+def _cancellations(client: TestClient, reason: str) -> dict[str, float]:
+    counts: dict[str, float] = {}
+    for family in text_string_to_metric_families(client.get("/metrics").text):
+        for sample in family.samples:
+            if sample.labels.get("reason") == reason:
+                counts[sample.name] = sample.value
+    return counts
+
+
+def test_video_process_enforces_the_request_deadline(client: TestClient) -> None:
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(style_delay=0.5),
+        transcript_fetcher=FakeTranscriptFetcher(),
+    )
+    before = _cancellations(client, DEADLINE)
+    payload = {
+        "video_url": "https://www.youtube.com/watch?v=abc123",
+        "styles": ["Summary", "Educational", "Balanced"],
+        "deadline_seconds": 0.2,
+    }
+
+    app.dependency_overrides[get_video_service] = lambda: service
+    try:
+        response = client.post(f"{settings.API_V1_STR}/video/process", json=payload)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 422
+    assert response.json()["error"] == "Video processing deadline exceeded."
+    after = _cancellations(client, DEADLINE)
+    assert after["video_cancelled_requests_total"] == (
+        before.get("video_cancelled_requests_total", 0) + 1
+    )
+    assert after["video_cancelled_styles_skipped_total"] == (
+        before.get("video_cancelled_styles_skipped_total", 0) + 3
+    )
+
+
+def test_video_process_includes_timings_on_request(client: TestClient) -> None:
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(), transcript_fetcher=FakeTranscriptFetcher()
+    )
+    payload = {"video_url": "https://www.youtube.com/watch?v=abc123"}
+
+    app.dependency_overrides[get_video_service] = lambda: service
+    try:
+        timed = client.post(
+            f"{settings.API_V1_STR}/video/process?timings=true", json=payload
+        )
+        untimed = client.post(f"{settings.API_V1_STR}/video/process", json=payload)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert timed.status_code == 200
+    timings = timed.json()["data"]["metadata"]["timings"]
+    assert set(timings) == {"stages_ms", "styles_ms", "cache_hits"}
+    assert "Summary" in timings["styles_ms"]
+    assert "timings" not in untimed.json()["data"]["metadata"]
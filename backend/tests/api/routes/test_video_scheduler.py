@@ -0,0 +1,36 @@
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+
+def test_read_video_scheduler(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/video/scheduler", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "success"
+    assert [item["priority"] for item in body["data"]] == ["interactive", "bulk"]
+    assert set(body["data"][0]) == {
+        "priority",
+        "queued",
+        "running",
+        "admitted",
+        "wait_seconds_total",
+        "wait_seconds_max",
+    }
+
+
+def test_read_video_scheduler_requires_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    anonymous = client.get(f"{settings.API_V1_STR}/video/scheduler")
+    normal = client.get(
+        f"{settings.API_V1_STR}/video/scheduler", headers=normal_user_token_headers
+    )
+
+    assert anonymous.status_code == 401
+    assert normal.status_code == 403
@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes.video import _video_event_stream, get_video_service
+from app.core.config import settings
+from app.main import app
+from app.video_processor.exceptions import ExternalServiceError
+from app.video_processor.schemas import VideoProcessRequest
+from app.video_processor.service import VideoProcessingService
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+
+def _parse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_emits_stage_and_style_events(client: TestClient) -> None:
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(),
+        transcript_fetcher=FakeTranscriptFetcher(
+            title="Streamed", languages=["en", "zh"]
+        ),
+    )
+    app.dependency_overrides[get_video_service] = lambda: service
+    try:
+        response = client.get(
+            f"{settings.API_V1_STR}/video/process/stream",
+            params={
+                "video_url": "https://youtu.be/abc123",
+                "styles": ["Summary", "Educational"],
+            },
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_events(response.text)
+    assert [name for name, _ in events] == [
+        "validated",
+        "languages",
+        "style",
+        "style",
+        "result",
+    ]
+    assert events[1][1] == {"languages": ["en", "zh"]}
+    assert events[2][1]["style"] == "Summary"
+    assert events[2][1]["content"].endswith("Summary in English")
+    assert events[3][1]["result_key"] == "educational"
+    result = events[4][1]
+    assert result["status"] == "success"
+    assert result["data"]["results"]["educational"].endswith("Educational in English")
+
+
+def test_stream_reports_processing_errors_as_events(client: TestClient) -> None:
+    class FailingService(VideoProcessingService):
+        def process_video(self, *_args, **_kwargs):
+            raise ExternalServiceError("External failure.")
+
+    app.dependency_overrides[get_video_service] = lambda: FailingService()
+    try:
+        response = client.get(
+            f"{settings.API_V1_STR}/video/process/stream",
+            params={"video_url": "https://youtu.be/abc123"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert _parse_events(response.text) == [
+        ("error", {"status": "error", "error": "External failure.", "code": 502})
+    ]
+
+
+def test_stream_rejects_invalid_url_before_streaming(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/video/process/stream",
+        params={"video_url": "https://example.com/not-youtube"},
+    )
+    assert response.status_code == 400
+    assert response.json()["status"] == "error"
+    assert "Invalid YouTube URL" in response.json()["error"]
+
+
+def test_closing_the_stream_stops_its_worker() -> None:
+    api = FakeVideoApi(style_delay=0.2)
+    service = VideoProcessingService(
+        api_client=api, transcript_fetcher=FakeTranscriptFetcher()
+    )
+    payload = VideoProcessRequest(
+        video_url="https://youtu.be/abc123",
+        styles=["Summary", "Educational", "Balanced"],
+    )
+
+    async def close_after_first_event() -> None:
+        stream = _video_event_stream(service, payload)
+        assert (await anext(stream)).startswith("event: validated")
+        await stream.aclose()
+        (worker,) = asyncio.all_tasks() - {asyncio.current_task()}
+        assert worker.cancelling()
+        with pytest.raises(asyncio.CancelledError):
+            await worker
+
+    asyncio.run(close_after_first_event())
+    # At most the style that was running when the stream closed.
+    assert len(api.style_calls) <= 1
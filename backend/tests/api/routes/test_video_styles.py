@@ -0,0 +1,41 @@
+from fastapi.testclient import TestClient
+
+from app.api.routes.video import get_style_catalog
+from app.core.config import settings
+from app.main import app
+from app.video_processor.styles import StyleCatalog
+
+
+def test_list_video_styles(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/video/styles")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "success"
+    assert body["data"][0] == {
+        "style": "Summary",
+        "api_style": "Summary",
+        "result_key": "summary",
+    }
+    assert [item["style"] for item in body["data"]] == [
+        "Summary",
+        "Educational",
+        "Balanced",
+        "QA Generation",
+        "Narrative",
+    ]
+
+
+def test_list_video_styles_only_returns_supported_styles(client: TestClient) -> None:
+    catalog = StyleCatalog(["Summary", "Q&A Generation", "Unknown Style"])
+    app.dependency_overrides[get_style_catalog] = lambda: catalog
+    try:
+        response = client.get(f"{settings.API_V1_STR}/video/styles")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert [item["result_key"] for item in response.json()["data"]] == [
+        "summary",
+        "qa_generation",
+    ]
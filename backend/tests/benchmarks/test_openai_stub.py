@@ -0,0 +1,134 @@
+import json
+import socket
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+import uvicorn
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.video_processor.clients import create_client_pool
+from app.video_processor.service import VideoProcessingService
+from benchmarks.openai_stub import StubConfig, create_stub_app
+from tests.utils.video import FakeTranscriptFetcher
+
+FAST = StubConfig(tokens_per_second=0, time_to_first_token=0, output_tokens=12)
+MESSAGES = [{"role": "user", "content": "Summarize this video."}]
+
+
+def test_stub_answers_chat_completions() -> None:
+    with TestClient(create_stub_app(FAST)) as client:
+        response = client.post(
+            "/v1/chat/completions", json={"model": "gpt-4o-mini", "messages": MESSAGES}
+        )
+        capped = client.post(
+            "/v1/chat/completions",
+            json={"model": "gpt-4o-mini", "messages": MESSAGES, "max_tokens": 5},
+        )
+
+    assert response.status_code == 200
+    content = response.json()
+    assert content["object"] == "chat.completion"
+    assert content["model"] == "gpt-4o-mini"
+    (choice,) = content["choices"]
+    assert choice["finish_reason"] == "stop"
+    assert len(choice["message"]["content"].split()) == 12
+    assert content["usage"]["completion_tokens"] == 12
+    assert content["usage"]["prompt_tokens"] > 0
+    assert capped.json()["choices"][0]["finish_reason"] == "length"
+    assert capped.json()["usage"]["completion_tokens"] == 5
+
+
+def test_stub_streams_tokens_at_the_configured_rate() -> None:
+    config = StubConfig(
+        tokens_per_second=400, time_to_first_token=0.05, output_tokens=20
+    )
+    with TestClient(create_stub_app(config)) as client:
+        started = time.perf_counter()
+        response = client.post(
+            "/v1/chat/completions",
+            json={
+                "model": "gpt-4o-mini",
+                "messages": MESSAGES,
+                "stream": True,
+                "stream_options": {"include_usage": True},
+            },
+        )
+        elapsed = time.perf_counter() - started
+
+    events = [
+        line.removeprefix("data: ")
+        for line in response.text.split("\n\n")
+        if line.startswith("data: ")
+    ]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    text = "".join(
+        choice["delta"].get("content", "")
+        for chunk in chunks
+        for choice in chunk["choices"]
+    )
+    assert len(text.split()) == 20
+    assert chunks[-2]["choices"][0]["finish_reason"] == "stop"
+    assert chunks[-1]["usage"]["completion_tokens"] == 20
+    # First token after 0.05s, the other 19 at 400 per second.
+    assert elapsed >= 0.05 + 0.04
+
+
+def test_stub_injects_rate_limits() -> None:
+    config = StubConfig(rate_limit_rate=1.0, retry_after=2.5)
+    app = create_stub_app(config)
+    with TestClient(app) as client:
+        response = client.post(
+            "/v1/chat/completions", json={"model": "gpt-4o-mini", "messages": MESSAGES}
+        )
+        stats = client.get("/stats").json()
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "3"
+    assert response.headers["retry-after-ms"] == "2500"
+    assert response.json()["error"]["code"] == "rate_limit_exceeded"
+    assert stats["requests"] == 1
+    assert stats["rate_limited"] == 1
+
+
+@pytest.fixture()
+def stub_server() -> Iterator[tuple[str, FastAPI]]:
+    app = create_stub_app(FAST)
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    try:
+        for _ in range(500):
+            if server.started:
+                break
+            time.sleep(0.01)
+        host, port = sock.getsockname()
+        yield f"http://{host}:{port}/v1", app
+    finally:
+        server.should_exit = True
+        thread.join()
+        sock.close()
+
+
+def test_service_calls_openai_base_url(stub_server: tuple[str, FastAPI]) -> None:
+    base_url, app = stub_server
+    pool = create_client_pool("stub-key", base_url=base_url)
+    service = VideoProcessingService(
+        client_pool=pool, transcript_fetcher=FakeTranscriptFetcher()
+    )
+    try:
+        data = service.process_video(
+            video_url="https://youtu.be/abc123",
+            styles=["Summary"],
+            output_language="English",
+        )
+    finally:
+        pool.close()
+
+    assert data.results.summary.endswith("the system fits together and")
+    assert app.state.stub_stats.requests == 1
@@ -0,0 +1,91 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from app.main import app
+from benchmarks.engine import EngineProfile, InjectedFailure, SimulatedModel
+from benchmarks.video_process import compare, main, run_benchmark
+
+
+def test_simulated_model_draws_latency_and_failures_from_profile() -> None:
+    model = SimulatedModel(
+        EngineProfile(
+            default_latency=0.0,
+            style_latency={"Summary": 0.01},
+            failure_rate=0.5,
+            seed=7,
+        )
+    )
+    failures = 0
+    for _ in range(40):
+        try:
+            model.call("Educational")
+        except InjectedFailure:
+            failures += 1
+
+    assert model.calls == 40
+    assert model.failures == failures
+    assert 5 < failures < 35
+
+
+def test_benchmark_reports_each_concurrency_level() -> None:
+    state_before = dict(app.state._state)
+
+    report = asyncio.run(
+        run_benchmark(
+            [1, 4],
+            requests_per_level=8,
+            styles=["Summary", "Educational"],
+            profile=EngineProfile(default_latency=0.001, jitter=0.5),
+            transcript_words=50,
+        )
+    )
+
+    assert app.state._state == state_before
+    assert [level["concurrency"] for level in report["levels"]] == [1, 4]
+    for level in report["levels"]:
+        assert level["status_codes"] == {"200": 8}
+        assert level["throughput_rps"] > 0
+        latency = level["latency_ms"]
+        assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+        assert level["threadpool"]["threads"] > 0
+        assert level["threadpool"]["peak_running"] <= level["threadpool"]["threads"]
+    assert report["model_calls"] == 32
+    json.dumps(report)
+
+
+def test_benchmark_counts_failed_requests() -> None:
+    report = asyncio.run(
+        run_benchmark(
+            [2],
+            requests_per_level=4,
+            styles=["Summary"],
+            profile=EngineProfile(default_latency=0.0, failure_rate=1.0),
+            transcript_words=50,
+        )
+    )
+
+    (level,) = report["levels"]
+    assert level["succeeded"] == 0
+    assert level["status_codes"] == {"502": 4}
+    assert level["latency_ms"]["p95"] is None
+
+
+def test_cli_writes_report_and_compares_with_baseline(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    baseline = tmp_path / "before.json"
+    output = tmp_path / "after.json"
+    args = ["--concurrency", "2", "--requests", "4", "--latency", "0"]
+    args += ["--transcript-words", "50", "--warmup", "0"]
+
+    main([*args, "--output", str(baseline)])
+    main([*args, "--output", str(output), "--baseline", str(baseline)])
+
+    after = json.loads(output.read_text())
+    assert after["levels"][0]["succeeded"] == 4
+    assert "vs " in capsys.readouterr().out
+    (line,) = compare(json.loads(baseline.read_text()), after)
+    assert line.startswith("c=2")
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.bulkhead import Bulkhead, BulkheadFullError
+
+
+async def wait_until(condition) -> None:
+    for _ in range(5000):
+        if condition():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("timed out")
+
+
+def test_bulkhead_caps_threads_and_rejects_past_queue_limit() -> None:
+    pool = Bulkhead("video", max_concurrency=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        running = asyncio.ensure_future(pool.run_sync(release.wait))
+        await wait_until(lambda: pool.snapshot().running == 1)
+        pool.admit()
+        queued = asyncio.ensure_future(pool.run_sync(release.wait))
+        await wait_until(lambda: pool.snapshot().queued == 1)
+
+        with pytest.raises(BulkheadFullError):
+            pool.admit()
+
+        release.set()
+        await asyncio.gather(running, queued)
+
+    asyncio.run(scenario())
+
+    stats = pool.snapshot()
+    assert stats.running == 0
+    assert stats.queued == 0
+    assert stats.admitted == 2
+    assert stats.rejected == 1
+    assert stats.wait_seconds_max > 0
+
+
+def test_bulkheads_do_not_share_threads() -> None:
+    video = Bulkhead("video", max_concurrency=1)
+    crud = Bulkhead("crud", max_concurrency=1)
+    release = threading.Event()
+
+    async def scenario() -> str:
+        blocked = asyncio.ensure_future(video.run_sync(release.wait))
+        await wait_until(lambda: video.snapshot().running == 1)
+        try:
+            return await asyncio.wait_for(crud.run_sync(lambda: "ok"), timeout=5)
+        finally:
+            release.set()
+            await blocked
+
+    assert asyncio.run(scenario()) == "ok"
+
+
+def test_unbounded_queue_never_rejects() -> None:
+    pool = Bulkhead("crud", max_concurrency=1, max_queue=0)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        tasks = [asyncio.ensure_future(pool.run_sync(release.wait)) for _ in range(3)]
+        await wait_until(lambda: pool.snapshot().queued == 2)
+        pool.admit()
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+
+    assert pool.snapshot().rejected == 0
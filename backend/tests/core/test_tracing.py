@@ -0,0 +1,288 @@
+import contextvars
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+import sentry_sdk
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sentry_sdk.envelope import Envelope
+from sentry_sdk.transport import Transport
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.tracing import (
+    CLIENT,
+    SERVER,
+    FileSpanExporter,
+    Span,
+    Tracer,
+    TracingMiddleware,
+    instrument_engine,
+    route_sample_rate,
+    span,
+    to_otlp,
+)
+
+
+class MemoryExporter:
+    def __init__(self) -> None:
+        self.exported: list[list[Span]] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.exported.append(spans)
+
+
+def test_route_sample_rate_uses_longest_prefix() -> None:
+    rates = {"/api/v1/": 0.5, "/api/v1/video/": 1.0, "/api/v1/utils/": 0.0}
+
+    assert route_sample_rate("/api/v1/video/process", 0.1, rates) == 1.0
+    assert route_sample_rate("/api/v1/items/", 0.1, rates) == 0.5
+    assert route_sample_rate("/api/v1/utils/health-check/", 0.1, rates) == 0.0
+    assert route_sample_rate("/metrics", 0.1, rates) == 0.1
+
+
+def test_tracer_samples_per_route() -> None:
+    exporter = MemoryExporter()
+    tracer = Tracer(
+        exporter,
+        sample_rate=0.0,
+        route_sample_rates={"/api/v1/video/": 1.0},
+        rng=lambda: 0.5,
+    )
+
+    with tracer.trace("POST /process", "/api/v1/video/process") as sampled:
+        assert sampled is not None
+    with tracer.trace("GET /items", "/api/v1/items/") as skipped:
+        assert skipped is None
+        with span("db.query") as child:
+            assert child is None
+    tracer.shutdown()
+
+    assert [[item.name for item in spans] for spans in exporter.exported] == [
+        ["POST /process"]
+    ]
+
+
+def test_spans_nest_across_threads_and_export_with_root() -> None:
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter, sample_rate=1.0)
+    late_started = threading.Event()
+    late_release = threading.Event()
+
+    def late_work() -> None:
+        with span("late"):
+            late_started.set()
+            late_release.wait()
+
+    with tracer.trace("GET /x", "/x") as root:
+        assert root is not None
+        with span("video.engine") as stage:
+            assert stage is not None
+
+            def call_model() -> None:
+                with span("llm.chat", CLIENT):
+                    pass
+
+            worker = threading.Thread(
+                target=contextvars.copy_context().run, args=(call_model,)
+            )
+            worker.start()
+            worker.join()
+        late = threading.Thread(
+            target=contextvars.copy_context().run, args=(late_work,)
+        )
+        late.start()
+        late_started.wait()
+    late_release.set()
+    late.join()
+    tracer.shutdown()
+
+    (spans,) = exporter.exported
+    by_name = {item.name: item for item in spans}
+    assert set(by_name) == {"GET /x", "video.engine", "llm.chat"}
+    assert by_name["GET /x"].parent_id is None
+    assert by_name["GET /x"].kind == SERVER
+    assert by_name["video.engine"].parent_id == by_name["GET /x"].span_id
+    assert by_name["llm.chat"].parent_id == by_name["video.engine"].span_id
+    assert len({item.trace.trace_id for item in spans}) == 1
+
+
+def test_incoming_traceparent_decides_sampling() -> None:
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter, sample_rate=0.0)
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+    with tracer.trace("GET /x", "/x", f"00-{trace_id}-00f067aa0ba902b7-01") as root:
+        assert root is not None
+        assert root.parent_id == "00f067aa0ba902b7"
+        assert root.trace.trace_id == trace_id
+    with tracer.trace("GET /x", "/x", f"00-{trace_id}-00f067aa0ba902b7-00") as root:
+        assert root is None
+    with tracer.trace("GET /x", "/x", "garbage") as root:
+        assert root is None
+    tracer.shutdown()
+
+    assert len(exporter.exported) == 1
+
+
+def test_failed_span_is_exported_with_error_status(tmp_path: Path) -> None:
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(FileSpanExporter(str(path), "backend"), sample_rate=1.0)
+
+    with tracer.trace("GET /x", "/x"):
+        with pytest.raises(ValueError):
+            with span("transcript.fetch", CLIENT, video_id="abc", language=None):
+                raise ValueError("no captions")
+    tracer.shutdown()
+
+    (line,) = path.read_text().splitlines()
+    (resource,) = json.loads(line)["resourceSpans"]
+    assert {"key": "service.name", "value": {"stringValue": "backend"}} in resource[
+        "resource"
+    ]["attributes"]
+    fetch = next(
+        item
+        for item in resource["scopeSpans"][0]["spans"]
+        if item["name"] == "transcript.fetch"
+    )
+    assert fetch["status"] == {"code": 2, "message": "ValueError: no captions"}
+    assert fetch["attributes"] == [{"key": "video_id", "value": {"stringValue": "abc"}}]
+    assert int(fetch["endTimeUnixNano"]) >= int(fetch["startTimeUnixNano"])
+
+
+def test_otlp_values_are_typed() -> None:
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter, sample_rate=1.0)
+    with tracer.trace("GET /x", "/x", flag=True, count=3, ratio=0.5, sql="x" * 5000):
+        pass
+    tracer.shutdown()
+
+    (spans,) = exporter.exported
+    attributes = {
+        item["key"]: item["value"]
+        for item in to_otlp(spans, "backend")["resourceSpans"][0]["scopeSpans"][0][
+            "spans"
+        ][0]["attributes"]
+    }
+    assert attributes["flag"] == {"boolValue": True}
+    assert attributes["count"] == {"intValue": "3"}
+    assert attributes["ratio"] == {"doubleValue": 0.5}
+    assert len(attributes["sql"]["stringValue"]) == 1024
+
+
+def test_middleware_traces_requests_with_route_names() -> None:
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter, sample_rate=1.0)
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int) -> dict[str, int]:
+        with span("work"):
+            return {"id": item_id}
+
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+    with TestClient(app) as client:
+        assert client.get("/items/7").json() == {"id": 7}
+    tracer.shutdown()
+
+    (spans,) = exporter.exported
+    root = next(item for item in spans if item.parent_id is None)
+    assert root.name == "GET /items/{item_id}"
+    assert root.attributes["http.response.status_code"] == 200
+    assert root.attributes["url.path"] == "/items/7"
+    assert [item.name for item in spans if item.parent_id == root.span_id] == ["work"]
+
+
+def test_instrumented_engine_traces_queries() -> None:
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter, sample_rate=1.0)
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    with tracer.trace("GET /x", "/x"), engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing"))
+    tracer.shutdown()
+
+    (spans,) = exporter.exported
+    queries = [item for item in spans if item.name == "db.query"]
+    assert [item.attributes["db.statement"] for item in queries] == [
+        "SELECT 1",
+        "SELECT * FROM missing",
+    ]
+    assert queries[0].kind == CLIENT
+    assert queries[0].error is None
+    assert queries[1].error is not None
+
+
+class SentryTransactions(Transport):
+    def __init__(self, options: dict[str, Any] | None = None) -> None:
+        super().__init__(options)
+        self.transactions: list[dict[str, Any]] = []
+
+    def capture_envelope(self, envelope: Envelope) -> None:
+        for item in envelope.items:
+            if item.type == "transaction":
+                self.transactions.append(item.payload.json)
+
+
+def sentry_hub(transport: SentryTransactions) -> sentry_sdk.Hub:
+    client = sentry_sdk.Client(
+        dsn="http://public@localhost/1", transport=transport, traces_sample_rate=1.0
+    )
+    return sentry_sdk.Hub(client)
+
+
+def test_spans_go_to_sentry_without_a_tracer() -> None:
+    transport = SentryTransactions()
+    engine = create_engine("sqlite://")
+
+    with sentry_hub(transport) as hub:
+        with hub.start_transaction(name="GET /x", sampled=True):
+            with span("video.engine"):
+
+                def call_model() -> None:
+                    with span("llm.chat", CLIENT, model="gpt-4o-mini") as call:
+                        assert call is not None
+                        call.set_attribute("gen_ai.usage.input_tokens", 12)
+
+                worker = threading.Thread(
+                    target=contextvars.copy_context().run, args=(call_model,)
+                )
+                worker.start()
+                worker.join()
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        hub.flush()
+
+    (transaction,) = transport.transactions
+    root_id = transaction["contexts"]["trace"]["span_id"]
+    spans = {item["op"]: item for item in transaction["spans"]}
+    assert spans["video.engine"]["parent_span_id"] == root_id
+    assert spans["llm.chat"]["parent_span_id"] == spans["video.engine"]["span_id"]
+    assert spans["llm.chat"]["data"]["model"] == "gpt-4o-mini"
+    assert spans["llm.chat"]["data"]["gen_ai.usage.input_tokens"] == 12
+    assert "db" in spans
+
+
+def test_tracer_shares_sentry_sampling_decision() -> None:
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter, sample_rate=0.0)
+
+    with sentry_hub(SentryTransactions()) as hub:
+        with hub.start_transaction(name="GET /x", sampled=True) as transaction:
+            with tracer.trace("GET /x", "/x") as root:
+                assert root is not None
+                assert root.trace.trace_id == transaction.trace_id
+        with hub.start_transaction(name="GET /y", sampled=False):
+            with tracer.trace("GET /y", "/y") as skipped:
+                assert skipped is None
+    tracer.shutdown()
+
+    assert [[item.name for item in spans] for spans in exporter.exported] == [
+        ["GET /x"]
+    ]
@@ -0,0 +1,52 @@
+import threading
+
+from app.video_processor.exceptions import VideoValidationError
+from app.video_processor.transcripts import FetchedTranscript, TranscriptProbe
+from benchmarks.engine import EngineProfile, FakeGetOutVideoAPI
+
+
+class FakeVideoApi(FakeGetOutVideoAPI):
+    """The benchmark's fake engine, with one latency for every style."""
+
+    def __init__(self, style_delay: float = 0.0, failure_rate: float = 0.0) -> None:
+        super().__init__(
+            EngineProfile(default_latency=style_delay, failure_rate=failure_rate)
+        )
+
+
+class FakeTranscriptFetcher:
+    """Stand-in for YouTubeTranscriptFetcher that counts upstream calls."""
+
+    def __init__(
+        self,
+        title: str = "Fake Video",
+        languages: list[str] | None = None,
+        text: str = "Hello world",
+    ) -> None:
+        self.title = title
+        self.languages = ["en"] if languages is None else languages
+        self.text = text
+        self.probe_calls = 0
+        self.fetch_calls: list[list[str] | None] = []
+        self._lock = threading.Lock()
+
+    def probe(self, _video_id: str) -> TranscriptProbe | None:
+        with self._lock:
+            self.probe_calls += 1
+        return TranscriptProbe(languages=list(self.languages))
+
+    def fetch(
+        self,
+        _video_id: str,
+        languages: list[str] | None,
+        _probe: TranscriptProbe | None,
+    ) -> FetchedTranscript:
+        with self._lock:
+            self.fetch_calls.append(languages)
+        if not self.languages:
+            raise VideoValidationError("No subtitles found for this video.")
+        language = languages[0] if languages else self.languages[0]
+        return FetchedTranscript(language=language, text=self.text)
+
+    def video_title(self, _video_url: str) -> str:
+        return self.title
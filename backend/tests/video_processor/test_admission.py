@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.video_processor.admission import AdmissionController
+from app.video_processor.exceptions import VideoOverloadedError
+from app.video_processor.scheduler import (
+    BULK,
+    INTERACTIVE,
+    PriorityClass,
+    PriorityScheduler,
+)
+
+
+def wait_until(condition) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_admission_rejects_over_in_flight_limit() -> None:
+    admission = AdmissionController(
+        max_in_flight=2, max_queue_wait_seconds=0, retry_after_seconds=3
+    )
+    first = admission.admit(INTERACTIVE)
+    admission.admit(BULK)
+
+    with pytest.raises(VideoOverloadedError) as exc_info:
+        admission.admit(INTERACTIVE)
+    assert exc_info.value.retry_after == 3
+
+    first()
+    first()
+    admission.admit(INTERACTIVE)
+
+    stats = admission.snapshot()
+    assert stats.in_flight == 2
+    assert stats.admitted == 3
+    assert stats.rejected_in_flight == 1
+    assert stats.rejected_queue_wait == 0
+
+
+def test_admission_rejects_when_queue_wait_is_too_long() -> None:
+    now = [0.0]
+    scheduler = PriorityScheduler(
+        [
+            PriorityClass(INTERACTIVE, weight=1, max_concurrency=1),
+            PriorityClass(BULK, weight=1, max_concurrency=1),
+        ],
+        capacity=1,
+        clock=lambda: now[0],
+    )
+    admission = AdmissionController(
+        max_in_flight=0,
+        max_queue_wait_seconds=10,
+        retry_after_seconds=1,
+        scheduler=scheduler,
+    )
+    release = threading.Event()
+
+    def hold() -> None:
+        with scheduler.slot(INTERACTIVE):
+            release.wait()
+
+    def wait() -> None:
+        with scheduler.slot(INTERACTIVE):
+            pass
+
+    threads = [threading.Thread(target=hold), threading.Thread(target=wait)]
+    threads[0].start()
+    wait_until(lambda: scheduler.snapshot()[INTERACTIVE].running == 1)
+    threads[1].start()
+    wait_until(lambda: scheduler.snapshot()[INTERACTIVE].queued == 1)
+
+    try:
+        now[0] = 5.0
+        admission.admit(INTERACTIVE)
+        now[0] = 12.5
+        with pytest.raises(VideoOverloadedError) as exc_info:
+            admission.admit(INTERACTIVE)
+        # Other classes are judged by their own queue.
+        admission.admit(BULK)
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert exc_info.value.retry_after == 13
+    assert admission.snapshot().rejected_queue_wait == 1
+
+
+def test_default_in_flight_limit_is_reached_before_the_bulkhead_rejects() -> None:
+    derived = settings.model_copy(
+        update={
+            "VIDEO_ADMISSION_MAX_IN_FLIGHT": None,
+            "BULKHEAD_VIDEO_THREADS": 16,
+            "BULKHEAD_VIDEO_QUEUE": 32,
+        }
+    )
+    unbounded = derived.model_copy(update={"BULKHEAD_VIDEO_QUEUE": 0})
+    explicit = derived.model_copy(update={"VIDEO_ADMISSION_MAX_IN_FLIGHT": 10})
+
+    assert derived.video_admission_max_in_flight == 48
+    assert unbounded.video_admission_max_in_flight == 0
+    assert explicit.video_admission_max_in_flight == 10
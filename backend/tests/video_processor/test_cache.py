@@ -0,0 +1,241 @@
+from collections.abc import Iterable
+
+import pytest
+from sqlmodel import Session, col, delete, select
+
+from app.core.db import engine
+from app.models import VideoResult, VideoTranscript
+from app.video_processor.cache import (
+    CachedResult,
+    CachedTranscript,
+    DatabaseResultStore,
+    DatabaseTranscriptStore,
+    LRUCache,
+    ResultCache,
+    ResultKey,
+    TranscriptCache,
+    TranscriptKey,
+    TTLCache,
+)
+from app.video_processor.service import VideoProcessingService
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+
+class FakeStore:
+    def __init__(self) -> None:
+        self.rows: dict[ResultKey, CachedResult] = {}
+        self.lookups = 0
+
+    def get_many(self, keys: Iterable[ResultKey]) -> dict[ResultKey, CachedResult]:
+        self.lookups += 1
+        return {key: self.rows[key] for key in keys if key in self.rows}
+
+    def put_many(self, results: dict[ResultKey, CachedResult]) -> None:
+        self.rows.update(results)
+
+
+class BrokenStore:
+    def get_many(self, _keys: Iterable[ResultKey]) -> dict[ResultKey, CachedResult]:
+        raise RuntimeError("database unavailable")
+
+    def put_many(self, _results: dict[ResultKey, CachedResult]) -> None:
+        raise RuntimeError("database unavailable")
+
+    def get(self, _key: TranscriptKey) -> CachedTranscript | None:
+        raise RuntimeError("database unavailable")
+
+    def put(self, _key: TranscriptKey, _transcript: CachedTranscript) -> None:
+        raise RuntimeError("database unavailable")
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries() -> None:
+    now = 100.0
+    cache: TTLCache[str, list[str]] = TTLCache(max_entries=2, clock=lambda: now)
+    cache.set("long", ["en"], ttl=60)
+    cache.set("short", [], ttl=5)
+
+    assert cache.get("short") == []
+    now = 110.0
+    assert cache.get("short") is None
+    assert cache.get("long") == ["en"]
+    now = 160.0
+    assert cache.get("long") is None
+    assert len(cache) == 0
+
+
+def test_result_cache_backfills_memory_from_store() -> None:
+    store = FakeStore()
+    key = ResultKey(video_id="abc123", style="Summary", output_language="English")
+    store.rows[key] = CachedResult(video_title="Title", content="Summary text")
+    cache = ResultCache(store=store, max_entries=8)
+
+    assert cache.get_many([key]) == {key: store.rows[key]}
+    assert cache.get_many([key]) == {key: store.rows[key]}
+    assert store.lookups == 1
+
+
+def test_result_cache_treats_store_errors_as_misses() -> None:
+    cache = ResultCache(store=BrokenStore(), max_entries=8)
+    key = ResultKey(video_id="abc123", style="Summary", output_language="English")
+    cached = CachedResult(video_title="Title", content="Summary text")
+
+    assert cache.get_many([key]) == {}
+    cache.put_many({key: cached})
+    assert cache.get_many([key]) == {key: cached}
+
+
+def test_process_video_serves_cached_results_without_api() -> None:
+    cache = ResultCache(max_entries=8)
+    cache.put_many(
+        {
+            ResultKey(
+                video_id="abc123", style="Summary", output_language="English"
+            ): CachedResult(video_title="Cached Video", content="Summary text")
+        }
+    )
+    service = VideoProcessingService(api_client=None, result_cache=cache)
+
+    data = service.process_video(
+        video_url="https://youtu.be/abc123",
+        styles=["Summary"],
+        output_language="English",
+    )
+
+    assert data.video_title == "Cached Video"
+    assert data.results.summary == "Summary text"
+    assert data.metadata.cache_hit is True
+    assert data.metadata.styles_processed == ["Summary"]
+
+
+def test_process_video_computes_only_missing_styles() -> None:
+    cache = ResultCache(max_entries=8)
+    cache.put_many(
+        {
+            ResultKey(
+                video_id="abc123", style="Summary", output_language="English"
+            ): CachedResult(video_title="Cached Video", content="Cached summary")
+        }
+    )
+    api = FakeVideoApi()
+    service = VideoProcessingService(
+        api_client=api,
+        result_cache=cache,
+        transcript_fetcher=FakeTranscriptFetcher(title="Fresh Video"),
+    )
+
+    data = service.process_video(
+        video_url="https://youtu.be/abc123",
+        styles=["Summary", "Educational"],
+        output_language="English",
+    )
+
+    assert api.style_calls == ["Educational"]
+    assert data.results.summary == "Cached summary"
+    assert data.results.educational.endswith("Educational in English")
+    assert data.metadata.cache_hit is False
+    assert data.metadata.cached_styles == ["Summary"]
+    assert data.metadata.styles_processed == ["Summary", "Educational"]
+
+    repeat = service.process_video(
+        video_url="https://youtu.be/abc123",
+        styles=["Educational"],
+        output_language="English",
+    )
+    assert api.style_calls == ["Educational"]
+    assert repeat.metadata.cache_hit is True
+
+
+def test_transcript_cache_treats_store_errors_as_misses() -> None:
+    cache = TranscriptCache(store=BrokenStore(), max_entries=4)
+    key = TranscriptKey(video_id="abc123", language="en")
+
+    assert cache.get(key) is None
+    cache.put(key, CachedTranscript(video_title="Title", text="Hello"))
+    assert cache.get(key) == CachedTranscript(video_title="Title", text="Hello")
+
+
+def test_process_video_reuses_cached_transcript() -> None:
+    fetcher = FakeTranscriptFetcher(title="Captioned Video")
+    transcripts = TranscriptCache(max_entries=4)
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(),
+        transcript_cache=transcripts,
+        transcript_fetcher=fetcher,
+    )
+
+    for output_language in ["English", "Chinese"]:
+        data = service.process_video(
+            video_url="https://youtu.be/abc123",
+            styles=["Summary"],
+            output_language=output_language,
+        )
+        assert data.results.summary.endswith(f"Summary in {output_language}")
+
+    assert fetcher.fetch_calls == [["en"]]
+    assert transcripts.get(TranscriptKey(video_id="abc123", language="en")) == (
+        CachedTranscript(video_title="Captioned Video", text="Hello world")
+    )
+
+
+def test_database_transcript_store_round_trip(db: Session | None) -> None:
+    if db is None:
+        pytest.skip("DB setup disabled via SKIP_DB_TEST_SETUP")
+    store = DatabaseTranscriptStore(engine)
+    key = TranscriptKey(video_id="db-transcript", language="en")
+    text = "caption line " * 500
+    try:
+        store.put(key, CachedTranscript(video_title="Title", text=text))
+
+        assert store.get(key) == CachedTranscript(video_title="Title", text=text)
+        row = db.exec(
+            select(VideoTranscript).where(
+                col(VideoTranscript.video_id) == "db-transcript"
+            )
+        ).one()
+        assert len(row.content) < len(text)
+        assert store.get(TranscriptKey(video_id="db-transcript", language="fr")) is None
+    finally:
+        db.execute(
+            delete(VideoTranscript).where(
+                col(VideoTranscript.video_id) == "db-transcript"
+            )
+        )
+        db.commit()
+
+
+def test_database_result_store_round_trip(db: Session | None) -> None:
+    if db is None:
+        pytest.skip("DB setup disabled via SKIP_DB_TEST_SETUP")
+    store = DatabaseResultStore(engine)
+    key = ResultKey(
+        video_id="db-round-trip", style="Summary", output_language="English"
+    )
+    try:
+        store.put_many({key: CachedResult(video_title="Title", content="First")})
+        store.put_many({key: CachedResult(video_title="Title", content="Second")})
+
+        assert store.get_many([key]) == {
+            key: CachedResult(video_title="Title", content="First")
+        }
+        other_language = ResultKey(
+            video_id="db-round-trip", style="Summary", output_language="Chinese"
+        )
+        assert store.get_many([other_language]) == {}
+    finally:
+        db.execute(
+            delete(VideoResult).where(col(VideoResult.video_id) == "db-round-trip")
+        )
+        db.commit()
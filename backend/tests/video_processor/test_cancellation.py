@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.api.routes.video import _run_until_disconnected
+from app.video_processor.cancellation import (
+    DEADLINE,
+    DISCONNECT,
+    CancelToken,
+)
+from app.video_processor.exceptions import (
+    DeadlineExceededError,
+    ProcessingCancelledError,
+)
+from app.video_processor.service import VideoProcessingService
+from app.video_processor.singleflight import SingleFlight
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+STYLES = ["Summary", "Educational", "Balanced"]
+
+
+def cancel_later(token: CancelToken, delay: float) -> None:
+    threading.Timer(delay, token.cancel).start()
+
+
+def test_cancel_token_deadline_parent_and_callbacks() -> None:
+    now = [0.0]
+    token = CancelToken(timeout=5, clock=lambda: now[0])
+    fired: list[str] = []
+
+    with token.on_cancel(lambda: fired.append("stop")):
+        token.check()
+        now[0] = 5.0
+        assert token.reason == DEADLINE
+    with pytest.raises(DeadlineExceededError):
+        token.check()
+    assert fired == ["stop"]
+
+    parent = CancelToken()
+    child = CancelToken(timeout=60, parent=parent)
+    parent.cancel()
+    with pytest.raises(ProcessingCancelledError):
+        child.check()
+    assert child.reason == DISCONNECT
+
+
+def test_cancel_token_sleep_wakes_on_cancel() -> None:
+    token = CancelToken()
+    cancel_later(token, 0.05)
+    started = time.monotonic()
+
+    with pytest.raises(ProcessingCancelledError):
+        token.sleep(10)
+    assert time.monotonic() - started < 1
+
+
+def test_cancelling_skips_styles_not_started() -> None:
+    api = FakeVideoApi(style_delay=0.2)
+    labels = {"reason": DISCONNECT}
+    requests = REGISTRY.get_sample_value("video_cancelled_requests_total", labels)
+    skipped = REGISTRY.get_sample_value("video_cancelled_styles_skipped_total", labels)
+    service = VideoProcessingService(
+        api_client=api, transcript_fetcher=FakeTranscriptFetcher()
+    )
+    token = CancelToken()
+    cancel_later(token, 0.1)
+
+    with pytest.raises(ProcessingCancelledError):
+        service.process_video(
+            video_url="https://youtu.be/abc123",
+            styles=STYLES,
+            output_language="English",
+            cancel=token,
+        )
+
+    assert api.style_calls == ["Summary"]
+    assert (
+        REGISTRY.get_sample_value("video_cancelled_requests_total", labels)
+        == (requests or 0) + 1
+    )
+    assert (
+        REGISTRY.get_sample_value("video_cancelled_styles_skipped_total", labels)
+        == (skipped or 0) + 3
+    )
+
+
+def test_cancelling_abandons_running_styles() -> None:
+    api = FakeVideoApi(style_delay=0.5)
+    token = CancelToken()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        service = VideoProcessingService(
+            api_client=api,
+            style_executor=executor,
+            transcript_fetcher=FakeTranscriptFetcher(),
+        )
+        cancel_later(token, 0.1)
+        started = time.monotonic()
+        with pytest.raises(ProcessingCancelledError):
+            service.process_video(
+                video_url="https://youtu.be/abc123",
+                styles=STYLES,
+                output_language="English",
+                cancel=token,
+            )
+        assert time.monotonic() - started < 0.4
+
+
+def test_coalesced_caller_takes_over_from_a_cancelled_leader() -> None:
+    api = FakeVideoApi(style_delay=0.2)
+    service = VideoProcessingService(
+        api_client=api,
+        single_flight=SingleFlight(),
+        transcript_fetcher=FakeTranscriptFetcher(),
+    )
+    leader_token = CancelToken()
+    outcomes: dict[str, object] = {}
+
+    def run(name: str, token: CancelToken | None) -> None:
+        try:
+            outcomes[name] = service.process_video(
+                video_url="https://youtu.be/abc123",
+                styles=["Summary"],
+                output_language="English",
+                cancel=token,
+            )
+        except Exception as exc:  # noqa: BLE001 - asserted below
+            outcomes[name] = exc
+
+    leader = threading.Thread(target=run, args=("leader", leader_token))
+    follower = threading.Thread(target=run, args=("follower", None))
+    leader.start()
+    time.sleep(0.05)
+    follower.start()
+    cancel_later(leader_token, 0.1)
+    leader.join()
+    follower.join()
+
+    assert isinstance(outcomes["leader"], ProcessingCancelledError)
+    assert outcomes["follower"].results.summary.endswith("Summary in English")
+
+
+def test_run_until_disconnected_cancels_when_the_client_leaves() -> None:
+    class GoneRequest:
+        async def is_disconnected(self) -> bool:
+            return True
+
+    token = CancelToken()
+
+    def work() -> str:
+        token.sleep(10)
+        return "finished"
+
+    with pytest.raises(ProcessingCancelledError):
+        asyncio.run(_run_until_disconnected(GoneRequest(), token, work))
+    assert token.reason == DISCONNECT
@@ -0,0 +1,26 @@
+from app.video_processor.chunking import estimate_tokens, split_into_segments
+
+
+def test_estimate_tokens_counts_cjk_per_character() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("你好世界") == 4
+    assert estimate_tokens("你好 world") == 4
+
+
+def test_split_into_segments_respects_budget_and_order() -> None:
+    text = " ".join(f"word{index}" for index in range(50))
+
+    segments = split_into_segments(text, 10)
+
+    assert len(segments) > 1
+    assert all(estimate_tokens(segment) <= 10 for segment in segments)
+    assert " ".join(segments) == text
+
+
+def test_split_into_segments_cuts_unspaced_text() -> None:
+    text = "字" * 25
+
+    assert split_into_segments(text, 10) == ["字" * 10, "字" * 10, "字" * 5]
+    assert split_into_segments(text, 0) == [text]
+    assert split_into_segments("short", 10) == ["short"]
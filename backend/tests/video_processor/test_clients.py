@@ -0,0 +1,68 @@
+from getoutvideo.config import ProcessingConfig
+
+from app.video_processor.clients import (
+    ClientPool,
+    create_api_client,
+    create_client_pool,
+)
+from app.video_processor.service import VideoProcessingService, _isolated_engine
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+
+def test_client_pool_isolates_checkouts_and_reuses_idle_clients() -> None:
+    built: list[FakeVideoApi] = []
+
+    def factory() -> FakeVideoApi:
+        built.append(FakeVideoApi())
+        return built[-1]
+
+    pool = ClientPool(factory, max_idle=1)
+    with pool.checkout() as first, pool.checkout() as second:
+        assert first is not second
+    assert pool.idle_count() == 1
+
+    with pool.checkout() as again:
+        assert again in built
+    assert len(built) == 2
+
+
+def test_pooled_clients_share_one_openai_client() -> None:
+    pool = create_client_pool("test-key")
+    try:
+        with pool.checkout() as first, pool.checkout() as second:
+            shared = first.ai_processor.client
+            assert second.ai_processor.client is shared
+
+            engine = _isolated_engine(
+                first,
+                ProcessingConfig(styles=["Educational"], output_language="French"),
+            )
+            assert engine.ai_processor.client is shared
+            assert engine.ai_processor.config is engine.config
+            assert first.config.processing_config.styles == ["Summary"]
+    finally:
+        pool.close()
+
+
+def test_process_video_checks_out_a_pooled_client() -> None:
+    api = FakeVideoApi()
+    pool = ClientPool(lambda: api)
+    service = VideoProcessingService(
+        client_pool=pool, transcript_fetcher=FakeTranscriptFetcher()
+    )
+
+    data = service.process_video(
+        video_url="https://youtu.be/abc123",
+        styles=["Summary"],
+        output_language="English",
+    )
+
+    assert data.results.summary.endswith("Summary in English")
+    assert api.style_calls == ["Summary"]
+    assert pool.idle_count() == 1
+
+
+def test_unpooled_client_calls_openai_base_url() -> None:
+    api = create_api_client("test-key", base_url="http://localhost:8090/v1")
+
+    assert str(api.ai_processor.client.base_url) == "http://localhost:8090/v1/"
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+from app.video_processor.cache import TranscriptCache, TTLCache
+from app.video_processor.service import VideoProcessingService
+from app.video_processor.singleflight import SingleFlight
+from app.video_processor.transcripts import FetchedTranscript, TranscriptProbe
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+VIDEO_LANGUAGES = {
+    "vid-zh": ["en", "zh-Hans"],
+    "vid-en": ["fr", "en"],
+    "vid-fr": ["fr"],
+    "vid-de": ["de", "ja"],
+}
+OUTPUT_LANGUAGES = ["English", "French", "German", "Japanese"]
+
+
+class PerVideoFetcher(FakeTranscriptFetcher):
+    """Answers each video with its own languages, title and caption text."""
+
+    def probe(self, video_id: str) -> TranscriptProbe | None:
+        super().probe(video_id)
+        return TranscriptProbe(languages=list(VIDEO_LANGUAGES[video_id]))
+
+    def fetch(
+        self,
+        video_id: str,
+        languages: list[str] | None,
+        probe: TranscriptProbe | None,
+    ) -> FetchedTranscript:
+        super().fetch(video_id, languages, probe)
+        assert languages is not None
+        return FetchedTranscript(
+            language=languages[0], text=f"captions of {video_id} in {languages[0]}"
+        )
+
+    def video_title(self, video_url: str) -> str:
+        return f"Title {video_url.rsplit('/', 1)[-1]}"
+
+
+class RecordingApi(FakeVideoApi):
+    def __init__(self) -> None:
+        super().__init__(style_delay=0.005)
+        self.inputs: list[tuple[str, str]] = []
+
+    def process_with_ai(self, transcripts, output_dir, config=None):
+        with self._lock:
+            self.inputs.append((transcripts[0].url, transcripts[0].transcript_text))
+        return super().process_with_ai(transcripts, output_dir, config)
+
+
+def test_concurrent_requests_do_not_leak_between_each_other() -> None:
+    api = RecordingApi()
+    config_before = deepcopy(api.config)
+    videos = list(VIDEO_LANGUAGES)
+    # Every video with every output language, four times over.
+    cases = [
+        (videos[index % 4], OUTPUT_LANGUAGES[index // 4 % 4]) for index in range(64)
+    ]
+    expected_caption = {
+        "vid-zh": "zh-Hans",
+        "vid-en": "en",
+        "vid-fr": "fr",
+        "vid-de": "de",
+    }
+
+    with ThreadPoolExecutor(max_workers=8) as style_executor:
+        service = VideoProcessingService(
+            api_client=api,
+            single_flight=SingleFlight(),
+            style_executor=style_executor,
+            transcript_cache=TranscriptCache(max_entries=16),
+            language_cache=TTLCache(max_entries=16),
+            transcript_fetcher=PerVideoFetcher(),
+        )
+
+        def run(case: tuple[str, str]):
+            video_id, output_language = case
+            return service.process_video(
+                video_url=f"https://youtu.be/{video_id}",
+                styles=["Summary", "Educational"],
+                output_language=output_language,
+            )
+
+        with ThreadPoolExecutor(max_workers=32) as requests:
+            outcomes = list(requests.map(run, cases))
+
+    for (video_id, output_language), data in zip(cases, outcomes, strict=True):
+        assert data.video_title == f"Title {video_id}"
+        assert data.metadata.language == output_language
+        assert data.results.summary.startswith(f"# Title {video_id}\n")
+        assert data.results.summary.endswith(f"Summary in {output_language}")
+        assert data.results.educational.endswith(f"Educational in {output_language}")
+    for url, text in api.inputs:
+        video_id = url.rsplit("/", 1)[-1]
+        assert text == f"captions of {video_id} in {expected_caption[video_id]}"
+    assert api.config == config_before
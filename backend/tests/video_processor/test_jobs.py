@@ -0,0 +1,227 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import Session, col, delete
+
+from app.core.db import engine
+from app.models import VideoJob, get_datetime_utc
+from app.video_processor.exceptions import ExternalServiceError
+from app.video_processor.jobs import DatabaseJobStore, VideoJobRunner, to_job_data
+from app.video_processor.schemas import (
+    VideoProcessData,
+    VideoProcessMetadata,
+    VideoProcessRequest,
+    VideoProcessResults,
+)
+
+
+class FakeJobStore:
+    def __init__(self) -> None:
+        self.jobs: dict[uuid.UUID, VideoJob] = {}
+
+    def create(self, request: VideoProcessRequest) -> VideoJob:
+        job = VideoJob(
+            video_url=request.video_url,
+            styles=request.styles,
+            output_language=request.output_language,
+        )
+        self.jobs[job.id] = job
+        return job
+
+    def get(self, job_id: uuid.UUID) -> VideoJob | None:
+        return self.jobs.get(job_id)
+
+    def claim(self, job_id: uuid.UUID) -> VideoJob | None:
+        job = self.jobs.get(job_id)
+        if job is None or job.status != "pending":
+            return None
+        job.status = "running"
+        job.started_at = get_datetime_utc()
+        return job
+
+    def complete(self, job_id: uuid.UUID, data: VideoProcessData) -> None:
+        job = self.jobs[job_id]
+        job.result = data.model_dump(mode="json")
+        job.finished_at = get_datetime_utc()
+        job.status = "succeeded"
+
+    def fail(self, job_id: uuid.UUID, message: str, code: int) -> None:
+        job = self.jobs[job_id]
+        job.error = message
+        job.error_code = code
+        job.finished_at = get_datetime_utc()
+        job.status = "failed"
+
+    def pending_ids(self) -> list[uuid.UUID]:
+        return [job.id for job in self.jobs.values() if job.status == "pending"]
+
+    def requeue_stale(self, started_before: datetime) -> int:
+        stale = [
+            job
+            for job in self.jobs.values()
+            if job.status == "running"
+            and job.started_at is not None
+            and job.started_at < started_before
+        ]
+        for job in stale:
+            job.status = "pending"
+            job.started_at = None
+        return len(stale)
+
+
+class FakeService:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+
+    def process_video(
+        self, video_url: str, styles: list[str] | None, output_language: str
+    ) -> VideoProcessData:
+        if self.error is not None:
+            raise self.error
+        return VideoProcessData(
+            video_url=video_url,
+            video_title="Job Video",
+            processed_at="2024-01-01T12:00:00Z",
+            results=VideoProcessResults(summary="Summary text"),
+            metadata=VideoProcessMetadata(
+                processing_time=1.0,
+                language=output_language,
+                styles_processed=styles or ["Summary"],
+            ),
+        )
+
+
+def wait_for_job(store: FakeJobStore, job_id: uuid.UUID) -> VideoJob:
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        job = store.jobs[job_id]
+        if job.status in {"succeeded", "failed"}:
+            return job
+        time.sleep(0.01)
+    raise AssertionError("Video job did not finish in time.")
+
+
+def make_request() -> VideoProcessRequest:
+    return VideoProcessRequest(video_url="https://youtu.be/abc123", styles=["Summary"])
+
+
+def test_runner_records_successful_result() -> None:
+    store = FakeJobStore()
+    runner = VideoJobRunner(store, lambda: FakeService(), max_workers=1)
+    try:
+        job = runner.submit(make_request())
+        finished = wait_for_job(store, job.id)
+    finally:
+        runner.shutdown()
+
+    data = to_job_data(finished)
+    assert data.state == "succeeded"
+    assert data.result is not None
+    assert data.result.results.summary == "Summary text"
+
+
+def test_runner_records_error_code_from_service_exception() -> None:
+    store = FakeJobStore()
+    service = FakeService(error=ExternalServiceError("Upstream failed."))
+    runner = VideoJobRunner(store, lambda: service, max_workers=1)
+    try:
+        job = runner.submit(make_request())
+        finished = wait_for_job(store, job.id)
+    finally:
+        runner.shutdown()
+
+    assert finished.status == "failed"
+    assert finished.error == "Upstream failed."
+    assert finished.error_code == 502
+
+
+def test_runner_hides_unexpected_error_details() -> None:
+    store = FakeJobStore()
+    service = FakeService(error=RuntimeError("secret stack detail"))
+    runner = VideoJobRunner(store, lambda: service, max_workers=1)
+    try:
+        job = runner.submit(make_request())
+        finished = wait_for_job(store, job.id)
+    finally:
+        runner.shutdown()
+
+    assert finished.error == "Video processing failed."
+    assert finished.error_code == 500
+
+
+def test_runner_resumes_pending_jobs() -> None:
+    store = FakeJobStore()
+    job = store.create(make_request())
+    runner = VideoJobRunner(store, lambda: FakeService(), max_workers=1)
+    try:
+        assert runner.resume_pending() == 1
+        assert wait_for_job(store, job.id).status == "succeeded"
+    finally:
+        runner.shutdown()
+
+
+def test_runner_resumes_stale_running_jobs() -> None:
+    store = FakeJobStore()
+    stale = store.create(make_request())
+    store.claim(stale.id)
+    stale.started_at = get_datetime_utc() - timedelta(hours=2)
+    recent = store.create(make_request())
+    store.claim(recent.id)
+    runner = VideoJobRunner(
+        store, lambda: FakeService(), max_workers=1, stale_after_seconds=3600
+    )
+    try:
+        assert runner.resume_pending() == 1
+        assert wait_for_job(store, stale.id).status == "succeeded"
+    finally:
+        runner.shutdown()
+
+    assert store.jobs[recent.id].status == "running"
+
+
+def test_database_job_store_claims_job_once(db: Session | None) -> None:
+    if db is None:
+        pytest.skip("DB setup disabled via SKIP_DB_TEST_SETUP")
+    store = DatabaseJobStore(engine)
+    job = store.create(make_request())
+    try:
+        assert job.id in store.pending_ids()
+        claimed = store.claim(job.id)
+        assert claimed is not None
+        assert claimed.status == "running"
+        assert store.claim(job.id) is None
+
+        store.fail(job.id, "Upstream failed.", 502)
+        stored = store.get(job.id)
+        assert stored is not None
+        assert stored.status == "failed"
+        assert stored.error_code == 502
+        assert stored.finished_at is not None
+    finally:
+        db.execute(delete(VideoJob).where(col(VideoJob.id) == job.id))
+        db.commit()
+
+
+def test_database_job_store_requeues_stale_running_jobs(db: Session | None) -> None:
+    if db is None:
+        pytest.skip("DB setup disabled via SKIP_DB_TEST_SETUP")
+    store = DatabaseJobStore(engine)
+    job = store.create(make_request())
+    try:
+        store.claim(job.id)
+        store.requeue_stale(get_datetime_utc() - timedelta(hours=1))
+        running = store.get(job.id)
+        store.requeue_stale(get_datetime_utc() + timedelta(seconds=1))
+        requeued = store.get(job.id)
+
+        assert running is not None
+        assert running.status == "running"
+        assert requeued is not None
+        assert requeued.status == "pending"
+        assert requeued.started_at is None
+        assert store.claim(job.id) is not None
+    finally:
+        db.execute(delete(VideoJob).where(col(VideoJob.id) == job.id))
+        db.commit()
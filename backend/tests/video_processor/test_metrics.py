@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.video_processor.exceptions import VideoValidationError
+from app.video_processor.service import VideoProcessingService
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_process_video_observes_each_stage() -> None:
+    stages = [
+        "validate",
+        "cache_lookup",
+        "probe_languages",
+        "resolve_styles",
+        "fetch_transcript",
+        "engine",
+        "build_response",
+    ]
+    before = {
+        stage: sample("video_stage_seconds_count", stage=stage) for stage in stages
+    }
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(), transcript_fetcher=FakeTranscriptFetcher()
+    )
+
+    service.process_video(
+        video_url="https://www.youtube.com/watch?v=abc123",
+        styles=["Summary"],
+        output_language="English",
+    )
+
+    for stage in stages:
+        assert sample("video_stage_seconds_count", stage=stage) == before[stage] + 1
+    assert sample("video_requests_in_flight", priority="interactive") == 0
+
+
+def test_process_video_counts_errors_by_class() -> None:
+    before = sample("video_errors_total", error="VideoValidationError")
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(), transcript_fetcher=FakeTranscriptFetcher()
+    )
+
+    with pytest.raises(VideoValidationError):
+        service.process_video(
+            video_url="https://example.com/video",
+            styles=["Summary"],
+            output_language="English",
+        )
+
+    assert sample("video_errors_total", error="VideoValidationError") == before + 1
+
+
+WORKER = """
+from app.video_processor.metrics import ERRORS, IN_FLIGHT
+ERRORS.labels("ExternalServiceError").inc()
+IN_FLIGHT.labels("bulk").inc()
+"""
+
+RENDER = """
+import sys
+from app.video_processor.metrics import render_metrics
+sys.stdout.write(render_metrics()[0].decode())
+"""
+
+
+def test_metrics_are_summed_across_worker_processes(tmp_path) -> None:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+
+    def run(code: str) -> str:
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    run(WORKER)
+    run(WORKER)
+    body = run(RENDER)
+
+    assert 'video_errors_total{error="ExternalServiceError"} 2.0' in body
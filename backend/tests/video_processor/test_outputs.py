@@ -0,0 +1,80 @@
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from getoutvideo import ProcessingResult, VideoTranscript
+from getoutvideo.config import ProcessingConfig
+
+from app.video_processor.outputs import DirectoryOutputSink, MemoryOutputSink
+from tests.utils.video import FakeVideoApi
+
+
+def _transcripts() -> list[VideoTranscript]:
+    return [
+        VideoTranscript(
+            title="Sink Video",
+            url="https://youtu.be/sink",
+            transcript_text="Hello world",
+            source="youtube_api",
+        )
+    ]
+
+
+def _run(
+    api: FakeVideoApi, styles: list[str]
+) -> Callable[[str], list[ProcessingResult]]:
+    config = ProcessingConfig(styles=styles, output_language="English")
+    return lambda output_dir: api.process_with_ai(_transcripts(), output_dir, config)
+
+
+def test_memory_sink_collects_outputs_without_files() -> None:
+    outputs = MemoryOutputSink().collect(
+        _run(FakeVideoApi(), ["Summary", "Educational"])
+    )
+
+    assert [(output.style, output.title) for output in outputs] == [
+        ("Summary", "Sink Video"),
+        ("Educational", "Sink Video"),
+    ]
+    assert outputs[0].text.startswith("# Sink Video")
+    assert outputs[0].text.endswith("Summary in English")
+    assert not os.path.exists(os.path.join(tempfile.gettempdir(), "getoutvideo-memory"))
+
+
+def test_memory_sink_leaves_other_threads_writing_files(tmp_path: Path) -> None:
+    sink = MemoryOutputSink()
+    api = FakeVideoApi()
+    written: list[str] = []
+
+    def write_files() -> None:
+        results = _run(api, ["Narrative Rewriting"])(str(tmp_path))
+        written.extend(result.output_file_path for result in results)
+
+    def collect_in_memory(output_dir: str) -> list[ProcessingResult]:
+        writer = threading.Thread(target=write_files)
+        writer.start()
+        writer.join()
+        return _run(api, ["Summary"])(output_dir)
+
+    outputs = sink.collect(collect_in_memory)
+
+    assert [output.style for output in outputs] == ["Summary"]
+    assert (
+        Path(written[0])
+        .read_text(encoding="utf-8")
+        .endswith("Narrative Rewriting in English")
+    )
+
+
+def test_directory_sink_reads_outputs_from_results(tmp_path: Path) -> None:
+    outputs = DirectoryOutputSink(str(tmp_path)).collect(
+        _run(FakeVideoApi(), ["Q&A Generation"])
+    )
+
+    assert [(output.style, output.title) for output in outputs] == [
+        ("Q&A Generation", "Sink Video")
+    ]
+    assert outputs[0].text.endswith("Q&A Generation in English")
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,114 @@
+import uuid
+
+import pytest
+from sqlalchemy import delete
+
+from app.core.db import engine
+from app.models import RateLimitBucket
+from app.video_processor.ratelimit import (
+    Bucket,
+    DatabaseBucketStore,
+    LocalBucketStore,
+    RateLimiter,
+)
+from app.video_processor.service import VideoProcessingService
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_rate_limiter_paces_sustained_load_at_the_limit() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(
+        LocalBucketStore(clock=clock),
+        requests_per_minute=60,
+        tokens_per_minute=0,
+        sleep=clock.sleep,
+    )
+
+    for _ in range(90):
+        limiter.acquire(requests=1, tokens=500)
+
+    # The first minute's budget is spent at once, then one call per second.
+    assert clock.sleeps == pytest.approx([1.0] * 30)
+    assert clock.now == pytest.approx(30.0)
+
+
+def test_rate_limiter_waits_for_the_scarcer_budget() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(
+        LocalBucketStore(clock=clock),
+        requests_per_minute=600,
+        tokens_per_minute=6000,
+        sleep=clock.sleep,
+    )
+
+    assert limiter.acquire(requests=1, tokens=6000) == 0.0
+    # 3000 tokens of debt refill at 100 per second.
+    assert limiter.acquire(requests=1, tokens=3000) == pytest.approx(30.0)
+    # Never charged more than a full bucket: a minute to pay off.
+    assert limiter.acquire(requests=1, tokens=10**9) == pytest.approx(60.0)
+
+
+def test_rate_limiter_proceeds_when_the_store_fails() -> None:
+    class BrokenStore:
+        def take(self, costs: list[tuple[Bucket, float]]) -> float:
+            raise ConnectionError("database is down")
+
+    clock = FakeClock()
+    limiter = RateLimiter(BrokenStore(), 60, 1000, sleep=clock.sleep)
+
+    assert limiter.acquire(requests=1, tokens=10) == 0.0
+    assert clock.sleeps == []
+
+
+def test_database_bucket_store_shares_budget_between_stores() -> None:
+    bucket = Bucket(name=f"test:{uuid.uuid4().hex[:16]}", capacity=2, per_second=0.5)
+    first, second = DatabaseBucketStore(engine), DatabaseBucketStore(engine)
+    try:
+        assert first.take([(bucket, 2)]) == 0.0
+        # The other worker sees the spent budget: 1 token of debt at 0.5/s.
+        assert second.take([(bucket, 1)]) == pytest.approx(2.0, abs=0.1)
+    finally:
+        with engine.begin() as connection:
+            connection.execute(
+                delete(RateLimitBucket).where(RateLimitBucket.name == bucket.name)
+            )
+
+
+def test_process_video_reserves_budget_per_style() -> None:
+    class RecordingLimiter(RateLimiter):
+        def __init__(self) -> None:
+            super().__init__(LocalBucketStore(), 0, 0)
+            self.calls: list[tuple[int, int]] = []
+
+        def acquire(self, requests: int, tokens: int, cancel=None) -> float:
+            self.calls.append((requests, tokens))
+            return 0.0
+
+    limiter = RecordingLimiter()
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(),
+        transcript_fetcher=FakeTranscriptFetcher(),
+        rate_limiter=limiter,
+    )
+
+    service.process_video(
+        video_url="https://youtu.be/abc123",
+        styles=["Summary", "Educational"],
+        output_language="English",
+    )
+
+    assert [requests for requests, _tokens in limiter.calls] == [1, 1]
+    assert all(tokens > 2000 for _requests, tokens in limiter.calls)
@@ -0,0 +1,158 @@
+import threading
+import time
+
+from app.video_processor.scheduler import (
+    BULK,
+    INTERACTIVE,
+    PriorityClass,
+    PriorityScheduler,
+)
+from app.video_processor.service import VideoProcessingService
+from app.video_processor.singleflight import SingleFlight
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+
+def make_scheduler(capacity: int, bulk_max_concurrency: int = 4) -> PriorityScheduler:
+    return PriorityScheduler(
+        [
+            PriorityClass(INTERACTIVE, weight=2, max_concurrency=8),
+            PriorityClass(BULK, weight=1, max_concurrency=bulk_max_concurrency),
+        ],
+        capacity=capacity,
+    )
+
+
+def wait_until(condition) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def enqueue(
+    scheduler: PriorityScheduler, priority: str, order: list[str]
+) -> threading.Thread:
+    queued = scheduler.snapshot()[priority].queued
+
+    def run() -> None:
+        with scheduler.slot(priority):
+            order.append(priority)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    wait_until(lambda: scheduler.snapshot()[priority].queued == queued + 1)
+    return thread
+
+
+def test_scheduler_shares_slots_by_weight() -> None:
+    scheduler = make_scheduler(capacity=1)
+    order: list[str] = []
+    release = threading.Event()
+
+    def hold() -> None:
+        with scheduler.slot(INTERACTIVE):
+            release.wait()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    wait_until(lambda: scheduler.snapshot()[INTERACTIVE].running == 1)
+    threads = [enqueue(scheduler, INTERACTIVE, order) for _ in range(4)]
+    threads += [enqueue(scheduler, BULK, order) for _ in range(2)]
+
+    release.set()
+    for thread in [holder, *threads]:
+        thread.join()
+
+    assert order == [INTERACTIVE, BULK, INTERACTIVE, INTERACTIVE, BULK, INTERACTIVE]
+    stats = scheduler.snapshot()
+    assert (stats[INTERACTIVE].admitted, stats[BULK].admitted) == (5, 2)
+    assert stats[BULK].queued == 0
+    assert stats[BULK].wait_seconds_max > 0
+
+
+def test_scheduler_caps_concurrency_per_class() -> None:
+    scheduler = make_scheduler(capacity=4, bulk_max_concurrency=1)
+    release = threading.Event()
+
+    def hold(priority: str) -> None:
+        with scheduler.slot(priority):
+            release.wait()
+
+    threads = [threading.Thread(target=hold, args=(BULK,)) for _ in range(2)]
+    threads.append(threading.Thread(target=hold, args=(INTERACTIVE,)))
+    for thread in threads:
+        thread.start()
+
+    wait_until(lambda: scheduler.snapshot()[INTERACTIVE].running == 1)
+    wait_until(lambda: scheduler.snapshot()[BULK].queued == 1)
+    assert scheduler.snapshot()[BULK].running == 1
+
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert scheduler.snapshot()[BULK].admitted == 2
+
+
+def test_process_video_holds_a_slot_of_its_priority() -> None:
+    class CountingScheduler(PriorityScheduler):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            self.slots: list[str] = []
+
+        def slot(self, priority: str, cancel=None):
+            self.slots.append(priority)
+            return super().slot(priority, cancel)
+
+    scheduler = CountingScheduler(
+        [PriorityClass(BULK, weight=1, max_concurrency=1)], capacity=1
+    )
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(),
+        transcript_fetcher=FakeTranscriptFetcher(),
+        scheduler=scheduler,
+        priority=BULK,
+    )
+
+    data = service.process_video(
+        video_url="https://youtu.be/abc123",
+        styles=["Summary"],
+        output_language="English",
+    )
+
+    assert data.results.summary.endswith("Summary in English")
+    assert scheduler.slots == [BULK]
+    assert scheduler.snapshot()[BULK].running == 0
+
+
+def test_coalesced_requests_do_not_hold_slots() -> None:
+    scheduler = make_scheduler(capacity=2)
+    flight: SingleFlight[tuple[dict[str, str], str]] = SingleFlight()
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(style_delay=0.5),
+        transcript_fetcher=FakeTranscriptFetcher(),
+        single_flight=flight,
+        scheduler=scheduler,
+    )
+    elapsed: dict[str, float] = {}
+
+    def request(video_id: str) -> None:
+        started = time.monotonic()
+        service.process_video(
+            video_url=f"https://youtu.be/{video_id}",
+            styles=["Summary"],
+            output_language="English",
+        )
+        elapsed.setdefault(video_id, time.monotonic() - started)
+
+    popular = [threading.Thread(target=request, args=("popular",)) for _ in range(3)]
+    for thread in popular:
+        thread.start()
+        time.sleep(0.05)
+    unrelated = threading.Thread(target=request, args=("unrelated",))
+    unrelated.start()
+    for thread in [*popular, unrelated]:
+        thread.join()
+
+    # Only the popular video's leader holds a slot, so the other one is free.
+    assert elapsed["unrelated"] < 0.75
+    assert scheduler.snapshot()[INTERACTIVE].admitted == 2
@@ -1,11 +1,19 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 
+from app.core.config import settings
+from app.video_processor.cache import TTLCache
+from app.video_processor.chunking import split_into_segments
 from app.video_processor.service import (
     VideoProcessingService,
     _choose_language_priority,
     _extract_video_id,
 )
 from app.video_processor.exceptions import VideoValidationError
+from app.video_processor.styles import StyleCatalog
+from app.video_processor.transcripts import TranscriptProbe
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
 
 
 def test_extract_video_id_supports_youtube_variants() -> None:
@@ -34,35 +42,30 @@ def test_choose_language_priority_prefers_chinese_then_english() -> None:
     assert _choose_language_priority([]) is None
 
 
-def test_configure_transcript_language_preferences_sets_priority(monkeypatch) -> None:
-    service = VideoProcessingService()
-    transcript_config = SimpleNamespace(transcript_languages=None)
-    api = SimpleNamespace(config=SimpleNamespace(transcript_config=transcript_config))
-
-    monkeypatch.setattr(
-        "app.video_processor.service._fetch_available_transcript_languages",
-        lambda _video_id: ["en", "zh", "ja"],
-    )
+def test_process_video_fetches_preferred_transcript_once() -> None:
+    api = FakeVideoApi()
+    fetcher = FakeTranscriptFetcher(languages=["en", "zh", "ja"])
+    service = VideoProcessingService(api_client=api, transcript_fetcher=fetcher)
 
-    service._configure_transcript_language_preferences(
-        api, "https://www.youtube.com/watch?v=abc123"
+    data = service.process_video(
+        video_url="https://www.youtube.com/watch?v=abc123",
+        styles=["Summary"],
+        output_language="English",
     )
 
-    assert transcript_config.transcript_languages == ["zh", "en", "ja"]
+    assert fetcher.probe_calls == 1
+    assert fetcher.fetch_calls == [["zh", "en", "ja"]]
+    assert data.video_title == "Fake Video"
+    assert data.results.summary.endswith("Summary in English")
 
 
-def test_process_video_returns_400_when_no_subtitles(monkeypatch) -> None:
+def test_process_video_returns_400_when_no_subtitles() -> None:
     transcript_config = SimpleNamespace(transcript_languages=None)
-    fake_api = SimpleNamespace(config=SimpleNamespace(transcript_config=transcript_config))
-    service = VideoProcessingService(api_client=fake_api)
-
-    monkeypatch.setattr(
-        "app.video_processor.service._fetch_available_transcript_languages",
-        lambda _video_id: [],
+    fake_api = SimpleNamespace(
+        config=SimpleNamespace(transcript_config=transcript_config)
     )
-    monkeypatch.setattr(
-        "app.video_processor.service._ensure_youtube_transcript_api_compat",
-        lambda: None,
+    service = VideoProcessingService(
+        api_client=fake_api, transcript_fetcher=FakeTranscriptFetcher(languages=[])
     )
 
     try:
@@ -75,3 +78,182 @@ def test_process_video_returns_400_when_no_subtitles(monkeypatch) -> None:
         assert str(exc) == "No subtitles found for this video."
     else:  # pragma: no cover - defensive
         raise AssertionError("Expected VideoValidationError when no subtitles exist.")
+
+
+def test_process_video_runs_styles_concurrently() -> None:
+    api = FakeVideoApi(style_delay=0.3)
+    fetcher = FakeTranscriptFetcher(title="Parallel")
+    styles = ["Summary", "Educational", "Balanced", "QA Generation", "Narrative"]
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        service = VideoProcessingService(
+            api_client=api, style_executor=executor, transcript_fetcher=fetcher
+        )
+        started = time.monotonic()
+        data = service.process_video(
+            video_url="https://www.youtube.com/watch?v=parallel",
+            styles=styles,
+            output_language="French",
+        )
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert len(fetcher.fetch_calls) == 1
+    assert sorted(api.style_calls) == sorted(
+        [
+            "Summary",
+            "Educational",
+            "Balanced and Detailed",
+            "Q&A Generation",
+            "Narrative Rewriting",
+        ]
+    )
+    assert api.config.processing_config.styles == ["Summary"]
+    assert data.results.summary.endswith("Summary in French")
+    assert data.results.narrative.endswith("Narrative Rewriting in French")
+
+
+def test_probe_transcripts_caches_missing_subtitles() -> None:
+    class FlakyFetcher(FakeTranscriptFetcher):
+        def probe(self, video_id: str) -> TranscriptProbe | None:
+            probe = super().probe(video_id)
+            # A failed probe is not cached, so the next request probes again.
+            return None if self.probe_calls == 1 else probe
+
+    fetcher = FlakyFetcher(languages=[])
+    service = VideoProcessingService(
+        api_client=FakeVideoApi(),
+        language_cache=TTLCache(max_entries=8),
+        transcript_fetcher=fetcher,
+    )
+
+    assert service._probe_transcripts("abc123") is None
+    assert service._probe_transcripts("abc123") == TranscriptProbe(languages=[])
+    assert service._probe_transcripts("abc123") == TranscriptProbe(languages=[])
+    assert fetcher.probe_calls == 2
+
+
+def test_process_video_resolves_styles_from_catalog() -> None:
+    class NoStylesApi(FakeVideoApi):
+        def get_available_styles(self) -> list[str]:
+            raise AssertionError("the catalog should be used instead")
+
+    service = VideoProcessingService(
+        api_client=NoStylesApi(),
+        transcript_fetcher=FakeTranscriptFetcher(),
+        style_catalog=StyleCatalog(["Summary", "Educational"]),
+    )
+
+    data = service.process_video(
+        video_url="https://youtu.be/abc123",
+        styles=None,
+        output_language="English",
+    )
+    assert data.metadata.styles_processed == ["Summary", "Educational"]
+
+    try:
+        service.process_video(
+            video_url="https://youtu.be/abc123",
+            styles=["Narrative"],
+            output_language="English",
+        )
+    except VideoValidationError as exc:
+        assert str(exc) == "Styles not supported by the API: Narrative Rewriting."
+    else:  # pragma: no cover - defensive
+        raise AssertionError("Expected VideoValidationError for unsupported styles.")
+
+
+def test_process_video_condenses_long_transcripts(monkeypatch) -> None:
+    class RecordingApi(FakeVideoApi):
+        def __init__(self) -> None:
+            super().__init__()
+            self.inputs: list[str] = []
+
+        def process_with_ai(self, transcripts, output_dir, config=None):
+            with self._lock:
+                self.inputs.append(transcripts[0].transcript_text)
+            return super().process_with_ai(transcripts, output_dir, config)
+
+    monkeypatch.setattr(settings, "VIDEO_CHUNK_MAX_TOKENS", 40)
+    api = RecordingApi()
+    text = " ".join(f"word{index}" for index in range(100))
+    fetcher = FakeTranscriptFetcher(text=text)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        service = VideoProcessingService(
+            api_client=api, style_executor=executor, transcript_fetcher=fetcher
+        )
+        data = service.process_video(
+            video_url="https://youtu.be/longtalk",
+            styles=["Summary"],
+            output_language="English",
+        )
+
+    segments = split_into_segments(text, 40)
+    assert len(segments) > 1
+    assert len(api.inputs) == len(segments) + 1
+    assert sorted(api.inputs[:-1]) == sorted(segments)
+    assert api.inputs[-1] == "\n\n".join(["Summary in English"] * len(segments))
+    assert data.results.summary.endswith("Summary in English")
+    assert len(fetcher.fetch_calls) == 1
+
+
+def test_failed_segment_drops_only_its_style(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "VIDEO_CHUNK_MAX_TOKENS", 40)
+    text = " ".join(f"word{index}" for index in range(100))
+    failing_segment = split_into_segments(text, 40)[1]
+
+    class FailingSegmentApi(FakeVideoApi):
+        def process_with_ai(self, transcripts, output_dir, config=None):
+            styles = (config or self.config.processing_config).styles
+            segment = transcripts[0].transcript_text
+            if styles == ["Summary"] and segment == failing_segment:
+                return []
+            return super().process_with_ai(transcripts, output_dir, config)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        service = VideoProcessingService(
+            api_client=FailingSegmentApi(),
+            style_executor=executor,
+            transcript_fetcher=FakeTranscriptFetcher(text=text),
+        )
+        data = service.process_video(
+            video_url="https://youtu.be/longtalk",
+            styles=["Summary", "Educational"],
+            output_language="English",
+        )
+
+    assert data.results.summary is None
+    assert data.results.educational.endswith("Educational in English")
+
+
+def test_process_video_reports_timings_when_asked() -> None:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        service = VideoProcessingService(
+            api_client=FakeVideoApi(),
+            style_executor=executor,
+            language_cache=TTLCache(max_entries=8),
+            transcript_fetcher=FakeTranscriptFetcher(),
+        )
+
+        def process(include_timings: bool):
+            return service.process_video(
+                video_url="https://www.youtube.com/watch?v=abc123",
+                styles=["Summary", "Balanced"],
+                output_language="English",
+                include_timings=include_timings,
+            )
+
+        first = process(True).metadata.timings
+        second = process(True).metadata.timings
+        untimed = process(False).metadata.timings
+
+    assert first is not None and second is not None
+    assert {"validate", "probe_languages", "engine", "build_response"} <= set(
+        first.stages_ms
+    )
+    # Styles run on the executor's threads and are still attributed.
+    assert set(first.styles_ms) == {"Summary", "Balanced"}
+    assert first.cache_hits == {"languages": False}
+    assert second.cache_hits == {"languages": True}
+    assert untimed is None
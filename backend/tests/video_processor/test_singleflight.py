@@ -0,0 +1,178 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.db import engine
+from app.video_processor.cancellation import CancelToken
+from app.video_processor.exceptions import DeadlineExceededError
+from app.video_processor.service import VideoProcessingService
+from app.video_processor.singleflight import (
+    AdvisoryLock,
+    SingleFlight,
+    _advisory_lock_id,
+)
+from tests.utils.video import FakeTranscriptFetcher, FakeVideoApi
+
+
+def test_single_flight_coalesces_concurrent_calls() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def work() -> int:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(timeout=5)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(flight.do, "key", work)
+        started.wait(timeout=5)
+        followers = [pool.submit(flight.do, "key", work) for _ in range(3)]
+        time.sleep(0.05)
+        release.set()
+        outcomes = [leader.result()] + [future.result() for future in followers]
+
+    assert calls == 1
+    assert outcomes[0] == (42, False)
+    assert all(outcome == (42, True) for outcome in outcomes[1:])
+
+
+def test_single_flight_shares_exceptions_and_forgets_key() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+
+    def fail() -> int:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", fail)
+    assert flight.do("key", lambda: 7) == (7, False)
+
+
+def test_cancelled_follower_stops_waiting_for_the_leader() -> None:
+    api = FakeVideoApi(style_delay=1.0)
+    flight: SingleFlight[tuple[dict[str, str], str]] = SingleFlight()
+    service = VideoProcessingService(
+        api_client=api,
+        single_flight=flight,
+        transcript_fetcher=FakeTranscriptFetcher(),
+    )
+
+    def request(cancel: CancelToken | None = None) -> str | None:
+        data = service.process_video(
+            video_url="https://www.youtube.com/watch?v=viral",
+            styles=["Summary"],
+            output_language="English",
+            cancel=cancel,
+        )
+        return data.results.summary
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(request)
+        time.sleep(0.1)
+        started = time.monotonic()
+        follower = pool.submit(request, CancelToken(timeout=0.1))
+        with pytest.raises(DeadlineExceededError):
+            follower.result()
+        waited = time.monotonic() - started
+        assert not leader.done()
+        assert leader.result().endswith("Summary in English")
+
+    assert waited < 0.5
+    assert api.style_calls == ["Summary"]
+
+
+def test_process_video_runs_engine_once_for_concurrent_requests() -> None:
+    api = FakeVideoApi(style_delay=0.2)
+    fetcher = FakeTranscriptFetcher(title="Viral Video")
+    flight: SingleFlight[tuple[dict[str, str], str]] = SingleFlight()
+
+    def request() -> str | None:
+        service = VideoProcessingService(
+            api_client=api, single_flight=flight, transcript_fetcher=fetcher
+        )
+        data = service.process_video(
+            video_url="https://www.youtube.com/watch?v=viral",
+            styles=["Summary"],
+            output_language="English",
+        )
+        return data.results.summary
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        summaries = list(pool.map(lambda _: request(), range(8)))
+
+    assert len(fetcher.fetch_calls) == 1
+    assert api.style_calls == ["Summary"]
+    assert len(summaries) == 8
+    assert all(summary.endswith("Summary in English") for summary in summaries)
+
+
+def test_advisory_lock_excludes_other_sessions(db: Session | None) -> None:
+    if db is None:
+        pytest.skip("DB setup disabled via SKIP_DB_TEST_SETUP")
+    lock = AdvisoryLock(engine)
+    lock_id = _advisory_lock_id("video:locked:English")
+    probe = text("SELECT pg_try_advisory_lock(:lock_id)")
+    release = text("SELECT pg_advisory_unlock(:lock_id)")
+
+    with lock.hold("video:locked:English"):
+        with engine.connect() as connection:
+            assert connection.execute(probe, {"lock_id": lock_id}).scalar() is False
+
+    with engine.connect() as connection:
+        assert connection.execute(probe, {"lock_id": lock_id}).scalar() is True
+        connection.execute(release, {"lock_id": lock_id})
+
+
+def test_advisory_lock_lets_other_styles_of_a_video_run(db: Session | None) -> None:
+    if db is None:
+        pytest.skip("DB setup disabled via SKIP_DB_TEST_SETUP")
+    api = FakeVideoApi(style_delay=0.5)
+    lock = AdvisoryLock(engine)
+
+    def request(style: str) -> str | None:
+        service = VideoProcessingService(
+            api_client=api,
+            process_lock=lock,
+            transcript_fetcher=FakeTranscriptFetcher(),
+        )
+        data = service.process_video(
+            video_url="https://www.youtube.com/watch?v=styles",
+            styles=[style],
+            output_language="English",
+        )
+        return data.results.summary or data.results.educational
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        outputs = list(pool.map(request, ["Summary", "Educational"]))
+    elapsed = time.perf_counter() - started
+
+    assert sorted(api.style_calls) == ["Educational", "Summary"]
+    assert all(outputs)
+    # Serialized behind one lock, the two would take twice the style delay.
+    assert elapsed < 0.9
+
+
+def test_advisory_lock_wait_ends_when_cancelled(db: Session | None) -> None:
+    if db is None:
+        pytest.skip("DB setup disabled via SKIP_DB_TEST_SETUP")
+    lock = AdvisoryLock(engine)
+    waiter = CancelToken(timeout=0.3)
+
+    with lock.hold("video:cancelled:English"):
+        started = time.perf_counter()
+        with pytest.raises(DeadlineExceededError):
+            with lock.hold("video:cancelled:English", waiter):
+                pass
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.6
+    with lock.hold("video:cancelled:English", CancelToken(timeout=1)):
+        pass
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+from youtube_transcript_api import NoTranscriptFound
+
+from app.video_processor.exceptions import ExternalServiceError, VideoValidationError
+from app.video_processor.transcripts import TranscriptProbe, YouTubeTranscriptFetcher
+
+
+class FakeTranscript:
+    def __init__(self, language_code: str, lines: list[str]) -> None:
+        self.language_code = language_code
+        self.lines = lines
+        self.fetches = 0
+
+    def fetch(self) -> list[SimpleNamespace]:
+        self.fetches += 1
+        return [SimpleNamespace(text=line) for line in self.lines]
+
+
+class FakeListing:
+    def __init__(self, transcripts: list[FakeTranscript]) -> None:
+        self.transcripts = transcripts
+
+    def __iter__(self):
+        return iter(self.transcripts)
+
+    def find_transcript(self, language_codes: list[str]) -> FakeTranscript:
+        for code in language_codes:
+            for transcript in self.transcripts:
+                if transcript.language_code == code:
+                    return transcript
+        raise NoTranscriptFound("abc123", language_codes, self)
+
+
+def test_fetch_reuses_probe_listing_and_prefers_first_language() -> None:
+    english = FakeTranscript("en", ["Hello", "world"])
+    chinese = FakeTranscript("zh", ["你好", "世界"])
+    probe = TranscriptProbe(
+        languages=["en", "zh"], listing=FakeListing([english, chinese])
+    )
+
+    fetched = YouTubeTranscriptFetcher().fetch("abc123", ["zh", "en"], probe)
+
+    assert fetched.language == "zh"
+    assert fetched.text == "你好 世界"
+    assert (chinese.fetches, english.fetches) == (1, 0)
+
+
+def test_fetch_maps_missing_and_failing_transcripts() -> None:
+    fetcher = YouTubeTranscriptFetcher()
+    listing = FakeListing([FakeTranscript("en", ["Hello"])])
+
+    with pytest.raises(VideoValidationError):
+        fetcher.fetch("abc123", ["fr"], TranscriptProbe(["en"], listing=listing))
+
+    class BrokenTranscript(FakeTranscript):
+        def fetch(self) -> list[SimpleNamespace]:
+            raise ConnectionError("connection reset")
+
+    broken = BrokenTranscript("en", [])
+    with pytest.raises(ExternalServiceError):
+        fetcher.fetch(
+            "abc123", ["en"], TranscriptProbe(["en"], listing=FakeListing([broken]))
+        )